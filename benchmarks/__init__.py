@@ -0,0 +1,5 @@
+"""성능 측정용 로컬 스탠드인 서버와 벤치마크 스크립트 모음.
+
+실제 SRT 사이트(etk.srail.co.kr)에 트래픽을 보내지 않고 속도 개선 효과를
+측정하기 위한 도구들이다.
+"""
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+전체 예약 사이클 벤치마크
+
+로컬 스탠드인 서버를 띄우고 실제 Chrome으로 login → go_search →
+_check_result_once 사이클을 반복 실행하여 단계별 p50/p95 지연을 보고합니다.
+페이지 준비 대기(_wait_for_page)에 실제로 쓴 시간을 따로 집계해, 예전 고정
+sleep 대비 사이클당 절약한 시간도 함께 출력합니다.
+실제 SRT 사이트에는 요청을 보내지 않습니다.
+
+사용 예:
+    python -m benchmarks.bench_cycle --cycles 20 --latency 0.05
+    python -m benchmarks.bench_cycle --cycles 5 --headless false --json
+    python -m benchmarks.bench_cycle --times 08,10,12 --in-page-search false
+    python -m benchmarks.bench_cycle --session-cache true
+    python -m benchmarks.bench_cycle --lean compare   # 경량 로드 모드 전후 전송량·로드 시간 비교
+"""
+import argparse
+import json
+import logging
+import tempfile
+from datetime import timedelta
+from time import perf_counter
+
+from benchmarks.standin_server import STATIC_ASSETS, StandinServer
+from benchmarks.stats import format_table, summarize
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from srt_reservation.cache import SessionCookieCache
+from srt_reservation.lean import TAKE_LOADS_JS, PageLoadStats
+from srt_reservation.main import SRT
+from srt_reservation.util import str_to_bool
+
+# DOM 조건 대기로 바꾸기 전 한 사이클에 들어가던 고정 sleep(초):
+# 로그인 확인 전 2.0 (run) + 조회 버튼 클릭 후 1.0 (go_search, 조건마다)
+LEGACY_LOGIN_WAIT = 2.0
+LEGACY_SEARCH_WAIT = 1.0
+LEGACY_FIXED_WAIT_PER_CYCLE = LEGACY_LOGIN_WAIT + LEGACY_SEARCH_WAIT
+
+# 페이지 로드 기록(srt_reservation.lean)을 probe 없이 바로 읽는 스크립트
+_TAKE_LOADS_SCRIPT = "return (function () {" + TAKE_LOADS_JS + "    return loads;\n})();"
+
+
+def _track_page_waits(srt, waited: list):
+    """srt._wait_for_page 호출 소요시간을 waited 에 누적하도록 감싼다."""
+    original = srt._wait_for_page
+
+    def timed(*args, **kwargs):
+        started = perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            waited[0] += perf_counter() - started
+
+    srt._wait_for_page = timed
+
+
+def _take_page_loads(srt) -> None:
+    """현재 페이지의 load 를 기다린 뒤 쌓인 페이지 로드 기록을 srt.page_loads 에 더한다."""
+    try:
+        WebDriverWait(srt.driver, 5).until(lambda d: d.execute_script("return document.readyState") == "complete")
+    except TimeoutException:
+        pass
+    srt.page_loads.add(srt.driver.execute_script(_TAKE_LOADS_SCRIPT))
+
+
+def run_cycles(srt, cycles: int, dpt_dt: str, dpt_tm: str, restore_session: bool = False) -> dict:
+    """SRT 인스턴스로 사이클을 반복 실행하고 단계별 소요시간(초)을 수집한다.
+
+    dpt_tm 이 쉼표 구분 다중값이면 사이클마다 시간 조건을 check_result 와 같은 순서로
+    확인한다. go_search 는 실제 조회 1회당, check_result_once 는 조건 1개당 샘플을 남기고,
+    SearchPlanner 가 생략한 조회 수는 queries_saved 에 사이클별로 남긴다.
+    restore_session 이면 쿠키를 지운 새 브라우저 상태에서 저장된 세션 복원을 먼저
+    시도한다 (재시작/브라우저 복구 경로). login 샘플은 복원 또는 로그인 소요시간이다.
+    srt.page_loads 가 있으면 사이클별 페이지 load 시간 합계(page_load)와 전송 바이트(_page_bytes)도
+    남긴다. load 가 늦게 끝난 페이지는 다음 사이클에 집계된다.
+    """
+    conditions = [{"dpt_dt": dpt_dt, "dpt_tm": tm} for tm in srt._normalize_to_list(dpt_tm)]
+    samples = {"login": [], "go_search": [], "check_result_once": [], "cycle": [], "page_wait": [],
+               "queries_saved": []}
+    if srt.page_loads is not None:
+        samples.update(page_load=[], _page_bytes=[])
+    waited = [0.0]
+    _track_page_waits(srt, waited)
+    for _ in range(cycles):
+        # 매 사이클 실제 로그인을 거치도록 세션 쿠키 제거
+        srt.driver.delete_all_cookies()
+        waited[0] = 0.0
+
+        started = perf_counter()
+        if not (restore_session and srt.restore_session()):
+            srt.login()
+            if not srt.confirm_login():
+                raise RuntimeError("스탠드인 서버 로그인 확인 실패")
+        logged_in = perf_counter()
+
+        checked = logged_in
+        srt.planner.start_rotation()
+        for condition in conditions:
+            covered = srt.planner.covered_page(condition)
+            if covered is None:
+                srt.go_search(dpt_dt=condition["dpt_dt"], dpt_tm=condition["dpt_tm"])
+                searched = perf_counter()
+                samples["go_search"].append(searched - checked)
+            else:
+                searched = checked
+
+            srt._check_result_once(covered)
+            checked = perf_counter()
+            samples["check_result_once"].append(checked - searched)
+
+        samples["login"].append(logged_in - started)
+        samples["cycle"].append(checked - started)
+        samples["page_wait"].append(waited[0])
+        samples["queries_saved"].append(srt.planner.saved)
+        if srt.page_loads is not None:
+            srt.page_loads.start_rotation()
+            _take_page_loads(srt)
+            samples["page_load"].append(srt.page_loads.load_ms / 1000)
+            samples["_page_bytes"].append(srt.page_loads.bytes)
+    return samples
+
+
+def seconds_saved_per_cycle(samples: dict) -> float:
+    """예전 고정 sleep 합계 대비 사이클당 평균 절약 시간(초)"""
+    waits = samples.get("page_wait") or [0.0]
+    searches = len(samples.get("go_search") or ()) // len(waits) or 1
+    # 생략된 조회는 예전에는 조회마다 고정 대기를 치렀다
+    searches += sum(samples.get("queries_saved") or ()) // len(waits)
+    legacy = LEGACY_LOGIN_WAIT + LEGACY_SEARCH_WAIT * searches
+    return legacy - sum(waits) / len(waits)
+
+
+def lean_savings(full: dict, lean: dict) -> dict:
+    """전체 로드 / 경량 로드 두 번의 run_benchmark 결과로 사이클당 절약량 계산"""
+    def per_cycle(samples, key):
+        values = samples.get(key) or [0.0]
+        return sum(values) / len(values)
+
+    return {
+        "bytes_saved_per_cycle": per_cycle(full, "_page_bytes") - per_cycle(lean, "_page_bytes"),
+        "load_seconds_saved_per_cycle": per_cycle(full, "page_load") - per_cycle(lean, "page_load"),
+        "asset_requests_saved": full["_asset_hits"] - lean["_asset_hits"],
+    }
+
+
+def run_benchmark(cycles=10, latency=0.0, anti_bot="enhanced", headless=True, num_trains=2, available=(),
+                  times="08", in_page_search=True, session_cache=False, lean=None):
+    """스탠드인 서버를 띄워 벤치마크를 실행하고 단계별 측정값을 반환한다.
+
+    lean 이 None 이면 페이지 로드를 집계하지 않고, True/False 면 경량 모드 여부와 함께 집계한다.
+    """
+    with StandinServer(latency=latency) as server:
+        server.state.available = set(available)
+        dpt_dt = (server.state.today + timedelta(days=7)).strftime("%Y%m%d")
+        dpt_tm = times
+
+        srt = SRT("수서", "부산", dpt_dt, dpt_tm, num_trains, False, anti_bot,
+                  use_profile=False, headless=headless, base_url=server.url,
+                  in_page_search=in_page_search, lean_loading=bool(lean))
+        if lean is not None:
+            srt.page_loads = PageLoadStats()  # 전체 로드 기준값도 같은 방식으로 집계
+        srt.set_log_info("0000000000", "benchmark")
+        srt.run_driver()
+        with tempfile.TemporaryDirectory() as cache_path:
+            # 실제 계정 캐시(.cache/)와 섞이지 않도록 임시 디렉토리 사용
+            srt.session_cache = SessionCookieCache("0000000000", server.url, directory=cache_path)
+            try:
+                samples = run_cycles(srt, cycles, dpt_dt, dpt_tm, restore_session=session_cache)
+            finally:
+                srt.close_driver()
+        samples["_hits"] = dict(server.state.hits)
+        samples["_asset_hits"] = sum(n for path, n in server.state.hits.items() if path in STATIC_ASSETS)
+        samples["_search_counts"] = dict(srt.search_counts)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SRT 사이클 벤치마크 (로컬 스탠드인 서버)")
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="스탠드인 HTML 응답 지연(초)")
+    parser.add_argument("--anti-bot", default="enhanced", choices=["undetected", "stealth", "enhanced"])
+    parser.add_argument("--headless", type=str_to_bool, default=True)
+    parser.add_argument("--num", type=int, default=2, help="확인할 기차 수")
+    parser.add_argument("--available", default="", help="예약 가능 열차 번호, 쉼표 구분")
+    parser.add_argument("--times", default="08", help="출발 시간 조건, 쉼표 구분 ex) 08,10,12")
+    parser.add_argument("--in-page-search", type=str_to_bool, default=True, help="결과 페이지 내 조건 전환 사용")
+    parser.add_argument("--session-cache", type=str_to_bool, default=False,
+                        help="사이클마다 저장된 세션 쿠키 복원으로 로그인 생략 시도")
+    parser.add_argument("--lean", default=None, choices=["false", "true", "compare"],
+                        help="경량 로드 모드 (전송량·로드 시간 집계). compare 면 전체 로드와 번갈아 비교")
+    parser.add_argument("--json", action="store_true", help="요약을 JSON으로 출력")
+    args = parser.parse_args()
+
+    logging.getLogger("srt").setLevel(logging.WARNING)
+    options = dict(
+        cycles=args.cycles,
+        latency=args.latency,
+        anti_bot=args.anti_bot,
+        headless=args.headless,
+        num_trains=args.num,
+        available=[t for t in args.available.split(",") if t],
+        times=args.times,
+        in_page_search=args.in_page_search,
+        session_cache=args.session_cache,
+    )
+    savings = None
+    if args.lean == "compare":
+        full = run_benchmark(lean=False, **options)
+        samples = run_benchmark(lean=True, **options)
+        savings = lean_savings(full, samples)
+    else:
+        samples = run_benchmark(lean=None if args.lean is None else args.lean == "true", **options)
+    hits = samples.pop("_hits")
+    samples.pop("_asset_hits")
+    page_bytes = samples.pop("_page_bytes", None)
+    search_counts = samples.pop("_search_counts")
+    saved = seconds_saved_per_cycle(samples)
+    queries_saved = samples.pop("queries_saved")
+    queries_saved_per_cycle = sum(queries_saved) / len(queries_saved) if queries_saved else 0.0
+    if args.json:
+        summary = {name: summarize(values) for name, values in samples.items()}
+        summary["seconds_saved_per_cycle"] = saved
+        summary["search_counts"] = search_counts
+        summary["queries_saved_per_cycle"] = queries_saved_per_cycle
+        if page_bytes is not None:
+            summary["page_bytes"] = summarize(page_bytes)
+        if savings is not None:
+            summary["lean_savings"] = savings
+        print(json.dumps(summary, indent=2))
+    else:
+        print(format_table(samples))
+        print(f"\n스탠드인 요청 수: {sum(hits.values())} ({len(hits)}개 경로)")
+        print(f"조회 경로: 페이지 내 전환 {search_counts.get('in_page', 0)}회, 전체 이동 {search_counts.get('full', 0)}회")
+        print(f"조건 병합으로 생략한 조회: 사이클당 {queries_saved_per_cycle:.1f}회")
+        print(f"예전 고정 대기 대비 사이클당 절약: {saved:.2f}초")
+        if page_bytes:
+            print(f"페이지 로드 전송량: 사이클당 {sum(page_bytes) / len(page_bytes) / 1024:.1f}KB")
+        if savings is not None:
+            print(f"경량 로드 모드 절약: 사이클당 {savings['bytes_saved_per_cycle'] / 1024:.1f}KB, "
+                  f"로드 {savings['load_seconds_saved_per_cycle'] * 1000:.0f}ms, "
+                  f"정적 리소스 요청 {savings['asset_requests_saved']}회")
+
+
+if __name__ == "__main__":
+    main()
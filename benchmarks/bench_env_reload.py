@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+TelegramNotifier.is_configured() .env 재로딩 마이크로 벤치마크
+
+예전 방식(호출마다 경로 계산 + exists() + dotenv import + 전체 파싱)과
+EnvFileLoader(inode/mtime/size 가 바뀐 경우에만 파싱)의 호출당 비용을 비교합니다.
+임시 디렉토리의 .env 를 사용하므로 프로젝트 .env 는 건드리지 않습니다.
+
+사용 예:
+    python -m benchmarks.bench_env_reload --calls 2000 --lines 30
+"""
+import argparse
+import json
+import os
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from benchmarks.stats import format_table
+from srt_reservation.notifier import EnvFileLoader
+
+
+def _legacy_reload(env_path: Path) -> None:
+    """변경 전 TelegramNotifier._reload_env 의 .env 처리"""
+    env_path = Path(str(env_path)).resolve()
+    if env_path.exists():
+        from dotenv import load_dotenv
+        load_dotenv(env_path, override=False)
+
+
+def _time_calls(fn, calls: int) -> list:
+    samples = []
+    for _ in range(calls):
+        start = perf_counter()
+        fn()
+        samples.append(perf_counter() - start)
+    return samples
+
+
+def run_benchmark(calls=2000, lines=30):
+    """호출당 소요시간 표본을 {방식: [초, ...]} 로 반환한다."""
+    keys = [f"SRT_BENCH_ENV_{i}" for i in range(lines)]
+    with tempfile.TemporaryDirectory() as tmp:
+        env_path = Path(tmp) / ".env"
+        env_path.write_text("".join(f"{key}=value-{i}\n" for i, key in enumerate(keys)), encoding="utf-8")
+        try:
+            loader = EnvFileLoader(env_path)
+            return {
+                "legacy_reload": _time_calls(lambda: _legacy_reload(env_path), calls),
+                "mtime_gated": _time_calls(loader.refresh, calls),
+            }
+        finally:
+            for key in keys:
+                os.environ.pop(key, None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=".env 재로딩 마이크로 벤치마크")
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--lines", type=int, default=30, help=".env 줄 수")
+    parser.add_argument("--json", action="store_true", help="요약을 JSON으로 출력")
+    args = parser.parse_args()
+
+    samples = run_benchmark(calls=args.calls, lines=args.lines)
+    legacy = sum(samples["legacy_reload"]) / len(samples["legacy_reload"])
+    gated = sum(samples["mtime_gated"]) / len(samples["mtime_gated"])
+    if args.json:
+        print(json.dumps({"legacy_us": legacy * 1e6, "gated_us": gated * 1e6, "speedup": legacy / gated}, indent=2))
+    else:
+        print(format_table(samples, unit="us", scale=1e6))
+        print(f"\n호출당 평균: {legacy * 1e6:.1f}us → {gated * 1e6:.1f}us ({legacy / gated:.0f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+사이클당 로깅 오버헤드 벤치마크
+
+go_search / check_result / refresh_result 가 한 사이클(조건 N개)에 남기는 INFO 로그를
+그대로 흉내 내어, setup_logger 동기 모드와 비동기(QueueHandler/QueueListener) 모드에서
+예약 스레드가 로그 호출에 쓰는 시간을 비교합니다. 로그는 임시 디렉토리의 logs/ 에
+쓰고 콘솔 출력은 /dev/null 로 보냅니다.
+
+사용 예:
+    python -m benchmarks.bench_logging --cycles 500 --conditions 3
+"""
+import argparse
+import contextlib
+import json
+import logging
+import os
+import tempfile
+from time import perf_counter
+
+from benchmarks.stats import format_table
+from srt_reservation.logger import setup_logger, shutdown_logger
+
+
+def _log_cycle(logger: logging.Logger, conditions: int, cycle: int) -> None:
+    """조건 N개짜리 한 사이클의 INFO 로그 (go_search 5줄 + 날짜 선택 + 검색 조건 + 새로고침)"""
+    for i in range(conditions):
+        search_tm = f"{8 + 2 * i:02d}"
+        logger.info("검색 조건: 날짜=20260315, 시간=%s", search_tm)
+        logger.info("날짜 선택 성공: 20260315")
+        logger.info("기차를 조회합니다")
+        logger.info("출발역: 수서, 도착역: 부산")
+        logger.info("날짜: 20260315, 시간: %s시 이후", search_tm)
+        logger.info("2개의 기차 중 예약 확인")
+        logger.info("예약 대기 사용: False")
+        logger.info("새로고침 %d회", cycle * conditions + i)
+
+
+def _measure(async_logging: bool, cycles: int, conditions: int) -> dict:
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stderr(devnull):
+        logger = setup_logger("INFO", async_logging=async_logging)
+        samples = []
+        for cycle in range(cycles):
+            start = perf_counter()
+            _log_cycle(logger, conditions, cycle)
+            samples.append(perf_counter() - start)
+        start = perf_counter()
+        shutdown_logger()
+        drain = perf_counter() - start
+        for handler in logger.handlers:
+            handler.close()
+        logger.handlers = []
+    return {"per_cycle": samples, "drain": drain}
+
+
+def run_benchmark(cycles=500, conditions=3):
+    """{모드: {"per_cycle": [초, ...], "drain": 종료 시 큐 비우기(초)}}"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            return {
+                "sync": _measure(False, cycles, conditions),
+                "async": _measure(True, cycles, conditions),
+            }
+        finally:
+            os.chdir(cwd)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사이클당 로깅 오버헤드 벤치마크")
+    parser.add_argument("--cycles", type=int, default=500)
+    parser.add_argument("--conditions", type=int, default=3, help="사이클당 검색 조건 수")
+    parser.add_argument("--json", action="store_true", help="요약을 JSON으로 출력")
+    args = parser.parse_args()
+
+    results = run_benchmark(cycles=args.cycles, conditions=args.conditions)
+    means = {mode: sum(r["per_cycle"]) / len(r["per_cycle"]) for mode, r in results.items()}
+    if args.json:
+        print(json.dumps({
+            mode: {"per_cycle_us": means[mode] * 1e6, "drain_ms": r["drain"] * 1e3}
+            for mode, r in results.items()
+        }, indent=2))
+    else:
+        print(format_table({f"{mode}_per_cycle": r["per_cycle"] for mode, r in results.items()},
+                           unit="us", scale=1e6))
+        print(f"\n예약 스레드의 사이클당 로깅 시간: {means['sync'] * 1e6:.0f}us → {means['async'] * 1e6:.0f}us")
+        print(f"비동기 종료 시 큐 비우기: {results['async']['drain'] * 1e3:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+녹화 페이지 replay 벤치마크
+
+--record-pages 로 모은 코퍼스(기본: tests/fixtures/pages)를 ReplayDriver 로 SRT 에 흘려
+페이지 판정과 예약 판단의 지연을 페이지마다 측정합니다. Chrome·네트워크 없이 돌기 때문에
+수천 개의 실제 페이지 모양으로 파싱/판단 경로의 속도 변화를 비교할 수 있습니다.
+
+페이지 스크립트는 ReplayDriver 의 파이썬 구현으로 실행되므로, 수치는 브라우저 안의 JS
+시간이 아니라 SRT 쪽 파싱·판단 비용과 WebDriver 명령 수를 비교하는 용도입니다.
+문서 파싱(driver.load)은 브라우저 몫이라 측정에서 뺍니다.
+
+측정 항목:
+    detect_blocked_page  모든 페이지에서 _detect_blocked_page (차단 페이지는 예외까지)
+    post_search_probe    검색 직후 kind(results/block/login/error) 페이지에서 _probe_after_search
+    check_result_once    결과 페이지에서 스냅샷부터 예약/예약대기 판단까지 (클릭 후 예약 확인 /
+                         잔여석 없음 페이지를 번갈아 보여 줌)
+    probe_and_decide     check_result 의 실제 경로: probe → 스냅샷 보관 → _check_result_once(page)
+
+사용 예:
+    python -m benchmarks.bench_replay
+    python -m benchmarks.bench_replay --corpus fixtures/pages --repeat 50 --json
+"""
+import argparse
+import json
+import logging
+from itertools import cycle
+from pathlib import Path
+from time import perf_counter
+
+from benchmarks.replay import ReplayDriver, fixture_url, load_corpus, open_fixture, replay_srt
+from benchmarks.stats import format_table, summarize
+from srt_reservation.exceptions import BlockedByServerError
+from srt_reservation.main import SRT
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "pages"
+
+
+def _follow_pages(corpus):
+    """예약 클릭 후 보여 줄 페이지를 예약 확인 / 잔여석 없음 순으로 돌려 가며 제공"""
+    pages = [(fixture["html"], fixture_url(fixture))
+             for kind in ("booking", "sold_out") for fixture in corpus.get(kind, ())]
+    return cycle(pages) if pages else cycle([None])
+
+
+def run_replay(corpus: dict, repeat: int = 20, num_trains: int = 2, want_reserve: bool = True) -> dict:
+    """코퍼스 전체를 repeat 번 replay 하며 항목별 소요시간(초)을 수집한다.
+
+    _commands 에는 결과 페이지 1개를 판단하는 데 쓴 WebDriver 명령 수(probe_and_decide 기준)를 남긴다.
+    """
+    driver = ReplayDriver()
+    srt = replay_srt(driver, num_trains_to_check=num_trains, want_reserve=want_reserve)
+    follow = _follow_pages(corpus)
+    samples = {"detect_blocked_page": [], "post_search_probe": [], "check_result_once": [],
+               "probe_and_decide": []}
+    commands = []
+    everything = [fixture for fixtures in corpus.values() for fixture in fixtures]
+    searched = [fixture for kind in SRT._PROBE_KINDS for fixture in corpus.get(kind, ())]
+    results = corpus.get("results", [])
+
+    def page_follow():
+        page = next(follow)
+        return {7: page} if page else None
+
+    for _ in range(repeat):
+        for fixture in everything:
+            open_fixture(srt, fixture)
+            started = perf_counter()
+            try:
+                srt._detect_blocked_page()
+            except BlockedByServerError:
+                pass
+            samples["detect_blocked_page"].append(perf_counter() - started)
+
+        for fixture in searched:
+            open_fixture(srt, fixture)
+            started = perf_counter()
+            srt._probe_after_search()
+            samples["post_search_probe"].append(perf_counter() - started)
+
+        for fixture in results:
+            open_fixture(srt, fixture, page_follow())
+            started = perf_counter()
+            srt._check_result_once()
+            samples["check_result_once"].append(perf_counter() - started)
+
+            open_fixture(srt, fixture, page_follow())
+            driver.commands.clear()
+            started = perf_counter()
+            probe = srt._probe_after_search()
+            page = srt._store_snapshot(probe["rows"])
+            srt.planner.record(page)
+            srt._check_result_once(page)
+            samples["probe_and_decide"].append(perf_counter() - started)
+            commands.append(sum(driver.commands.values()))
+
+    samples["_commands"] = commands
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화 페이지 replay 벤치마크 (Chrome·네트워크 없음)")
+    parser.add_argument("--corpus", default=str(DEFAULT_CORPUS), help="코퍼스 디렉토리 (<kind>/*.html)")
+    parser.add_argument("--repeat", type=int, default=20, help="코퍼스 반복 횟수")
+    parser.add_argument("--num", type=int, default=2, help="확인할 기차 수")
+    parser.add_argument("--json", action="store_true", help="요약을 JSON으로 출력")
+    args = parser.parse_args()
+
+    logging.getLogger("srt").setLevel(logging.CRITICAL)
+    corpus = load_corpus(args.corpus)
+    samples = run_replay(corpus, repeat=args.repeat, num_trains=args.num)
+    commands = samples.pop("_commands")
+    per_decision = sum(commands) / len(commands) if commands else 0.0
+    pages = {kind: len(fixtures) for kind, fixtures in corpus.items() if fixtures}
+    if args.json:
+        summary = {name: summarize(values) for name, values in samples.items()}
+        summary["pages"] = pages
+        summary["commands_per_decision"] = per_decision
+        print(json.dumps(summary, indent=2))
+    else:
+        print(format_table(samples))
+        print(f"\n코퍼스: {', '.join(f'{kind} {n}' for kind, n in pages.items())}")
+        print(f"결과 페이지 1개 판단당 WebDriver 명령: {per_decision:.1f}회")
+
+
+if __name__ == "__main__":
+    main()
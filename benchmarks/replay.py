@@ -0,0 +1,604 @@
+# -*- coding: utf-8 -*-
+"""
+녹화 페이지 replay 드라이버
+
+PageRecorder 가 저장한 HTML 코퍼스(--record-pages)를 Chrome·네트워크 없이 SRT 에
+다시 흘려 보내기 위한 가짜 WebDriver 입니다. 표준 라이브러리 html.parser 로 DOM 을
+만들고, SRT 가 보내는 페이지 스크립트(_POST_SEARCH_PROBE_SCRIPT, _RESULT_TABLE_SCRIPT,
+_BLOCK_PROBE_SCRIPT 등)는 같은 판정을 하는 파이썬 구현으로 대신 실행합니다.
+_check_result_once / book_ticket / reserve_ticket / _detect_blocked_page 의 파싱·판단
+지연을 수천 개의 실제 페이지 모양으로 측정하고, 속도 개선의 회귀를 확인하는 용도입니다.
+
+예약 링크를 클릭하면 load(..., follow={7: 예약 결과 페이지, 8: 예약대기 결과 페이지})
+로 지정한 페이지로 이동합니다 (칸 번호는 결과 표 기준, 지정하지 않으면 빈 페이지).
+페이지 목록을 주면 같은 칸을 클릭할 때마다 차례로 엽니다 (잔여석 없음 후 다른 열차 예약 등).
+
+사용 예:
+    python -m benchmarks.replay --seed tests/fixtures/pages   # 스탠드인 페이지로 기본 코퍼스 생성
+    python -m benchmarks.replay fixtures/pages                # 녹화 kind 와 replay 판정 비교
+"""
+import argparse
+import re
+import sys
+from collections import Counter
+from datetime import date
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    JavascriptException,
+    NoAlertPresentException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+from benchmarks import standin_server as standin
+from srt_reservation.main import SRT
+from srt_reservation.recorder import PAGE_KINDS, PageRecorder, read_fixture
+from srt_reservation.recovery import SessionRecovery
+
+REPLAY_ORIGIN = "https://etk.srail.kr"
+BLANK_PAGE = ("<html><head></head><body></body></html>", "about:blank")
+
+_VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr",
+})
+_TIME = re.compile(r"\d{1,2}:\d{2}")
+_REQUEST_ID = re.compile(r"요청\s*ID\s*[:：]?\s*([A-Za-z0-9_-]+)")
+
+
+# ---------------------------------------------------------------------------
+# 최소 DOM
+# ---------------------------------------------------------------------------
+
+class Node:
+    """요소 노드. contents 는 텍스트(str)와 자식 요소가 섞인 목록, children 은 요소만."""
+
+    __slots__ = ("tag", "attrs", "parent", "contents", "children")
+
+    def __init__(self, tag: str, attrs=(), parent: Optional["Node"] = None):
+        self.tag = tag
+        self.attrs = {name: value or "" for name, value in attrs}
+        self.parent = parent
+        self.contents: list = []
+        self.children: List["Node"] = []
+
+    def append(self, node: "Node") -> None:
+        self.contents.append(node)
+        self.children.append(node)
+
+    @property
+    def classes(self) -> List[str]:
+        return self.attrs.get("class", "").split()
+
+    def text(self) -> str:
+        """innerText 근사 (br 은 줄바꿈)"""
+        parts = []
+        for item in self.contents:
+            if isinstance(item, str):
+                parts.append(item)
+            elif item.tag == "br":
+                parts.append("\n")
+            else:
+                parts.append(item.text())
+        return "".join(parts)
+
+    def iter(self):
+        """자손 요소를 문서 순서로"""
+        for child in self.children:
+            yield child
+            yield from child.iter()
+
+    def find(self, predicate) -> Optional["Node"]:
+        return next((node for node in self.iter() if predicate(node)), None)
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#document")
+        self._stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, attrs, self._stack[-1])
+        self._stack[-1].append(node)
+        if tag not in _VOID_TAGS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self._stack[-1].append(Node(tag, attrs, self._stack[-1]))
+
+    def handle_endtag(self, tag):
+        # 닫히지 않은 요소는 맞는 시작 태그까지 함께 닫는다
+        for i in range(len(self._stack) - 1, 0, -1):
+            if self._stack[i].tag == tag:
+                del self._stack[i:]
+                return
+
+    def handle_data(self, data):
+        if self._stack[-1].tag not in ("script", "style"):
+            self._stack[-1].contents.append(data)
+
+
+def parse_html(html: str) -> Node:
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+# CSS 선택자: 태그, #id, .class, :nth-child(n) 복합 선택자와 '>' / 공백 결합자만 지원
+_COMPOUND = re.compile(r"([a-zA-Z][\w-]*|\*)?((?:#[\w-]+|\.[\w-]+|:nth-child\(\d+\))*)$")
+_SIMPLE = re.compile(r"#([\w-]+)|\.([\w-]+)|:nth-child\((\d+)\)")
+_XPATH_ATTR = re.compile(r"^//([a-zA-Z][\w-]*|\*)\[@([\w-]+)=['\"]([^'\"]*)['\"]\]$")
+
+
+def _compile_compound(text: str):
+    match = _COMPOUND.match(text)
+    if not match or not text:
+        raise InvalidSelectorException(f"replay 에서 지원하지 않는 선택자: {text!r}")
+    tag = match.group(1) if match.group(1) not in (None, "*") else None
+    ids, classes, nth = [], [], None
+    for id_, cls, n in _SIMPLE.findall(match.group(2)):
+        if id_:
+            ids.append(id_)
+        elif cls:
+            classes.append(cls)
+        else:
+            nth = int(n)
+    return tag, ids, classes, nth
+
+
+def _matches(node: Node, compound) -> bool:
+    tag, ids, classes, nth = compound
+    if tag is not None and node.tag != tag:
+        return False
+    if any(node.attrs.get("id") != id_ for id_ in ids):
+        return False
+    if classes and not set(classes) <= set(node.classes):
+        return False
+    if nth is not None:
+        siblings = node.parent.children if node.parent else [node]
+        if siblings.index(node) + 1 != nth:
+            return False
+    return True
+
+
+def compile_selector(selector: str):
+    """CSS 선택자 → [(결합자, 복합 선택자)] (첫 항목의 결합자는 None)"""
+    parts, combinator = [], None
+    for token in re.findall(r">|[^\s>]+", selector):
+        if token == ">":
+            combinator = ">"
+            continue
+        parts.append((combinator if parts else None, _compile_compound(token)))
+        combinator = " "
+    if not parts:
+        raise InvalidSelectorException(f"빈 선택자: {selector!r}")
+    return parts
+
+
+def _match_chain(node: Node, parts, index: int) -> bool:
+    combinator, compound = parts[index]
+    if not _matches(node, compound):
+        return False
+    if index == 0:
+        return True
+    parent = node.parent
+    if combinator == ">":
+        return parent is not None and _match_chain(parent, parts, index - 1)
+    while parent is not None:
+        if _match_chain(parent, parts, index - 1):
+            return True
+        parent = parent.parent
+    return False
+
+
+def select(root: Node, selector: str) -> List[Node]:
+    """querySelectorAll"""
+    parts = compile_selector(selector)
+    last = len(parts) - 1
+    return [node for node in root.iter() if _match_chain(node, parts, last)]
+
+
+def _locator_predicate(by: str, value: str):
+    if by == By.ID:
+        return lambda node: node.attrs.get("id") == value
+    if by == By.NAME:
+        return lambda node: node.attrs.get("name") == value
+    if by == By.TAG_NAME:
+        return lambda node: node.tag == value
+    if by == By.CLASS_NAME:
+        return lambda node: value in node.classes
+    if by == By.XPATH:
+        match = _XPATH_ATTR.match(value)
+        if not match:
+            raise InvalidSelectorException(f"replay 에서 지원하지 않는 XPath: {value!r}")
+        tag, attr, expected = match.groups()
+        return lambda node: (tag == "*" or node.tag == tag) and node.attrs.get(attr) == expected
+    raise InvalidSelectorException(f"replay 에서 지원하지 않는 locator: {by}")
+
+
+# ---------------------------------------------------------------------------
+# WebDriver 대역
+# ---------------------------------------------------------------------------
+
+class ReplayElement:
+    """WebElement 대역. 문서가 바뀐 뒤 쓰면 StaleElementReferenceException."""
+
+    def __init__(self, driver: "ReplayDriver", node: Node):
+        self._driver = driver
+        self._node = node
+        self._generation = driver.generation
+
+    def _check(self) -> Node:
+        if self._generation != self._driver.generation:
+            raise StaleElementReferenceException("replay: 문서가 바뀌었습니다")
+        return self._node
+
+    def __eq__(self, other):
+        return isinstance(other, ReplayElement) and other._node is self._node
+
+    def __hash__(self):
+        return id(self._node)
+
+    @property
+    def tag_name(self) -> str:
+        return self._check().tag
+
+    @property
+    def text(self) -> str:
+        return self._check().text().strip()
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self._check().attrs.get(name)
+
+    def is_enabled(self) -> bool:
+        return "disabled" not in self._check().attrs
+
+    def is_displayed(self) -> bool:
+        return "display: none" not in self._check().attrs.get("style", "")
+
+    def click(self) -> None:
+        self._driver._click(self._check())
+
+    def send_keys(self, *keys) -> None:
+        if Keys.ENTER in keys:
+            self.click()
+
+    def find_element(self, by=By.ID, value=None) -> "ReplayElement":
+        return self._driver._find_one(self._check(), by, value)
+
+    def find_elements(self, by=By.ID, value=None) -> List["ReplayElement"]:
+        return self._driver._find_all(self._check(), by, value)
+
+
+class _SwitchTo:
+    @property
+    def alert(self):
+        raise NoAlertPresentException("replay: alert 없음")
+
+
+class ReplayDriver:
+    """녹화 HTML 을 WebDriver 처럼 제공하는 드라이버.
+
+    commands 에 WebDriver 명령 종류별 횟수를 센다 (실제 브라우저라면 왕복 1회씩).
+    """
+
+    _SCRIPTS = {
+        SRT._POST_SEARCH_PROBE_SCRIPT: "_post_search_probe",
+        SRT._RESULT_TABLE_SCRIPT: "_result_table",
+        SRT._BLOCK_PROBE_SCRIPT: "_block_probe",
+        SRT._RESULTS_READY_SCRIPT: "_results_ready",
+        SRT._SESSION_PROBE_SCRIPT: "_session_probe",
+        SessionRecovery._SESSION_STATE_SCRIPT: "_session_state",
+        "return document.readyState": "_ready_state",
+        "arguments[0].click();": "_click_argument",
+    }
+
+    def __init__(self, html: str = BLANK_PAGE[0], url: str = BLANK_PAGE[1], follow=None):
+        self.commands: Counter = Counter()
+        self.generation = 0
+        self.switch_to = _SwitchTo()
+        self._history: List[Tuple[str, str, dict]] = []
+        self.load(html, url, follow)
+
+    def load(self, html: str, url: str, follow: Optional[Dict[int, Any]] = None) -> None:
+        """새 문서를 연다 (이전 문서의 요소는 stale). follow: {결과 표 칸 번호: (html, url) 또는 그 목록}"""
+        self._history.clear()
+        self._open(html, url, follow or {})
+
+    def _open(self, html: str, url: str, follow: dict) -> None:
+        self._html = html
+        self.current_url = url
+        self._follow = follow
+        self.document = parse_html(html)
+        self.body = self.document.find(lambda node: node.tag == "body") or self.document
+        self.generation += 1
+
+    # -- WebDriver API ------------------------------------------------------
+
+    @property
+    def page_source(self) -> str:
+        self.commands["page_source"] += 1
+        return self._html
+
+    @property
+    def title(self) -> str:
+        node = self.document.find(lambda node: node.tag == "title")
+        return node.text().strip() if node else ""
+
+    def get(self, url: str) -> None:
+        raise NotImplementedError("replay 드라이버는 네트워크 이동을 하지 않습니다")
+
+    def back(self) -> None:
+        self.commands["back"] += 1
+        if self._history:
+            self._open(*self._history.pop())
+
+    def get_cookies(self) -> list:
+        return []
+
+    def find_element(self, by=By.ID, value=None) -> ReplayElement:
+        return self._find_one(self.document, by, value)
+
+    def find_elements(self, by=By.ID, value=None) -> List[ReplayElement]:
+        return self._find_all(self.document, by, value)
+
+    def execute_script(self, script: str, *args):
+        self.commands["execute_script"] += 1
+        handler = self._SCRIPTS.get(script)
+        if handler is None:
+            raise JavascriptException(f"replay 에서 지원하지 않는 스크립트: {script.strip()[:60]!r}")
+        return getattr(self, handler)(*args)
+
+    def quit(self) -> None:
+        pass
+
+    # -- 내부 ---------------------------------------------------------------
+
+    def _find_all(self, scope: Node, by, value) -> List[ReplayElement]:
+        self.commands["find_element"] += 1
+        if by == By.CSS_SELECTOR:
+            nodes = select(scope, value)
+        else:
+            predicate = _locator_predicate(by, value)
+            nodes = [node for node in scope.iter() if predicate(node)]
+        return [ReplayElement(self, node) for node in nodes]
+
+    def _find_one(self, scope: Node, by, value) -> ReplayElement:
+        found = self._find_all(scope, by, value)
+        if not found:
+            raise NoSuchElementException(f"replay: {by}={value!r} 없음")
+        return found[0]
+
+    def _click(self, node: Node) -> None:
+        self.commands["click"] += 1
+        if node.tag == "input" and node.attrs.get("value") == "조회하기":
+            # 새로고침: 같은 결과 페이지를 다시 연다
+            self._open(self._html, self.current_url, self._follow)
+            return
+        cell = node
+        while cell is not None and cell.tag != "td":
+            cell = cell.parent
+        if cell is None:
+            return
+        column = cell.parent.children.index(cell) + 1
+        target = self._follow.get(column, BLANK_PAGE)
+        if isinstance(target, list):
+            target = target.pop(0) if target else BLANK_PAGE
+        html, url = target
+        self._history.append((self._html, self.current_url, self._follow))
+        self._open(html, url, {})
+
+    def _body_text(self) -> str:
+        return self.body.text()
+
+    def _block_match(self):
+        text = self._body_text()
+        matched = [sig for sig in SRT._BLOCK_SIGNATURES if sig in text]
+        blocked = len(matched) >= SRT._BLOCK_MIN_MATCHES
+        request_id = None
+        if blocked:
+            match = _REQUEST_ID.search(text)
+            request_id = match.group(1) if match else None
+        return matched, blocked, request_id
+
+    def _block_probe(self):
+        matched, _, request_id = self._block_match()
+        return {"matched": matched, "request_id": request_id}
+
+    def _is_login_page(self) -> bool:
+        path = self.current_url.split("://", 1)[-1].partition("/")[2]
+        return (re.search(r"login|member", path.split("?")[0], re.I) is not None
+                or self.document.find(lambda node: node.attrs.get("id") == "srchDvNm01") is not None)
+
+    def _has(self, element_id: str) -> bool:
+        return self.document.find(lambda node: node.attrs.get("id") == element_id) is not None
+
+    def _post_search_probe(self, row_selector):
+        matched, blocked, request_id = self._block_match()
+        url = self.current_url
+        if blocked:
+            return {"kind": "block", "url": url, "matched": matched, "request_id": request_id}
+        if self._is_login_page():
+            return {"kind": "login", "url": url, "matched": matched}
+        if not self._has("result-form"):
+            return {"kind": "error", "url": url, "matched": matched}
+        return {"kind": "results", "url": url, "rows": self._result_table(row_selector), "matched": matched}
+
+    def _result_table(self, row_selector):
+        def text_of(cells, i):
+            return cells[i].text().strip() if i < len(cells) else ""
+
+        def time_of(cells, i):
+            match = _TIME.search(text_of(cells, i))
+            return match.group(0) if match else ""
+
+        def seat_of(cells, i):
+            if i >= len(cells):
+                return {"text": "", "has_link": False, "link": None}
+            anchor = cells[i].find(lambda node: node.tag == "a")
+            return {
+                "text": text_of(cells, i),
+                "has_link": anchor is not None,
+                "link": ReplayElement(self, anchor) if anchor is not None else None,
+            }
+
+        out = []
+        for index, row in enumerate(select(self.document, row_selector), start=1):
+            cells = row.children
+            out.append({
+                "index": index,
+                "train_no": text_of(cells, 2),
+                "dpt_time": time_of(cells, 3),
+                "arr_time": time_of(cells, 4),
+                "special": seat_of(cells, 5),
+                "standard": seat_of(cells, 6),
+                "waitlist": seat_of(cells, 7),
+            })
+        return out
+
+    def _results_ready(self):
+        return self._has("result-form") or not self._has("dptDt")
+
+    def _session_probe(self, selector):
+        menu = select(self.document, selector)
+        return bool(menu) and "환영합니다" in menu[0].text()
+
+    def _session_state(self):
+        return {"url": self.current_url, "login_form": self._has("srchDvNm01")}
+
+    @staticmethod
+    def _ready_state():
+        return "complete"
+
+    @staticmethod
+    def _click_argument(element):
+        element.click()
+
+
+# ---------------------------------------------------------------------------
+# 코퍼스
+# ---------------------------------------------------------------------------
+
+class _SilentNotifier:
+    """replay 중 차단 페이지를 만나도 알림을 보내지 않는다"""
+
+    @staticmethod
+    def is_configured() -> bool:
+        return False
+
+    def send_message(self, message: str) -> bool:
+        return False
+
+
+def fixture_url(fixture: dict) -> str:
+    return REPLAY_ORIGIN + fixture.get("path", "/")
+
+
+def load_corpus(directory) -> Dict[str, List[dict]]:
+    """<directory>/<kind>/*.html → {kind: [fixture, ...]} (fixture 는 read_fixture 결과 + file)"""
+    corpus: Dict[str, List[dict]] = {kind: [] for kind in PAGE_KINDS}
+    for path in sorted(Path(directory).glob("*/*.html")):
+        fixture = read_fixture(path)
+        fixture["file"] = str(path)
+        corpus.setdefault(fixture.get("kind") or path.parent.name, []).append(fixture)
+    return corpus
+
+
+def replay_srt(driver: ReplayDriver, num_trains_to_check: int = 2, want_reserve: bool = False,
+               dpt_dt: str = "20260315", dpt_tm: str = "08") -> SRT:
+    """replay 드라이버를 붙인 SRT (브라우저 실행·알림·세션 캐시 없음)"""
+    srt = SRT("수서", "부산", dpt_dt, dpt_tm, num_trains_to_check, want_reserve,
+              use_profile=False, headless=True, session_cache=False)
+    srt.driver = driver
+    srt.notifier = _SilentNotifier()
+    return srt
+
+
+def open_fixture(srt: SRT, fixture: dict, follow=None) -> None:
+    """fixture 를 현재 페이지로 열고 SRT 의 직전 검색 조건을 녹화 당시 조건으로 맞춘다"""
+    srt.driver.load(fixture["html"], fixture_url(fixture), follow)
+    srt._searched_condition = {
+        "dpt_dt": fixture.get("dpt_dt") or srt.dpt_dt,
+        "dpt_tm": fixture.get("dpt_tm") or srt.dpt_tm,
+    }
+    srt.is_booked = False
+
+
+def seed_corpus(directory) -> List[Path]:
+    """스탠드인 서버 페이지로 kind 별 기본 코퍼스를 만든다 (날짜 고정, 결과가 항상 같다)"""
+    recorder = PageRecorder(directory)
+    state = standin.StandinState(today=date(2026, 3, 8))
+    dpt_dt = "20260315"
+    url = f"{REPLAY_ORIGIN}{standin.SCHEDULE_PATH}"
+    pages = []
+
+    def results(hour, available=(), phantom=(), waitlist=(), page_size=10):
+        state.available, state.phantom, state.waitlist = set(available), set(phantom), set(waitlist)
+        state.page_size = page_size
+        params = {"dptRsStnCdNm": "수서", "arvRsStnCdNm": "부산", "dptDt": dpt_dt, "dptTm": f"{hour}0000"}
+        pages.append(("results", standin.render_results(state, params), url, {"dpt_dt": dpt_dt, "dpt_tm": hour}))
+
+    results("08")                                    # 전부 매진
+    results("08", available={"311"})                 # 두 번째 열차 예약 가능
+    results("10", phantom={"315"})                   # 예약하기가 보이지만 잔여석 없음
+    results("12", waitlist={"321", "323"})           # 예약대기만 가능
+    results("14", available={"329"}, waitlist={"327"})  # 첫 열차 예약대기, 둘째 예약 가능
+    results("20", page_size=3)                       # 막차 근처 (행 3개)
+    results("22")                                    # 22:30 이후 열차 없음 (행 1개)
+
+    pages += [
+        ("booking", standin.render_booking_confirmation("311"), REPLAY_ORIGIN + standin.BOOKING_PATH, None),
+        ("sold_out", standin.render_sold_out(), REPLAY_ORIGIN + standin.BOOKING_PATH, None),
+        ("block", standin.render_block_page(state), url, None),
+        ("login", standin.render_login_form(False), REPLAY_ORIGIN + standin.LOGIN_FORM_PATH, None),
+        ("error", standin.render_main(True), REPLAY_ORIGIN + standin.MAIN_PATH, None),
+    ]
+    saved = [recorder.record(kind, html, page_url, condition) for kind, html, page_url, condition in pages]
+    return [path for path in saved if path is not None]
+
+
+def classify(corpus: Dict[str, List[dict]]) -> Counter:
+    """검색 직후 kind(results/block/login/error) 로 녹화된 페이지를 replay 로 다시 판정.
+
+    Returns:
+        Counter: (녹화 kind, replay 판정 kind) 별 페이지 수
+    """
+    driver = ReplayDriver()
+    srt = replay_srt(driver)
+    outcome = Counter()
+    for kind in SRT._PROBE_KINDS:
+        for fixture in corpus.get(kind, ()):
+            open_fixture(srt, fixture)
+            probe = srt._probe_after_search()
+            outcome[(kind, probe["kind"] if probe else None)] += 1
+    return outcome
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="녹화 페이지 replay (기본 코퍼스 생성 / 판정 확인)")
+    parser.add_argument("corpus", help="코퍼스 디렉토리")
+    parser.add_argument("--seed", action="store_true", help="스탠드인 페이지로 기본 코퍼스를 만든다")
+    args = parser.parse_args(argv)
+
+    if args.seed:
+        for path in seed_corpus(args.corpus):
+            print(path)
+        return 0
+
+    mismatched = 0
+    for (recorded, replayed), count in sorted(classify(load_corpus(args.corpus)).items(), key=str):
+        flag = "" if recorded == replayed else "  ← 불일치"
+        mismatched += 0 if recorded == replayed else count
+        print(f"{recorded:<10}→ {replayed!s:<10}{count:>6}{flag}")
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
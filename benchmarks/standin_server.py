@@ -0,0 +1,439 @@
+# -*- coding: utf-8 -*-
+"""
+SRT 스탠드인 서버
+
+SRT 클래스가 조작하는 페이지(로그인 폼, 열차 조회, 예약 확인, 접속 제한 안내)를
+흉내 내는 로컬 HTTP 서버입니다. 실제 사이트에 요청을 보내지 않고 전체 사이클
+(login → go_search → _check_result_once)을 측정하기 위한 기준선으로 사용합니다.
+
+사용 예:
+    python -m benchmarks.standin_server --port 8080 --latency 0.05
+
+    SRT_BASE_URL=http://127.0.0.1:8080 python quickstart.py ...
+"""
+import argparse
+import html
+import secrets
+import threading
+import time
+from collections import Counter
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+LOGIN_FORM_PATH = "/cmc/01/selectLoginForm.do"
+LOGIN_SUBMIT_PATH = "/cmc/01/selectLoginInfo.do"
+MAIN_PATH = "/main/main.do"
+SCHEDULE_PATH = "/hpg/hra/01/selectScheduleList.do"
+BOOKING_PATH = "/hpg/hra/02/requestReservationInfo.do"
+WAITLIST_PATH = "/hpg/hra/02/requestWaitingReservation.do"
+
+SESSION_COOKIE = "JSESSIONID"
+
+# 실제 차단 페이지에서 캡쳐한 안내 문구 (tests/test_block_detection.py 와 동일)
+BLOCK_PAGE_TEXT = (
+    "해당 IP는 SRT 예약발매시스템에 비정상적인 접근이 감지되어, "
+    "시스템 보안을 위해 접속이 일시적으로 제한되었습니다. "
+    "매크로 프로그램 사용은 SR 영업정책에 따라 엄격히 금지되어 있으며, "
+    "향후 동일한 행위가 반복될 경우 회원 자격상실 및 이용제한이 될 수 있음을 안내드립니다."
+)
+
+# 페이지마다 붙는 정적 리소스 (이미지, 폰트, 배너, 분석 스크립트)
+STATIC_ASSETS = (
+    "/css/common.css",
+    "/js/analytics.js",
+    "/images/banner_main.png",
+    "/images/banner_event.jpg",
+    "/images/logo_srt.gif",
+)
+
+_CONTENT_TYPES = {
+    ".css": "text/css",
+    ".js": "application/javascript",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".gif": "image/gif",
+    ".woff2": "font/woff2",
+}
+
+
+class StandinState:
+    """스탠드인 서버의 시나리오 상태.
+
+    테스트/벤치마크 코드가 서버 실행 중에 속성을 바꿔 좌석 상황, 차단 여부,
+    응답 지연을 조정할 수 있다. 모든 변경은 다음 요청부터 반영된다.
+    """
+
+    def __init__(self, today=None, latency=0.0, page_size=10, asset_bytes=20_000):
+        self.today = today or date.today()
+        self.latency = latency              # HTML 응답마다 추가할 지연(초)
+        self.page_size = page_size          # 검색 결과 최대 행 수
+        self.asset_bytes = asset_bytes      # 정적 리소스 1개당 응답 크기
+        self.available = set()              # 일반실 예약하기 → 예약 성공 열차 번호
+        self.phantom = set()                # 예약하기가 보이지만 클릭 시 잔여석 없음
+        self.waitlist = set()               # 예약대기 신청하기 가능 열차 번호
+        self.blocked = False                # True면 조회 결과 대신 접속 제한 안내
+        self.block_request_id = "a19afddb5aab"
+        self.require_login = True           # 미로그인 조회 시 로그인 폼으로 리다이렉트
+        self.sessions = set()
+        self.bookings = []                  # (열차 번호, 종류) 기록
+        self.hits = Counter()               # 경로별 요청 수
+        self._lock = threading.Lock()
+
+    def record_hit(self, path: str) -> None:
+        with self._lock:
+            self.hits[path] += 1
+
+    def new_session(self) -> str:
+        token = secrets.token_hex(16)
+        with self._lock:
+            self.sessions.add(token)
+        return token
+
+    def expire_sessions(self) -> None:
+        """모든 세션을 만료시킨다 (세션 복구 시나리오 재현용)."""
+        with self._lock:
+            self.sessions.clear()
+
+    def available_dates(self, days: int = 30) -> list:
+        return [(self.today + timedelta(days=d)).strftime("%Y%m%d") for d in range(days)]
+
+
+def build_timetable(dpt_stn: str, arr_stn: str) -> list:
+    """결정적인 가상 시간표: 05:30부터 40분 간격, 소요시간 2시간 35분.
+
+    Returns:
+        list[tuple]: (열차 번호, 출발 HH:MM, 도착 HH:MM)
+    """
+    trains = []
+    minute = 5 * 60 + 30
+    train_no = 301
+    while minute <= 22 * 60 + 30:
+        arrive = minute + 155
+        trains.append((
+            str(train_no),
+            f"{minute // 60:02d}:{minute % 60:02d}",
+            f"{(arrive // 60) % 24:02d}:{arrive % 60:02d}",
+        ))
+        minute += 40
+        train_no += 2
+    return trains
+
+
+def _page(title: str, body: str, logged_in: bool) -> str:
+    user_menu = "환영합니다 홍길동님 | 로그아웃" if logged_in else "로그인 | 회원가입"
+    assets = "".join(
+        f'<img src="{path}" alt="">' for path in STATIC_ASSETS if path.startswith("/images/")
+    )
+    return (
+        "<!DOCTYPE html><html lang=\"ko\"><head><meta charset=\"utf-8\">"
+        f"<title>{html.escape(title)}</title>"
+        '<link rel="stylesheet" href="/css/common.css">'
+        '<script src="/js/analytics.js"></script>'
+        "</head><body>"
+        '<div id="wrap"><div class="header header-e"><div class="global clear">'
+        f"<div>{user_menu}</div></div></div>"
+        f'<div class="banner">{assets}</div>'
+        f'<div id="contents">{body}</div></div></body></html>'
+    )
+
+
+def render_login_form(logged_in: bool = False) -> str:
+    body = (
+        f'<form id="login-form" method="post" action="{LOGIN_SUBMIT_PATH}">'
+        '<input type="text" id="srchDvNm01" name="srchDvNm01" value="">'
+        '<input type="password" id="hmpgPwdCphd01" name="hmpgPwdCphd01" value="">'
+        '<input type="submit" class="loginSubmit" value="확인">'
+        "</form>"
+    )
+    return _page("로그인", body, logged_in)
+
+
+def render_main(logged_in: bool) -> str:
+    return _page("SRT 메인", "<h2>SRT 예약발매시스템</h2>", logged_in)
+
+
+def render_search_form(state: StandinState, params: dict) -> str:
+    dpt = params.get("dptRsStnCdNm", "")
+    arr = params.get("arvRsStnCdNm", "")
+    selected_dt = params.get("dptDt", "")
+    selected_tm = params.get("dptTm", "")
+
+    date_options = "".join(
+        f'<option value="{d}"{" selected" if d == selected_dt else ""}>'
+        f"{d[:4]}/{d[4:6]}/{d[6:]}</option>"
+        for d in state.available_dates()
+    )
+    time_options = "".join(
+        f'<option value="{h:02d}0000"{" selected" if f"{h:02d}0000" == selected_tm else ""}>'
+        f"{h:02d}</option>"
+        for h in range(0, 24, 2)
+    )
+    return (
+        f'<form id="search-form" method="get" action="{SCHEDULE_PATH}">'
+        f'<input type="text" id="dptRsStnCdNm" name="dptRsStnCdNm" value="{html.escape(dpt)}">'
+        f'<input type="text" id="arvRsStnCdNm" name="arvRsStnCdNm" value="{html.escape(arr)}">'
+        f'<select id="dptDt" name="dptDt" style="display: none;">{date_options}</select>'
+        f'<select id="dptTm" name="dptTm" style="display: none;">{time_options}</select>'
+        '<input type="submit" value="조회하기">'
+        "</form>"
+    )
+
+
+def render_result_rows(state: StandinState, params: dict) -> str:
+    dpt = params.get("dptRsStnCdNm", "")
+    arr = params.get("arvRsStnCdNm", "")
+    dpt_dt = params.get("dptDt", "")
+    hour = params.get("dptTm", "000000")[:2]
+
+    rows = []
+    trains = [t for t in build_timetable(dpt, arr) if t[1] >= f"{hour}:00"]
+    for index, (train_no, dpt_time, arr_time) in enumerate(trains[:state.page_size], start=1):
+        query = f"trnNo={train_no}&dptDt={dpt_dt}"
+        if train_no in state.available or train_no in state.phantom:
+            standard = f'<a href="{BOOKING_PATH}?{query}" class="btn_small btn_burgundy_dark"><span>예약하기</span></a>'
+        else:
+            standard = '<span class="btn_small btn_silver">매진</span>'
+        if train_no in state.waitlist:
+            waitlist = f'<a href="{WAITLIST_PATH}?{query}" class="btn_small btn_midnight"><span>신청하기</span></a>'
+        else:
+            waitlist = '<span class="btn_small btn_silver">매진</span>'
+        rows.append(
+            "<tr>"
+            f"<td>{index}</td>"
+            "<td>SRT</td>"
+            f'<td class="trnNo">{train_no}</td>'
+            f'<td>{html.escape(dpt)}<br><em class="time">{dpt_time}</em></td>'
+            f'<td>{html.escape(arr)}<br><em class="time">{arr_time}</em></td>'
+            '<td><span class="btn_small btn_silver">매진</span></td>'
+            f"<td>{standard}</td>"
+            f"<td>{waitlist}</td>"
+            "<td>2:35</td>"
+            "</tr>"
+        )
+    return "".join(rows)
+
+
+def render_results(state: StandinState, params: dict) -> str:
+    table = (
+        '<form id="result-form"><fieldset>'
+        '<div class="tbl_wrap th_thead"><table>'
+        "<thead><tr><th>구분</th><th>열차종류</th><th>열차번호</th><th>출발역</th>"
+        "<th>도착역</th><th>특실</th><th>일반실</th><th>예약대기</th><th>소요시간</th></tr></thead>"
+        f"<tbody>{render_result_rows(state, params)}</tbody>"
+        "</table></div></fieldset></form>"
+    )
+    return _page("일반승차권 조회", render_search_form(state, params) + table, True)
+
+
+def render_block_page(state: StandinState) -> str:
+    body = (
+        "<h2>SR SRT 예약발매시스템 접속 제한 안내</h2>"
+        f"<p>{BLOCK_PAGE_TEXT}</p>"
+        f"<p>요청 ID: {state.block_request_id}</p>"
+        "<p>[자동화된 요청으로 감지되어 차단되었습니다.]</p>"
+    )
+    return _page("접속 제한 안내", body, False)
+
+
+def render_booking_confirmation(train_no: str) -> str:
+    body = (
+        f"<h2>예약 확인</h2><p>{html.escape(train_no)} 열차 예약이 완료되었습니다. "
+        "10분 이내에 결제하지 않으면 취소됩니다.</p>"
+        '<input type="button" id="isFalseGotoMain" value="메인으로">'
+    )
+    return _page("예약 확인", body, True)
+
+
+def render_sold_out() -> str:
+    body = "<h2>잔여석 없음</h2><p>선택하신 열차는 잔여석이 없습니다.</p>"
+    return _page("잔여석 없음", body, True)
+
+
+def render_waitlist_confirmation(train_no: str) -> str:
+    body = f"<h2>예약대기 신청 완료</h2><p>{html.escape(train_no)} 열차 예약대기가 신청되었습니다.</p>"
+    return _page("예약대기", body, True)
+
+
+class _StandinHandler(BaseHTTPRequestHandler):
+    server_version = "SRTStandin/1.0"
+    state: StandinState = None  # 서버 생성 시 서브클래스로 주입
+
+    def log_message(self, format, *args):  # noqa: A002 — 기본 stderr 로그 억제
+        pass
+
+    # ── 공통 헬퍼 ────────────────────────────────────────────────────────
+
+    def _session_token(self):
+        cookie = self.headers.get("Cookie", "")
+        for part in cookie.split(";"):
+            name, _, value = part.strip().partition("=")
+            if name == SESSION_COOKIE:
+                return value
+        return None
+
+    def _logged_in(self) -> bool:
+        token = self._session_token()
+        return bool(token) and token in self.state.sessions
+
+    def _send_html(self, body: str, status: int = 200, headers=None) -> None:
+        if self.state.latency:
+            time.sleep(self.state.latency)
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _redirect(self, location: str, headers=None) -> None:
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def _send_asset(self, path: str) -> None:
+        suffix = path[path.rfind("."):]
+        payload = b"\0" * self.state.asset_bytes
+        self.send_response(200)
+        self.send_header("Content-Type", _CONTENT_TYPES.get(suffix, "application/octet-stream"))
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    # ── 라우팅 ───────────────────────────────────────────────────────────
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        path = parts.path
+        params = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        self.state.record_hit(path)
+
+        if path in STATIC_ASSETS or path.startswith(("/images/", "/fonts/", "/css/", "/js/")):
+            self._send_asset(path)
+        elif path == LOGIN_FORM_PATH:
+            self._send_html(render_login_form(self._logged_in()))
+        elif path in ("/", MAIN_PATH):
+            self._send_html(render_main(self._logged_in()))
+        elif path == SCHEDULE_PATH:
+            self._handle_schedule(params)
+        elif path == BOOKING_PATH:
+            self._handle_booking(params)
+        elif path == WAITLIST_PATH:
+            self._handle_waitlist(params)
+        else:
+            self._send_html(_page("Not Found", "<h2>404</h2>", False), status=404)
+
+    def do_POST(self):
+        parts = urlsplit(self.path)
+        self.state.record_hit(parts.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        form = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode("utf-8")).items()}
+
+        if parts.path == LOGIN_SUBMIT_PATH:
+            if form.get("srchDvNm01") and form.get("hmpgPwdCphd01"):
+                token = self.state.new_session()
+                self._redirect(MAIN_PATH, {"Set-Cookie": f"{SESSION_COOKIE}={token}; Path=/; HttpOnly"})
+            else:
+                self._send_html(render_login_form(False))
+        else:
+            self._send_html(_page("Not Found", "<h2>404</h2>", False), status=404)
+
+    def _handle_schedule(self, params: dict) -> None:
+        if self.state.blocked:
+            self._send_html(render_block_page(self.state))
+        elif self.state.require_login and not self._logged_in():
+            self._redirect(LOGIN_FORM_PATH)
+        elif params.get("dptDt"):
+            self._send_html(render_results(self.state, params))
+        else:
+            self._send_html(_page("일반승차권 조회", render_search_form(self.state, params), True))
+
+    def _handle_booking(self, params: dict) -> None:
+        train_no = params.get("trnNo", "")
+        if not self._logged_in():
+            self._redirect(LOGIN_FORM_PATH)
+        elif train_no in self.state.available:
+            self.state.bookings.append((train_no, "standard"))
+            self._send_html(render_booking_confirmation(train_no))
+        else:
+            self._send_html(render_sold_out())
+
+    def _handle_waitlist(self, params: dict) -> None:
+        train_no = params.get("trnNo", "")
+        if not self._logged_in():
+            self._redirect(LOGIN_FORM_PATH)
+        else:
+            self.state.bookings.append((train_no, "waitlist"))
+            self._send_html(render_waitlist_confirmation(train_no))
+
+
+class StandinServer:
+    """백그라운드 스레드에서 실행되는 SRT 스탠드인 서버.
+
+    with 문으로 사용하면 종료 시 자동으로 서버를 내린다:
+
+        with StandinServer(latency=0.02) as server:
+            srt = SRT(..., base_url=server.url)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, state: StandinState = None, **state_kwargs):
+        self.state = state or StandinState(**state_kwargs)
+        handler = type("StandinHandler", (_StandinHandler,), {"state": self.state})
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandinServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,), name="srt-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "StandinServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SRT 스탠드인 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="HTML 응답 지연(초)")
+    parser.add_argument("--available", default="", help="예약 가능 열차 번호, 쉼표 구분 ex) 305,309")
+    parser.add_argument("--waitlist", default="", help="예약대기 가능 열차 번호, 쉼표 구분")
+    parser.add_argument("--blocked", action="store_true", help="조회 시 접속 제한 안내 페이지 반환")
+    args = parser.parse_args()
+
+    server = StandinServer(args.host, args.port, latency=args.latency)
+    server.state.available = {t for t in args.available.split(",") if t}
+    server.state.waitlist = {t for t in args.waitlist.split(",") if t}
+    server.state.blocked = args.blocked
+    print(f"SRT 스탠드인 서버 실행 중: {server.url} (Ctrl+C로 종료)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
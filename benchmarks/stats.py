@@ -0,0 +1,51 @@
+"""벤치마크 결과 집계 헬퍼 (p50/p95 등)"""
+
+from typing import Dict, List, Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """선형 보간 백분위수.
+
+    Args:
+        values: 측정값 목록 (정렬 불필요).
+        pct: 0~100 사이 백분위.
+
+    Returns:
+        백분위수 값. 빈 목록이면 0.0.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return float(ordered[0])
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    weight = rank - lower
+    return ordered[lower] * (1 - weight) + ordered[upper] * weight
+
+
+def summarize(values: Sequence[float]) -> Dict[str, float]:
+    """측정값 목록의 n, mean, p50, p95, max 요약."""
+    if not values:
+        return {"n": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    return {
+        "n": len(values),
+        "mean": sum(values) / len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "max": max(values),
+    }
+
+
+def format_table(samples: Dict[str, List[float]], unit: str = "ms", scale: float = 1000.0) -> str:
+    """단계별 측정값을 사람이 읽기 쉬운 표로 변환한다."""
+    lines = [f"{'phase':<24}{'n':>6}{'mean':>12}{'p50':>12}{'p95':>12}{'max':>12}  ({unit})"]
+    for name, values in samples.items():
+        s = summarize(values)
+        lines.append(
+            f"{name:<24}{s['n']:>6}"
+            f"{s['mean'] * scale:>12.2f}{s['p50'] * scale:>12.2f}"
+            f"{s['p95'] * scale:>12.2f}{s['max'] * scale:>12.2f}"
+        )
+    return "\n".join(lines)
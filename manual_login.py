@@ -18,7 +18,11 @@ if __name__ == "__main__":
     config = Config.merge(cli_config, env_config)
 
     # 로거 초기화
-    setup_logger(config.get('log_level', 'INFO'))
+    setup_logger(
+        config.get('log_level', 'INFO'),
+        async_logging=config.get('async_logging', False),
+        log_format=config.get('log_format', 'text'),
+    )
 
     # 수동 로그인 모드 필수값 검증 (user/psw 제외)
     required_keys = ['dpt', 'arr', 'dt', 'tm']
@@ -3,8 +3,11 @@
 # imports
 import sys
 from srt_reservation.config import Config
+from srt_reservation.daemon import JobDaemon
 from srt_reservation.logger import setup_logger
+from srt_reservation import budget, metrics
 from srt_reservation.main import SRT
+from srt_reservation.scheduler import AdaptiveScheduler
 from srt_reservation.util import parse_cli_args
 
 
@@ -17,31 +20,68 @@ if __name__ == "__main__":
     config = Config.merge(cli_config, env_config)
 
     # 로거 초기화
-    setup_logger(config.get('log_level', 'INFO'))
+    setup_logger(
+        config.get('log_level', 'INFO'),
+        async_logging=config.get('async_logging', False),
+        log_format=config.get('log_format', 'text'),
+    )
 
     # 필수값 검증
+    jobs = None
     try:
         Config.validate_required(config)
+        if config.get('jobs_file'):
+            jobs = Config.load_jobs(config['jobs_file'], config)
     except ValueError as e:
         print(f"에러: {e}")
         sys.exit(1)
 
+    # 단계별 소요시간 계측 (포트/파일 중 하나라도 지정했을 때만 켜짐)
+    metrics.configure(port=config.get('metrics_port', 0), textfile=config.get('metrics_textfile'))
+
+    # 프로세스 전체 요청 예산 (0 이면 요청 수만 집계)
+    budget.configure(per_hour=config.get('request_budget', 0), burst=config.get('request_burst', 10))
+
     try:
-        srt = SRT(
-            config['dpt'],
-            config['arr'],
-            config['dt'],
-            config['tm'],
-            config['num'],
-            config['reserve'],
-            config['anti_bot'],
-            config['delay_min'],
-            config['delay_max'],
-            config['use_profile'],
-            config['profile_dir'],
-            config.get('headless', False),
-        )
-        srt.run(config['user'], config['psw'])
+        # 순회 간격 스케줄러 (fixed 면 SRT 기본 균등 난수)
+        scheduler = None
+        if config.get('poll_scheduler') == 'adaptive':
+            scheduler = AdaptiveScheduler(
+                config['delay_min'],
+                config['delay_max'],
+                hourly_budget=config.get('hourly_budget', 60),
+                focus_windows=config.get('focus_windows'),
+            )
+
+        if jobs:
+            # 다중 작업: 브라우저 1개·로그인 1회를 공유하며 작업들을 번갈아 조회
+            JobDaemon.from_configs(jobs, config, scheduler).run(config['user'], config['psw'])
+        else:
+            srt = SRT(
+                config['dpt'],
+                config['arr'],
+                config['dt'],
+                config['tm'],
+                config['num'],
+                config['reserve'],
+                config['anti_bot'],
+                config['delay_min'],
+                config['delay_max'],
+                config['use_profile'],
+                config['profile_dir'],
+                config.get('headless', False),
+                in_page_search=config.get('in_page_search', True),
+                coalesce_conditions=config.get('coalesce_conditions', True),
+                standby_memory_mb=config.get('standby_memory_mb', 0),
+                scheduler=scheduler,
+                record_pages=config.get('record_pages'),
+                lean_loading=config.get('lean_loading', False),
+                lean_allow=config.get('lean_allow'),
+                browser_memory_limit_mb=config.get('browser_memory_limit_mb', 0),
+            )
+            srt.run(config['user'], config['psw'])
     except Exception as e:
         print(f"에러 발생: {e}")
         sys.exit(1)
+    finally:
+        metrics.shutdown()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+프로세스 전체 요청 예산 (token bucket)
+
+go_search / refresh_result / book_ticket / reserve_ticket / login 은 서버로 요청을
+보내기 전에 REQUEST_BUDGET.acquire(종류) 로 토큰을 하나 받습니다 (go_search 의 전체
+이동은 조회 페이지 로드까지 2개). 토큰은 시간당 per_hour 개 속도로 최대 burst 개까지
+채워지며, 비어 있으면 채워질 때까지 기다립니다.
+복구 재시도나 다중 조건이 겹쳐도 서버로 가는 요청 수가 예산을 넘지 않습니다.
+
+마지막 booking_reserve 개 토큰은 예약·예약대기 클릭 전용입니다 — 빈자리를 찾은 순간
+조회 때문에 예약 클릭이 대기하지 않도록 합니다.
+
+configure() 로 켜기 전에는 요청 수만 세고 바로 반환합니다.
+
+사용 예:
+    from srt_reservation import budget
+    from srt_reservation.budget import REQUEST_BUDGET
+
+    budget.configure(per_hour=120, burst=10)
+    REQUEST_BUDGET.acquire("search")
+"""
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Callable
+
+from srt_reservation.metrics import METRICS
+
+logger = logging.getLogger('srt')
+
+
+class RequestBudget:
+    """요청 종류와 무관하게 토큰 1개씩 소비하는 token bucket"""
+
+    BOOKING_KINDS = frozenset({"book", "reserve"})
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.enabled = False
+        self.rate = 0.0  # 초당 토큰
+        self.capacity = 0
+        self.booking_reserve = 0
+        self._tokens = 0.0
+        self._updated = 0.0
+        self.counts: Counter = Counter()  # 종류별 요청 수
+        self.waited = 0.0  # 누적 대기 시간(초)
+
+    def configure(self, per_hour: int, burst: int = 10, booking_reserve: int = 1) -> bool:
+        """예산 설정. per_hour 가 0 이하면 끈다 (요청 수만 센다).
+
+        Returns:
+            bool: 예산이 켜졌으면 True
+        """
+        with self._lock:
+            self.enabled = per_hour > 0
+            if not self.enabled:
+                return False
+            self.rate = per_hour / 3600.0
+            self.booking_reserve = max(0, booking_reserve)
+            self.capacity = max(burst, self.booking_reserve + 1)
+            self._tokens = float(self.capacity)
+            self._updated = self._clock()
+        logger.info(f"요청 예산: 시간당 {per_hour}회, 최대 연속 {self.capacity}회")
+        METRICS.set("srt_budget_tokens", self._tokens)
+        return True
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def remaining(self) -> float:
+        """지금 남은 토큰 수 (꺼져 있으면 무한대)"""
+        if not self.enabled:
+            return float("inf")
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+    @property
+    def total(self) -> int:
+        """지금까지 보낸 요청 수 (종류 합계, 예산이 꺼져 있어도 센다)"""
+        return sum(self.counts.values())
+
+    def acquire(self, kind: str) -> float:
+        """토큰 1개를 받는다. 없으면 채워질 때까지 기다린다.
+
+        Args:
+            kind: 요청 종류 ('search', 'navigate', 'refresh', 'book', 'reserve', 'login')
+
+        Returns:
+            float: 대기한 시간(초)
+        """
+        self.counts[kind] += 1
+        METRICS.inc("srt_requests_total", kind=kind)
+        if not self.enabled:
+            return 0.0
+
+        floor = 0 if kind in self.BOOKING_KINDS else self.booking_reserve
+        started = self._clock()
+        logged = False
+        while True:
+            with self._lock:
+                self._refill(self._clock())
+                if self._tokens >= floor + 1:
+                    self._tokens -= 1
+                    remaining = self._tokens
+                    break
+                wait = (floor + 1 - self._tokens) / self.rate
+            if not logged:
+                logger.info(f"요청 예산 소진. {wait:.1f}초 대기 ({kind})")
+                logged = True
+            self._sleep(wait)
+
+        waited = self._clock() - started
+        if waited > 0:
+            self.waited += waited
+            METRICS.inc("srt_budget_wait_seconds_total", by=waited, kind=kind)
+        METRICS.set("srt_budget_tokens", remaining)
+        return waited
+
+    def reset(self) -> None:
+        """끄고 집계를 비운다 (테스트용)"""
+        with self._lock:
+            self.enabled = False
+            self.counts.clear()
+            self.waited = 0.0
+
+
+REQUEST_BUDGET = RequestBudget()
+
+
+def configure(per_hour: int = 0, burst: int = 10) -> bool:
+    """프로세스 전체 요청 예산 설정 (per_hour=0 이면 끔)"""
+    return REQUEST_BUDGET.configure(per_hour, burst)
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+디스크 캐시
+
+재시작/브라우저 복구 때마다 반복되는 비싼 작업의 결과를 프로젝트 루트의
+.cache/ 디렉토리(SRT_CACHE_DIR 로 변경 가능)에 저장합니다.
+
+- SessionCookieCache: 로그인 후 인증 쿠키. 새 브라우저에 복원해 로그인을 생략
+- DriverResolutionCache: Chrome 주 버전과 검증된 chromedriver 경로. Chrome 바이너리가
+  그대로면 버전 감지 subprocess 와 ChromeDriverManager 네트워크 조회를 생략
+"""
+import hashlib
+import json
+import logging
+import os
+import platform
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger('srt')
+
+
+def cache_dir() -> Path:
+    """캐시 디렉토리 경로 (SRT_CACHE_DIR > 프로젝트 루트/.cache)"""
+    configured = os.environ.get("SRT_CACHE_DIR")
+    if configured:
+        return Path(configured).expanduser()
+    return Path(__file__).resolve().parent.parent / ".cache"
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """임시 파일에 쓴 뒤 rename — 쓰는 도중 죽어도 반쯤 쓴 파일이 남지 않는다."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class SessionCookieCache:
+    """계정/사이트별 로그인 쿠키 캐시.
+
+    비밀번호는 저장하지 않는다. 쿠키가 서버에서 이미 만료되었을 수 있으므로
+    복원 후에는 호출자가 반드시 로그인 상태를 확인(probe)해야 한다.
+    """
+
+    # 이보다 오래된 쿠키는 시도하지 않고 바로 로그인
+    MAX_AGE = 12 * 60 * 60
+
+    def __init__(self, login_id: str, base_url: str, directory: Optional[Path] = None,
+                 max_age: Optional[float] = None):
+        key = hashlib.sha256(f"{login_id}|{base_url}".encode("utf-8")).hexdigest()[:16]
+        self.path = Path(directory or cache_dir()) / f"session-{key}.json"
+        self.max_age = self.MAX_AGE if max_age is None else max_age
+
+    def save(self, cookies: Any) -> bool:
+        """driver.get_cookies() 결과 저장. 저장했으면 True."""
+        if not isinstance(cookies, list) or not cookies:
+            return False
+        try:
+            _write_json_atomic(self.path, {"saved_at": time.time(), "cookies": cookies})
+            logger.debug(f"세션 쿠키 {len(cookies)}개 저장: {self.path}")
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"세션 쿠키 저장 실패: {e}")
+            return False
+
+    def load(self) -> Optional[List[dict]]:
+        """저장된 쿠키 중 아직 만료되지 않은 것. 없거나 너무 오래되었으면 None."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"세션 쿠키 캐시를 읽을 수 없습니다: {e}")
+            return None
+
+        now = time.time()
+        if not isinstance(data, dict) or now - float(data.get("saved_at") or 0) > self.max_age:
+            return None
+        cookies = [
+            c for c in data.get("cookies") or []
+            if isinstance(c, dict) and c.get("name") and ("expiry" not in c or c["expiry"] > now)
+        ]
+        return cookies or None
+
+    def clear(self) -> None:
+        """캐시 삭제 (쿠키가 서버에서 거부되었을 때)"""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"세션 쿠키 캐시 삭제 실패: {e}")
+
+
+class DriverResolutionCache:
+    """Chrome 바이너리(경로 + mtime + 크기)별 주 버전 / chromedriver 경로 캐시.
+
+    Chrome 이 업데이트되면 mtime 이 바뀌어 자동으로 무효가 된다. chromedriver 경로는
+    실제로 WebDriver 기동에 성공한 경우에만 기록하고, 파일이 바뀌었으면 쓰지 않는다.
+    """
+
+    FILENAME = "driver-resolution.json"
+
+    _LINUX_BINARIES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser")
+    _MAC_BINARY = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+
+    def __init__(self, directory: Optional[Path] = None, chrome_binary: Optional[str] = None):
+        self.path = Path(directory or cache_dir()) / self.FILENAME
+        self._chrome_binary = chrome_binary
+        self._entries: Optional[Dict[str, dict]] = None  # 파일 내용 (최초 접근 시 로드)
+
+    @classmethod
+    def find_chrome_binary(cls) -> Optional[str]:
+        """설치된 Chrome 실행 파일 경로 (subprocess 없이 파일 시스템만 조회)"""
+        system = platform.system()
+        if system == "Darwin":
+            candidates = [cls._MAC_BINARY]
+        elif system == "Windows":
+            candidates = [
+                os.path.join(os.environ[var], "Google", "Chrome", "Application", "chrome.exe")
+                for var in ("PROGRAMFILES", "PROGRAMFILES(X86)", "LOCALAPPDATA") if os.environ.get(var)
+            ]
+        else:
+            candidates = [shutil.which(name) for name in cls._LINUX_BINARIES]
+        for candidate in candidates:
+            if candidate and os.path.isfile(candidate):
+                return os.path.realpath(candidate)
+        return None
+
+    def _fingerprint(self) -> Optional[dict]:
+        binary = self._chrome_binary or self.find_chrome_binary()
+        if not binary:
+            return None
+        try:
+            st = os.stat(binary)
+        except OSError:
+            return None
+        return {"path": binary, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    data = json.load(f)
+                self._entries = data if isinstance(data, dict) else {}
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"드라이버 캐시를 읽을 수 없습니다: {e}")
+                self._entries = {}
+        return self._entries
+
+    def _entry(self) -> Optional[dict]:
+        """현재 Chrome 바이너리와 일치하는 항목. 바이너리가 바뀌었으면 None."""
+        fingerprint = self._fingerprint()
+        if fingerprint is None:
+            return None
+        entry = self._load().get(fingerprint["path"])
+        if not isinstance(entry, dict):
+            return None
+        if (entry.get("mtime_ns"), entry.get("size")) != (fingerprint["mtime_ns"], fingerprint["size"]):
+            return None
+        return entry
+
+    def _update(self, **fields) -> None:
+        fingerprint = self._fingerprint()
+        if fingerprint is None:
+            return
+        entries = self._load()
+        entry = self._entry() or dict(fingerprint)
+        entry.update(fields)
+        entries[fingerprint["path"]] = entry
+        try:
+            _write_json_atomic(self.path, entries)
+        except OSError as e:
+            logger.warning(f"드라이버 캐시 저장 실패: {e}")
+
+    def chrome_version(self) -> Optional[int]:
+        """캐시된 Chrome 주 버전 (Chrome 이 바뀌지 않았을 때만)"""
+        entry = self._entry()
+        version = entry.get("major_version") if entry else None
+        return version if isinstance(version, int) else None
+
+    def remember_chrome_version(self, version: Optional[int]) -> None:
+        if isinstance(version, int):
+            self._update(major_version=version)
+
+    def chromedriver_path(self) -> Optional[str]:
+        """이 Chrome 으로 기동에 성공했던 chromedriver 경로 (파일이 그대로일 때만)"""
+        entry = self._entry()
+        driver = entry.get("chromedriver") if entry else None
+        if not isinstance(driver, dict) or not driver.get("path"):
+            return None
+        try:
+            if os.stat(driver["path"]).st_mtime_ns != driver.get("mtime_ns"):
+                return None
+        except OSError:
+            return None
+        return driver["path"]
+
+    def remember_chromedriver(self, path: str) -> None:
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+        if self.chromedriver_path() != path:
+            self._update(chromedriver={"path": path, "mtime_ns": mtime_ns})
@@ -1,7 +1,8 @@
 """설정 관리 모듈 - .env 파일과 CLI 인자의 폴백 체인 처리"""
 
+import json
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 
@@ -27,6 +28,24 @@ class Config:
         'RETRY_DELAY_MAX': 'delay_max',
         'LOG_LEVEL': 'log_level',
         'HEADLESS': 'headless',
+        'IN_PAGE_SEARCH': 'in_page_search',
+        'COALESCE_CONDITIONS': 'coalesce_conditions',
+        'STANDBY_MEMORY_MB': 'standby_memory_mb',
+        'ASYNC_LOGGING': 'async_logging',
+        'LOG_FORMAT': 'log_format',
+        'METRICS_PORT': 'metrics_port',
+        'METRICS_TEXTFILE': 'metrics_textfile',
+        'POLL_SCHEDULER': 'poll_scheduler',
+        'HOURLY_BUDGET': 'hourly_budget',
+        'FOCUS_WINDOWS': 'focus_windows',
+        'REQUEST_BUDGET': 'request_budget',
+        'REQUEST_BURST': 'request_burst',
+        'RECORD_PAGES': 'record_pages',
+        'JOBS_FILE': 'jobs_file',
+        'RESULT_CACHE_TTL': 'result_cache_ttl',
+        'LEAN_LOADING': 'lean_loading',
+        'LEAN_ALLOW': 'lean_allow',
+        'BROWSER_MEMORY_LIMIT_MB': 'browser_memory_limit_mb',
     }
 
     # 선택 인자 기본값
@@ -40,16 +59,43 @@ class Config:
         'profile_dir': None,
         'log_level': 'INFO',
         'headless': False,
+        'in_page_search': True,
+        'coalesce_conditions': True,
+        'standby_memory_mb': 0,
+        'async_logging': False,
+        'log_format': 'text',
+        'metrics_port': 0,
+        'metrics_textfile': None,
+        'poll_scheduler': 'fixed',
+        'hourly_budget': 60,
+        'focus_windows': None,
+        'request_budget': 0,
+        'request_burst': 10,
+        'record_pages': None,
+        'jobs_file': None,
+        'result_cache_ttl': 30,
+        'lean_loading': False,
+        'lean_allow': None,
+        'browser_memory_limit_mb': 0,
     }
 
     # 필수 설정 키 목록
     REQUIRED_KEYS = ['user', 'psw', 'dpt', 'arr', 'dt', 'tm']
 
+    # 작업 파일(jobs_file)을 쓰면 노선/날짜/시간은 작업마다 지정한다
+    JOBS_REQUIRED_KEYS = ['user', 'psw']
+
+    # 작업 파일의 작업 1개에 쓸 수 있는 키 (없는 키는 공통 설정 값)
+    JOB_KEYS = ('name', 'dpt', 'arr', 'dt', 'tm', 'num', 'reserve')
+
     # 정수형으로 변환할 키
-    _INT_KEYS = {'num', 'delay_min', 'delay_max'}
+    _INT_KEYS = {'num', 'delay_min', 'delay_max', 'standby_memory_mb', 'metrics_port', 'hourly_budget',
+                 'request_budget', 'request_burst', 'result_cache_ttl',
+                 'browser_memory_limit_mb'}
 
     # 불리언으로 변환할 키
-    _BOOL_KEYS = {'reserve', 'use_profile', 'headless'}
+    _BOOL_KEYS = {'reserve', 'use_profile', 'headless', 'in_page_search', 'coalesce_conditions', 'async_logging',
+                  'lean_loading'}
 
     @staticmethod
     def _to_bool(value: str) -> bool:
@@ -133,8 +179,9 @@ class Config:
         Raises:
             ValueError: 필수값이 하나라도 누락된 경우.
         """
+        required = Config.JOBS_REQUIRED_KEYS if config.get('jobs_file') else Config.REQUIRED_KEYS
         missing = [
-            k for k in Config.REQUIRED_KEYS
+            k for k in required
             if k not in config or config[k] is None
         ]
 
@@ -145,3 +192,60 @@ class Config:
             )
 
         return True
+
+    @staticmethod
+    def load_jobs(path: str, base: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """작업 파일(JSON)을 읽어 작업별 설정 목록을 만든다.
+
+        파일은 작업 목록 또는 {"jobs": [...]} 형태이며, 작업마다 JOB_KEYS 중 필요한 키만
+        적는다. 빠진 키는 base(병합된 공통 설정) 값을 쓴다. dt/tm 은 쉼표 구분 문자열
+        또는 목록.
+
+        Args:
+            path: 작업 파일 경로.
+            base: 공통 설정 (Config.merge 결과).
+
+        Returns:
+            작업별 설정 딕셔너리 목록 (name, dpt, arr, dt, tm, num, reserve).
+
+        Raises:
+            ValueError: 파일 형식이 잘못됐거나 작업에 필수값이 없는 경우.
+        """
+        base = base or {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"작업 파일을 읽을 수 없습니다: {path} ({e})") from e
+
+        entries = data.get('jobs') if isinstance(data, dict) else data
+        if not isinstance(entries, list) or not entries:
+            raise ValueError(f"작업 파일에 작업 목록이 없습니다: {path}")
+
+        jobs: List[Dict[str, Any]] = []
+        for index, entry in enumerate(entries, start=1):
+            if not isinstance(entry, dict):
+                raise ValueError(f"{index}번째 작업이 객체가 아닙니다")
+            unknown = set(entry) - set(Config.JOB_KEYS)
+            if unknown:
+                raise ValueError(f"{index}번째 작업에 알 수 없는 키: {', '.join(sorted(unknown))}")
+
+            job = {key: entry.get(key, base.get(key)) for key in Config.JOB_KEYS if key != 'name'}
+            for key in ('dt', 'tm'):
+                if isinstance(job[key], (list, tuple)):
+                    job[key] = ','.join(str(v) for v in job[key])
+            missing = [key for key in ('dpt', 'arr', 'dt', 'tm') if not job.get(key)]
+            if missing:
+                raise ValueError(f"{index}번째 작업에 필수값이 없습니다: {', '.join(missing)}")
+            job['num'] = int(job['num'] if job['num'] is not None else Config.DEFAULTS['num'])
+            if isinstance(job['reserve'], str):
+                job['reserve'] = Config._to_bool(job['reserve'])
+            job['reserve'] = bool(job['reserve'])
+            job['name'] = str(entry.get('name') or f"{job['dpt']}→{job['arr']} {job['dt']}")
+            jobs.append(job)
+
+        names = [job['name'] for job in jobs]
+        duplicated = sorted({name for name in names if names.count(name) > 1})
+        if duplicated:
+            raise ValueError(f"작업 이름이 중복되었습니다: {', '.join(duplicated)}")
+        return jobs
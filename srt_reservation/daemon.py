@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+다중 작업 데몬 (브라우저 1개, 로그인 1회)
+
+같은 계정으로 여러 노선/날짜를 찾을 때 작업마다 quickstart.py 프로세스와 Chrome,
+로그인을 따로 두지 않고, 작업 파일(--jobs)의 작업들을 하나의 로그인된 브라우저에서
+번갈아 조회합니다.
+
+- 작업마다 SRT 인스턴스를 두어 검색 조건·예약 상태·SearchPlanner·알림은 작업별로 유지
+- 브라우저·로그인·세션 쿠키 만료 추적·예비 브라우저·메모리 감시는 첫 작업(lead)이 맡고 나머지가 공유
+- 한 바퀴 = 남은 작업마다 SRT.check_rotation() 1회. 대기 시간은 공유 스케줄러
+  (없으면 retry_delay_min~retry_delay_max 균등 난수)가 작업 전체 조회 수로 정함
+- 요청 상한은 프로세스 전체 REQUEST_BUDGET 하나를 모든 작업이 나눠 씀
+- 같은 (출발역, 도착역, 날짜, 시간)을 찾는 작업이 여럿이면 SharedResultCache 로 한 번만
+  조회하고, 각 작업은 보관된 결과에 자기 조건(확인할 열차 수, 예약대기)을 적용
+- 예약에 성공한 작업은 빠지고, 모든 작업이 끝나면 종료. 차단 페이지는 전체 즉시 종료
+
+예약이 잡힌 뒤에도 다른 작업이 같은 브라우저로 조회를 이어가므로, 결제는 SRT 앱/홈페이지의
+예약 내역에서 합니다 (작업 이름이 포함된 알림으로 안내).
+
+사용 예:
+    python quickstart.py --user ... --psw ... --jobs jobs.json --poll-scheduler adaptive
+"""
+import logging
+import time
+from random import randint
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from srt_reservation.budget import REQUEST_BUDGET
+from srt_reservation.exceptions import BlockedByServerError
+from srt_reservation.main import SRT, _is_browser_session_lost
+from srt_reservation.metrics import METRICS, export as export_metrics
+from srt_reservation.planner import SharedResultCache
+from srt_reservation.recovery import BrowserRecovery, RecoveryError
+from srt_reservation.scheduler import PollScheduler
+
+logger = logging.getLogger('srt')
+
+
+class Job:
+    """데몬이 돌리는 작업 1개 (이름 + 자체 검색 조건·예약 상태·알림을 가진 SRT)"""
+
+    def __init__(self, name: str, srt: SRT):
+        self.name = name
+        self.srt = srt
+
+    @property
+    def booked(self) -> bool:
+        return self.srt.is_booked
+
+    def __repr__(self):
+        return f"Job({self.name!r})"
+
+
+class JobDaemon:
+    """여러 작업을 브라우저 1개·로그인 1회로 번갈아 조회"""
+
+    def __init__(self, jobs: Sequence[Job], scheduler: Optional[PollScheduler] = None,
+                 result_cache_ttl: float = 30):
+        if not jobs:
+            raise ValueError("작업이 1개 이상 필요합니다")
+        self.jobs: List[Job] = list(jobs)
+        self.lead = self.jobs[0].srt  # 브라우저·로그인 담당
+        self.scheduler = scheduler
+        self.rotations = 0
+        self._requests_seen = REQUEST_BUDGET.total  # 스케줄러에 알린 요청 수 (시간당 예산용)
+        # 작업 간 조회 결과 공유 (0 이면 작업마다 조회)
+        self.result_cache = SharedResultCache(result_cache_ttl) if result_cache_ttl > 0 else None
+        for job in self.jobs:
+            # 차단 신호는 공유 스케줄러로 모은다 (대기 시간은 데몬이 정함)
+            job.srt.scheduler = scheduler
+            # 같은 로그인 쿠키를 쓰므로 만료 추적도 하나
+            job.srt.session_expiry = self.lead.session_expiry
+            job.srt.result_cache = self.result_cache
+
+    @classmethod
+    def from_configs(cls, job_configs: List[Dict[str, Any]], config: Dict[str, Any],
+                     scheduler: Optional[PollScheduler] = None) -> "JobDaemon":
+        """Config.load_jobs() 결과와 공통 설정으로 데몬을 만든다"""
+        jobs = []
+        for index, job in enumerate(job_configs):
+            srt = SRT(
+                job['dpt'],
+                job['arr'],
+                job['dt'],
+                job['tm'],
+                job['num'],
+                job['reserve'],
+                config['anti_bot'],
+                config['delay_min'],
+                config['delay_max'],
+                config['use_profile'],
+                config['profile_dir'],
+                config.get('headless', False),
+                in_page_search=config.get('in_page_search', True),
+                coalesce_conditions=config.get('coalesce_conditions', True),
+                # 예비 브라우저·메모리 감시는 브라우저를 가진 첫 작업만
+                standby_memory_mb=config.get('standby_memory_mb', 0) if index == 0 else 0,
+                record_pages=config.get('record_pages'),
+                lean_loading=config.get('lean_loading', False),
+                lean_allow=config.get('lean_allow'),
+                browser_memory_limit_mb=config.get('browser_memory_limit_mb', 0) if index == 0 else 0,
+            )
+            jobs.append(Job(job['name'], srt))
+        return cls(jobs, scheduler, result_cache_ttl=config.get('result_cache_ttl', 30))
+
+    def pending(self) -> List[Job]:
+        """아직 예약하지 못한 작업"""
+        return [job for job in self.jobs if not job.booked]
+
+    def _share_driver(self) -> None:
+        for job in self.jobs:
+            job.srt.driver = self.lead.driver
+
+    def start(self, login_id: str, login_psw: str) -> None:
+        """브라우저 1개를 띄워 로그인하고 모든 작업이 공유하게 한다"""
+        self.lead.run_driver()
+        for job in self.jobs:
+            job.srt.set_log_info(login_id, login_psw)
+        self.lead.sign_in()
+        self.lead.standby.prepare()
+        self._share_driver()
+        logger.info(f"다중 작업 데몬 시작: 작업 {len(self.jobs)}개 ({', '.join(job.name for job in self.jobs)})")
+
+    def run_rotation(self) -> Tuple[int, float, int]:
+        """남은 작업마다 조건 전체를 1회 순회.
+
+        Returns:
+            tuple: (실제 조회 수, 조회에 걸린 시간 합계(초), 복구 시도 수) — 작업 전체 합계
+        """
+        queries, search_seconds, errors = 0, 0.0, 0
+        for job in self.pending():
+            srt = job.srt
+            srt.driver = self.lead.driver
+            srt.cnt_refresh = self.rotations
+            try:
+                result, seconds, job_errors = srt.check_rotation()
+            except Exception as e:
+                if not _is_browser_session_lost(e):
+                    raise
+                logger.warning(f"[{job.name}] 브라우저 크래시 가능성. 자동 복구 시도...")
+                self._recover_browser()
+                errors += 1
+                continue
+            queries += srt.planner.queries
+            search_seconds += seconds
+            errors += job_errors
+            if result is not None:
+                srt.report_booking(job=job.name)
+                logger.info(f"[{job.name}] 예약 완료. 결제는 SRT 예약 내역에서 진행하세요 "
+                            f"(남은 작업 {len(self.pending())}개)")
+        METRICS.set("srt_jobs_pending", len(self.pending()))
+        return queries, search_seconds, errors
+
+    def _recover_browser(self) -> None:
+        """브라우저를 새로 띄워 세션을 복원하고 모든 작업에 다시 나눠 준다"""
+        try:
+            BrowserRecovery.recover(
+                driver=self.lead.driver,
+                srt_instance=self.lead,
+                context=self.lead.recovery_context,
+            )
+        except RecoveryError as recovery_err:
+            logger.error(f"브라우저 복구 실패: {recovery_err}")
+            raise
+        finally:
+            self._share_driver()
+
+    def _next_delay(self, queries: int, search_seconds: float, errors: int) -> int:
+        """한 바퀴 후 대기 시간(초). 스케줄러가 없으면 lead 의 retry_delay_min~retry_delay_max 균등 난수."""
+        if self.scheduler is None:
+            return randint(self.lead.retry_delay_min, self.lead.retry_delay_max)
+        sent = REQUEST_BUDGET.total
+        requests, self._requests_seen = sent - self._requests_seen, sent
+        self.scheduler.record_rotation(queries, search_seconds, errors, requests=requests)
+        return self.scheduler.next_delay(sum(len(job.srt.search_conditions) for job in self.pending()))
+
+    def run(self, login_id: str, login_psw: str) -> List[Job]:
+        """모든 작업이 예약될 때까지 반복.
+
+        Returns:
+            list: 예약에 성공한 작업 (오류로 끝나면 예외)
+        """
+        try:
+            self.start(login_id, login_psw)
+            while self.pending():
+                rotation_started = time.perf_counter()
+                queries, search_seconds, errors = self.run_rotation()
+                if not self.pending():
+                    break
+                delay = self._next_delay(queries, search_seconds, errors)
+                # 순회 사이 안전 지점: 브라우저 메모리가 한도를 넘었으면 교체 후 다시 나눠 준다
+                if self.lead.maybe_recycle_browser():
+                    self._share_driver()
+                logger.info(
+                    f"작업 {len(self.pending())}개 확인 완료 (조회 {queries}회, "
+                    f"{time.perf_counter() - rotation_started:.1f}초). {delay}초 대기 후 다시 검색..."
+                )
+                METRICS.inc("srt_cycles_total")
+                export_metrics()
+                time.sleep(delay)
+                self.rotations += 1
+            logger.info("모든 작업 예약 완료")
+            return [job for job in self.jobs if job.booked]
+        except BlockedByServerError as e:
+            # 같은 IP·계정을 공유하므로 차단 시 모든 작업 즉시 종료
+            logger.error(f"매크로 차단으로 모든 작업 종료: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"다중 작업 데몬 오류: {e}")
+            for job in self.pending():
+                job.srt.notifier.notify_failure(f"[{job.name}] {e}")
+            raise
+        finally:
+            self.lead.standby.close()
+            for job in self.jobs:
+                job.srt.notifier.flush(job.srt.notifier.FLUSH_TIMEOUT)
+            if self.lead.headless:
+                self.lead.close_driver()
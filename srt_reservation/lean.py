@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+경량 페이지 로드 (lean loading)
+
+go_search·로그인 이동마다 SRT 페이지는 이미지, 웹폰트, 배너, 분석 스크립트까지 받아 오지만
+예약 판단에는 DOM 만 필요합니다. 경량 모드는 CDP Network.setBlockedURLs 로 이런 요청을
+브라우저 안에서 끊습니다. 브라우저를 띄울 때 1회 설정하면 이후 요청마다 추가 왕복이 없습니다.
+
+- 차단 묶음(LEAN_BLOCK_GROUPS): images, fonts, media, analytics
+- 허용 목록(allow): 묶음 이름이나 개별 URL 패턴을 주면 그 항목은 차단하지 않음
+- 스타일시트와 SRT 자체 스크립트는 레이아웃·클릭 동작에 필요하므로 막지 않음
+
+전송량·로드 시간은 새 문서마다 load 이벤트에서 Performance API(navigation + resource timing)
+값을 sessionStorage 에 남기는 스크립트로 기록하고, 검색 직후 페이지 확인(probe)이 함께 읽어
+순회별로 합산합니다 (PageLoadStats). 아직 load 전인 페이지는 다음 확인에서 집계됩니다.
+교차 출처 리소스는 Timing-Allow-Origin 이 없으면 전송량이 0으로 보입니다.
+
+사용 예:
+    python quickstart.py ... --headless true --lean-loading true --lean-allow fonts
+"""
+import logging
+from typing import Iterable, List, Optional, Union
+
+from selenium.common.exceptions import WebDriverException
+
+from srt_reservation.metrics import METRICS
+
+logger = logging.getLogger('srt')
+
+# 확장자 패턴은 쿼리 문자열이 붙은 URL 도 막도록 "<패턴>?*" 를 함께 등록한다
+LEAN_BLOCK_GROUPS = {
+    "images": ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp"),
+    "fonts": ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"),
+    "media": ("*.mp4", "*.webm", "*.mp3", "*.m4a"),
+    "analytics": (
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*connect.facebook.net*",
+        "*wcs.naver.net*",
+        "*/analytics.js*",
+    ),
+}
+
+# sessionStorage 키 — 기록 스크립트와 검색 후 probe 가 공유
+LOAD_STORAGE_KEY = "__srt_page_loads"
+
+# 새 문서마다 실행: load 핸들러가 끝난 뒤(loadEventEnd 확정) [전송 바이트, load 까지 ms] 를 남긴다
+LOAD_RECORDER_SCRIPT = """
+window.addEventListener('load', function () {
+    setTimeout(function () {
+        try {
+            var nav = performance.getEntriesByType('navigation')[0];
+            if (!nav) { return; }
+            var bytes = nav.transferSize || 0;
+            performance.getEntriesByType('resource').forEach(function (r) { bytes += r.transferSize || 0; });
+            var loads = JSON.parse(sessionStorage.getItem('%(key)s') || '[]');
+            loads.push([bytes, Math.round(nav.loadEventEnd - nav.startTime)]);
+            sessionStorage.setItem('%(key)s', JSON.stringify(loads.slice(-50)));
+        } catch (e) {}
+    }, 0);
+});
+""" % {"key": LOAD_STORAGE_KEY}
+
+# probe 스크립트에 붙이는 조각: 쌓인 기록을 읽고 비운다 (loads 변수)
+TAKE_LOADS_JS = """
+        var loads = null;
+        try {
+            loads = JSON.parse(sessionStorage.getItem('%(key)s') || 'null');
+            sessionStorage.removeItem('%(key)s');
+        } catch (e) {}
+""" % {"key": LOAD_STORAGE_KEY}
+
+
+def blocked_patterns(allow: Union[None, str, Iterable[str]] = None) -> List[str]:
+    """허용 목록을 뺀 차단 URL 패턴 목록.
+
+    Args:
+        allow: 차단하지 않을 묶음 이름(LEAN_BLOCK_GROUPS) 또는 URL 패턴.
+               쉼표 구분 문자열 또는 목록
+    """
+    if isinstance(allow, str):
+        allow = allow.split(",")
+    allowed = {item.strip() for item in allow or () if item and item.strip()}
+    unknown = sorted(item for item in allowed
+                     if item not in LEAN_BLOCK_GROUPS
+                     and not any(item in patterns for patterns in LEAN_BLOCK_GROUPS.values()))
+    if unknown:
+        logger.warning(f"경량 모드 허용 목록에 알 수 없는 항목: {', '.join(unknown)} "
+                       f"(묶음: {', '.join(LEAN_BLOCK_GROUPS)} 또는 차단 패턴)")
+
+    patterns = []
+    for group, group_patterns in LEAN_BLOCK_GROUPS.items():
+        if group in allowed:
+            continue
+        for pattern in group_patterns:
+            if pattern in allowed:
+                continue
+            patterns.append(pattern)
+            if pattern.startswith("*.") and not pattern.endswith("*"):
+                patterns.append(pattern + "?*")
+    return patterns
+
+
+def block_resources(driver, allow=None) -> bool:
+    """CDP 로 불필요한 리소스 요청을 차단. CDP 를 쓸 수 없는 드라이버면 False (평소대로 로드)."""
+    patterns = blocked_patterns(allow)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except (WebDriverException, AttributeError) as e:
+        logger.warning(f"경량 로드 모드를 적용할 수 없습니다 (전체 로드로 진행): {e}")
+        return False
+    logger.info(f"경량 로드 모드: URL 패턴 {len(patterns)}개 차단")
+    return True
+
+
+def install_load_recorder(driver) -> bool:
+    """새 문서마다 전송량·로드 시간을 기록하는 스크립트 설치 (실패 시 False, 집계 없음)"""
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": LOAD_RECORDER_SCRIPT})
+    except (WebDriverException, AttributeError) as e:
+        logger.debug(f"페이지 로드 기록 스크립트 설치 실패: {e}")
+        return False
+    return True
+
+
+class PageLoadStats:
+    """브라우저가 기록한 페이지 로드(전송 바이트, load 이벤트까지 시간)를 순회별로 합산"""
+
+    def __init__(self):
+        self.pages = 0
+        self.bytes = 0
+        self.load_ms = 0.0
+        self.total_pages = 0
+        self.total_bytes = 0
+
+    def start_rotation(self) -> None:
+        self.pages = 0
+        self.bytes = 0
+        self.load_ms = 0.0
+
+    def add(self, loads) -> None:
+        """probe 가 돌려준 [[바이트, ms], ...] 를 더한다 (비정상 값은 무시)"""
+        if not isinstance(loads, list):
+            return
+        for entry in loads:
+            try:
+                size, ms = int(entry[0]), float(entry[1])
+            except (TypeError, ValueError, IndexError, KeyError):
+                continue
+            if size < 0 or ms < 0:
+                continue
+            self.pages += 1
+            self.bytes += size
+            self.load_ms += ms
+            self.total_pages += 1
+            self.total_bytes += size
+            METRICS.inc("srt_page_bytes_total", size)
+            METRICS.observe("page_load", ms / 1000)
+
+    def summary(self) -> Optional[str]:
+        """순회 로그에 붙일 한 줄 요약 (이번 순회 기록이 없으면 None)"""
+        if not self.pages:
+            return None
+        return f"페이지 {self.pages}개 {self.bytes / 1024:.0f}KB, 로드 {self.load_ms:.0f}ms"
@@ -1,32 +1,55 @@
 """로깅 설정 모듈 - 콘솔 + 파일 듀얼 핸들러"""
 
+import atexit
+import json
 import logging
 import logging.handlers
 import os
+import queue
 import re
+from typing import List, Optional
 
+# 비동기 모드에서 콘솔/파일 핸들러를 구동하는 리스너 (동기 모드면 None)
+_listener: Optional[logging.handlers.QueueListener] = None
 
-def setup_logger(level_name: str = 'INFO') -> logging.Logger:
-    """로거 설정: 콘솔 + 파일 듀얼 핸들러.
 
-    Args:
-        level_name: 로그 레벨 ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """같은 프로세스 안의 리스너로 레코드를 그대로 넘기는 QueueHandler.
 
-    Returns:
-        설정된 logging.Logger 인스턴스.
+    기본 prepare() 는 호출 스레드에서 메시지를 포맷하고 레코드를 복사한다 (프로세스 간
+    pickle 대비). 리스너가 같은 프로세스에 있으므로 이 작업도 리스너 스레드로 미룬다.
     """
-    logger = logging.getLogger('srt')
 
-    # 기존 핸들러 제거 (중복 방지)
-    logger.handlers = []
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
-    # 로그 레벨 설정
-    level = getattr(logging, level_name.upper(), logging.INFO)
-    logger.setLevel(level)
 
-    # 상위 로거로 전파하지 않음 (basicConfig 중복 방지)
-    logger.propagate = False
+class JsonFormatter(logging.Formatter):
+    """한 줄에 JSON 객체 하나 (JSON Lines).
 
+    extra={"fields": {...}} 로 넘긴 구조화 필드(조건별 결과, 순회 요약 등)를 최상위 키로
+    펼친다. 구조화 필드가 없는 일반 로그는 msg 만 담는다.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, '%Y-%m-%dT%H:%M:%S') + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "msg": record.getMessage(),
+        }
+        fields = getattr(record, 'fields', None)
+        if isinstance(fields, dict):
+            entry.update(fields)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def _build_handlers(level: int, log_format: str = 'text') -> List[logging.Handler]:
+    """콘솔 핸들러와 자정 회전 파일 핸들러 생성.
+
+    log_format='json' 이면 파일에는 JsonFormatter 로 기록하고, 콘솔은 사람이 읽는 텍스트를 유지한다.
+    """
     # 포맷 정의
     formatter = logging.Formatter(
         '[%(asctime)s] [%(levelname)s] %(message)s',
@@ -37,7 +60,6 @@ def setup_logger(level_name: str = 'INFO') -> logging.Logger:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
     # 파일 핸들러 (TimedRotatingFileHandler)
     os.makedirs('logs', exist_ok=True)
@@ -50,7 +72,7 @@ def setup_logger(level_name: str = 'INFO') -> logging.Logger:
         encoding='utf-8'
     )
     file_handler.setLevel(level)
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(JsonFormatter() if log_format == 'json' else formatter)
 
     # 파일명 커스텀: srt.log.YYYY-MM-DD → srt_YYYY-MM-DD.log
     def namer(default_name: str) -> str:
@@ -60,6 +82,78 @@ def setup_logger(level_name: str = 'INFO') -> logging.Logger:
         return default_name
 
     file_handler.namer = namer
-    logger.addHandler(file_handler)
+    return [console_handler, file_handler]
+
 
+def setup_logger(level_name: str = 'INFO', async_logging: bool = False,
+                 log_format: str = 'text') -> logging.Logger:
+    """로거 설정: 콘솔 + 파일 듀얼 핸들러.
+
+    Args:
+        level_name: 로그 레벨 ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+        async_logging: True 면 로거에는 QueueHandler 만 달고, 포맷팅·콘솔 출력·파일 쓰기
+            (자정 회전 포함)는 QueueListener 스레드가 처리한다. 종료 시 shutdown_logger()
+            로 남은 레코드를 모두 기록한다 (atexit 에도 등록됨).
+        log_format: 'text' (기본) 또는 'json'. json 이면 logs/srt.log 를 JSON Lines 로 기록
+            (조건별 결과·순회 요약 레코드의 구조화 필드 포함).
+
+    Returns:
+        설정된 logging.Logger 인스턴스.
+    """
+    global _listener
+
+    logger = logging.getLogger('srt')
+
+    # 이전 비동기 리스너가 있으면 남은 레코드를 기록하고 정리
+    shutdown_logger()
+
+    # 기존 핸들러 제거 (중복 방지)
+    logger.handlers = []
+
+    # 로그 레벨 설정
+    level = getattr(logging, level_name.upper(), logging.INFO)
+    logger.setLevel(level)
+
+    # 상위 로거로 전파하지 않음 (basicConfig 중복 방지)
+    logger.propagate = False
+
+    handlers = _build_handlers(level, log_format.lower())
+    if not async_logging:
+        for handler in handlers:
+            logger.addHandler(handler)
+        return logger
+
+    queue_handler = _LocalQueueHandler(queue.SimpleQueue())
+    queue_handler.setLevel(level)
+    _listener = logging.handlers.QueueListener(
+        queue_handler.queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+    logger.addHandler(queue_handler)
     return logger
+
+
+def shutdown_logger() -> None:
+    """비동기 리스너를 멈추고 큐에 남은 레코드를 모두 기록한다.
+
+    이후의 로그가 유실되지 않도록 srt 로거의 QueueHandler 를 리스너가 쓰던 핸들러로
+    되돌린다. 동기 모드에서는 아무것도 하지 않는다.
+    """
+    global _listener
+
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()  # 큐를 끝까지 비운 뒤 스레드 종료
+
+    logger = logging.getLogger('srt')
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers):
+        logger.handlers = [h for h in logger.handlers if not isinstance(h, logging.handlers.QueueHandler)]
+        for handler in listener.handlers:
+            logger.addHandler(handler)
+    for handler in listener.handlers:
+        handler.flush()
+
+
+# logging.shutdown(먼저 등록됨)보다 앞서 실행되어 큐를 비운다
+atexit.register(shutdown_logger)
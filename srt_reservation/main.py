@@ -1,14 +1,19 @@
 # -*- coding: utf-8 -*-
+import copy
+import json
 import os
 import time
 from random import randint, uniform
 import logging
+from collections import Counter, deque
+from functools import partial
 from datetime import datetime
 from selenium import webdriver
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.select import Select
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
@@ -16,6 +21,9 @@ from selenium.common.exceptions import (
     StaleElementReferenceException,
     WebDriverException,
     InvalidSessionIdException,
+    JavascriptException,
+    NoSuchElementException,
+    TimeoutException,
 )
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options as ChromeOptions
@@ -29,12 +37,22 @@ from srt_reservation.exceptions import (
     BlockedByServerError,
 )
 from srt_reservation.validation import station_list
+from srt_reservation.budget import REQUEST_BUDGET
+from srt_reservation.cache import DriverResolutionCache, SessionCookieCache
+from srt_reservation.lean import TAKE_LOADS_JS, PageLoadStats, block_resources, install_load_recorder
+from srt_reservation.metrics import METRICS, export as export_metrics, timed
+from srt_reservation.models import ResultPage, TrainRow
 from srt_reservation.notifier import TelegramNotifier
+from srt_reservation.planner import SearchPlanner
+from srt_reservation.recorder import PageRecorder
+from srt_reservation.standby import StandbyBrowser
+from srt_reservation.watchdog import MemoryWatchdog
 from srt_reservation.recovery import (
     RecoveryContext,
     RecoveryError,
     NetworkErrorRecovery,
     SessionRecovery,
+    SessionExpiryTracker,
     BrowserRecovery,
 )
 
@@ -43,6 +61,9 @@ logger = logging.getLogger('srt')
 # chromedriver 경로는 환경 변수에서 가져오거나 기본값 사용
 chromedriver_path = os.environ.get('CHROMEDRIVER_PATH', '/usr/local/bin/chromedriver')
 
+# SRT 사이트 기본 URL (벤치마크 시 로컬 스탠드인 서버 주소로 교체 가능)
+SRT_BASE_URL = os.environ.get('SRT_BASE_URL', 'https://etk.srail.co.kr')
+
 # 봇 탐지 우회 방법 선택 (환경변수로 제어 가능)
 # 옵션: 'undetected', 'stealth', 'enhanced'
 ANTI_BOT_METHOD = os.environ.get('ANTI_BOT_METHOD', 'undetected')
@@ -75,7 +96,10 @@ def _is_browser_session_lost(exc):
     return False
 
 class SRT:
-    def __init__(self, dpt_stn, arr_stn, dpt_dt, dpt_tm, num_trains_to_check=2, want_reserve=False, anti_bot_method=None, retry_delay_min=60, retry_delay_max=120, use_profile=True, profile_dir=None, headless=False):
+    # 메모리에 보관할 검색 결과 이력 수 (ResultPage 단위)
+    RESULT_HISTORY_SIZE = 1000
+
+    def __init__(self, dpt_stn, arr_stn, dpt_dt, dpt_tm, num_trains_to_check=2, want_reserve=False, anti_bot_method=None, retry_delay_min=60, retry_delay_max=120, use_profile=True, profile_dir=None, headless=False, base_url=None, in_page_search=True, coalesce_conditions=True, session_cache=True, standby_memory_mb=0, scheduler=None, record_pages=None, lean_loading=False, lean_allow=None, browser_memory_limit_mb=0):
         """
         :param dpt_stn: SRT 출발역
         :param arr_stn: SRT 도착역
@@ -89,9 +113,32 @@ class SRT:
         :param use_profile: 실제 Chrome 프로필 사용 여부 (기본: True, 봇 탐지 회피에 매우 효과적)
         :param profile_dir: Chrome 프로필 디렉토리 (None이면 기본 프로필 사용)
         :param headless: 브라우저 UI 없이 백그라운드 실행 여부 (기본: False)
+        :param base_url: SRT 사이트 기본 URL (None이면 SRT_BASE_URL 사용, 로컬 스탠드인 서버 벤치마크용)
+        :param in_page_search: 결과 페이지에서 날짜/시간만 바꿔 재조회 (기본: True, 폼이 없으면 전체 이동)
+        :param coalesce_conditions: 같은 날짜의 이른 시간 조회 결과로 덮이는 조건은 조회 생략 (기본: True)
+        :param session_cache: 로그인 쿠키를 .cache/ 에 저장해 재시작/브라우저 복구 시 로그인 생략 (기본: True)
+        :param standby_memory_mb: 웜 스탠바이 예비 브라우저 메모리 예산(MB). 0이면 사용 안 함 (기본: 0)
+        :param scheduler: 순회 간 대기 시간을 정할 PollScheduler (예: AdaptiveScheduler).
+                          None 이면 retry_delay_min~retry_delay_max 균등 난수 (기본: None)
+        :param record_pages: 본 페이지를 개인정보를 지운 HTML 로 저장할 디렉토리 (replay 벤치마크/테스트용 코퍼스).
+                             None 이면 저장 안 함 (기본: None)
+        :param lean_loading: 이미지·웹폰트·미디어·분석 스크립트 요청을 CDP 로 차단하고 순회별 전송량·로드 시간을
+                             집계 (기본: False)
+        :param lean_allow: 경량 모드에서도 불러올 묶음(images/fonts/media/analytics) 또는 URL 패턴,
+                           쉼표 구분 또는 목록 (기본: None)
+        :param browser_memory_limit_mb: 브라우저 프로세스 트리 RSS 가 이 값(MB)을 넘으면 순회 사이에 로그인 쿠키를
+                                        유지한 채 브라우저를 교체. 0이면 사용 안 함 (기본: 0)
         """
         self.login_id = None
         self.login_psw = None
+        self.use_session_cache = session_cache
+        self.session_cache = None  # set_log_info() 에서 계정별로 생성
+        self.session_expiry = SessionExpiryTracker()  # 로그인 쿠키 만료 임박 시 선제 재로그인
+        self.driver_cache = DriverResolutionCache()  # Chrome 버전 / chromedriver 경로
+        self.standby = StandbyBrowser(self._launch_standby_driver, standby_memory_mb)
+        self.memory_watchdog = MemoryWatchdog(browser_memory_limit_mb)  # 메모리 한도 초과 시 계획된 교체
+
+        self.base_url = (base_url or SRT_BASE_URL).rstrip('/')
 
         self.dpt_stn = dpt_stn
         self.arr_stn = arr_stn
@@ -112,19 +159,38 @@ class SRT:
         # 검색 조건 배열 생성 (날짜 × 시간 카테시안 곱)
         self.search_conditions = self.generate_search_conditions()
         self._booked_condition = {}
+        self._booked_row = None  # 예약/예약대기에 성공한 TrainRow
+        self._last_page = None  # 마지막으로 확인한 ResultPage (조건별 로그 레코드용)
+        self._booked_seat_type = None
+        self._searched_condition = {"dpt_dt": self.dpt_dt, "dpt_tm": self.dpt_tm}
 
         self.num_trains_to_check = num_trains_to_check
         self.want_reserve = want_reserve
+        self.planner = SearchPlanner(num_trains_to_check, enabled=coalesce_conditions)
+        self.result_cache = None  # 작업 간 조회 결과 공유 (SharedResultCache, 다중 작업 데몬이 설정)
         self.driver = None
 
         self.is_booked = False  # 예약 완료 되었는지 확인용
         self.cnt_refresh = 0  # 새로고침 회수 기록
+        self.in_page_search = in_page_search
+        self.search_counts = Counter()  # 조회 경로별 횟수 ('in_page' / 'full' / 'coalesced' / 'shared')
+        self.last_result_page = None  # 가장 최근 검색의 ResultPage
+        # 검색 결과 이력 (WebElement 참조를 뗀 사본만 보관하여 메모리 절약)
+        self.result_history = deque(maxlen=self.RESULT_HISTORY_SIZE)
         self.recovery_context = RecoveryContext(max_retries=3)
-        self.notifier = TelegramNotifier()
+        # 알림은 백그라운드 큐로 보내 예약 흐름이 Telegram API 응답을 기다리지 않게 한다
+        self.notifier = TelegramNotifier(background=True)
 
         # 재시도 간격 설정 (봇 탐지 회피)
         self.retry_delay_min = retry_delay_min
         self.retry_delay_max = retry_delay_max
+        self.scheduler = scheduler
+        self._requests_seen = REQUEST_BUDGET.total  # 스케줄러에 알린 요청 수 (시간당 예산용)
+        self.recorder = PageRecorder(record_pages) if record_pages else None
+        # 경량 페이지 로드 (CDP 리소스 차단) 와 페이지 로드 집계
+        self.lean_loading = lean_loading
+        self.lean_allow = lean_allow
+        self.page_loads = PageLoadStats() if lean_loading else None
 
         # Chrome 프로필 설정
         self.use_profile = use_profile
@@ -145,6 +211,10 @@ class SRT:
 
         logger.info(f"봇 탐지 우회 방법: {self.anti_bot_method}")
         logger.info(f"재시도 간격: {self.retry_delay_min}~{self.retry_delay_max}초")
+        if self.scheduler is not None:
+            logger.info(f"순회 간격 스케줄러: {type(self.scheduler).__name__}")
+        if self.recorder is not None:
+            logger.info(f"페이지 녹화: {self.recorder.directory}")
         logger.info(f"검색 조건 수: {len(self.search_conditions)}개")
 
         self.check_input()
@@ -214,6 +284,8 @@ class SRT:
             raise ValueError("로그인 ID와 비밀번호는 필수입니다.")
         self.login_id = login_id
         self.login_psw = login_psw
+        if self.use_session_cache:
+            self.session_cache = SessionCookieCache(login_id, self.base_url)
 
     def _get_chrome_profile_path(self):
         """Chrome 프로필 경로 자동 감지 (macOS, Linux, Windows)"""
@@ -314,7 +386,17 @@ class SRT:
         return options
 
     def _get_chrome_version(self):
-        """설치된 Chrome 버전 감지"""
+        """설치된 Chrome 주 버전. Chrome 바이너리가 그대로면 캐시 값을 쓰고 subprocess 를 생략."""
+        version = self.driver_cache.chrome_version()
+        if version is not None:
+            logger.info(f"Chrome 버전 (캐시): {version}")
+            return version
+        version = self._detect_chrome_version()
+        self.driver_cache.remember_chrome_version(version)
+        return version
+
+    def _detect_chrome_version(self):
+        """설치된 Chrome 버전 감지 (subprocess)"""
         import subprocess
         import re
         import platform
@@ -422,18 +504,7 @@ class SRT:
             raise ImportError("selenium-stealth를 설치해주세요: pip install selenium-stealth")
 
         options = self._chrome_options()
-
-        try:
-            # 일반 ChromeDriver 초기화
-            service = Service(chromedriver_path)
-            self.driver = webdriver.Chrome(service=service, options=options)
-            logger.info(f"ChromeDriver를 {chromedriver_path}에서 로드했습니다.")
-        except (WebDriverException, FileNotFoundError) as e:
-            logger.warning(f"기본 경로에서 ChromeDriver를 찾을 수 없습니다: {e}")
-            logger.info("WebDriver Manager를 사용하여 ChromeDriver를 설치합니다.")
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
-            logger.info("ChromeDriver 설치 완료")
+        self._start_chrome(options)
 
         # selenium-stealth 적용
         stealth(self.driver,
@@ -449,23 +520,34 @@ class SRT:
     def _run_driver_enhanced(self):
         """향상된 옵션을 사용한 WebDriver 초기화"""
         options = self._chrome_options()
-
-        try:
-            # Service 객체를 사용하여 ChromeDriver 초기화
-            service = Service(chromedriver_path)
-            self.driver = webdriver.Chrome(service=service, options=options)
-            logger.info(f"ChromeDriver를 {chromedriver_path}에서 로드했습니다.")
-        except (WebDriverException, FileNotFoundError) as e:
-            # WebDriverException 발생 시, WebDriver Manager로 드라이버 설치
-            logger.warning(f"기본 경로에서 ChromeDriver를 찾을 수 없습니다: {e}")
-            logger.info("WebDriver Manager를 사용하여 ChromeDriver를 설치합니다.")
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
-            logger.info("ChromeDriver 설치 완료")
+        self._start_chrome(options)
 
         # 추가 스크립트 주입
         self._inject_stealth_scripts()
 
+    def _start_chrome(self, options):
+        """ChromeDriver 로 Chrome 기동 (stealth / enhanced 공용).
+
+        이 Chrome 으로 기동에 성공했던 chromedriver(캐시) → 기본 경로 → WebDriver Manager
+        순서로 시도한다. 캐시가 유효하면 네트워크 없이 바로 기동한다.
+        """
+        cached = self.driver_cache.chromedriver_path()
+        for path in dict.fromkeys(p for p in (cached, chromedriver_path) if p):
+            try:
+                self.driver = webdriver.Chrome(service=Service(path), options=options)
+                logger.info(f"ChromeDriver를 {path}에서 로드했습니다.")
+                self.driver_cache.remember_chromedriver(path)
+                return
+            except (WebDriverException, FileNotFoundError) as e:
+                logger.warning(f"{path}에서 ChromeDriver를 사용할 수 없습니다: {e}")
+
+        # WebDriver Manager로 드라이버 설치 (네트워크 필요)
+        logger.info("WebDriver Manager를 사용하여 ChromeDriver를 설치합니다.")
+        path = ChromeDriverManager().install()
+        self.driver = webdriver.Chrome(service=Service(path), options=options)
+        self.driver_cache.remember_chromedriver(path)
+        logger.info("ChromeDriver 설치 완료")
+
     def _inject_stealth_scripts(self):
         """봇 탐지 우회를 위한 JavaScript 스크립트 주입"""
         try:
@@ -535,8 +617,20 @@ class SRT:
         except Exception as e:
             logger.warning(f"스크립트 주입 중 오류 (무시 가능): {e}")
 
+    @timed("run_driver")
     def run_driver(self):
-        """Chrome WebDriver 초기화 - 선택한 방법에 따라 다르게 초기화"""
+        """Chrome WebDriver 초기화 - 선택한 방법에 따라 다르게 초기화
+
+        웜 스탠바이 예비 브라우저가 있으면 새로 띄우지 않고 넘겨받은 뒤 다음 예비를 준비한다.
+        """
+        if self.standby is not None:
+            driver = self.standby.take()
+            if driver is not None:
+                self.driver = driver
+                logger.info("예비 브라우저로 교체했습니다 (웜 스탠바이)")
+                self.standby.prepare()
+                return
+
         logger.info(f"선택한 봇 탐지 우회 방법: {self.anti_bot_method}")
 
         if self.anti_bot_method == 'undetected' and UNDETECTED_AVAILABLE:
@@ -549,9 +643,18 @@ class SRT:
                 logger.warning(f"알 수 없는 방법: {self.anti_bot_method}. 향상된 모드 사용")
             self._run_driver_enhanced()
 
+        self._apply_lean_loading()
+
         logger.info("WebDriver 초기화 완료")
         logger.info(f"브라우저 시작됨, 현재 URL: {self.driver.current_url}")
 
+    def _apply_lean_loading(self):
+        """새 브라우저에 페이지 로드 기록 스크립트와 경량 모드 리소스 차단을 설정 (켜져 있을 때만)"""
+        if self.page_loads is not None:
+            install_load_recorder(self.driver)
+        if self.lean_loading:
+            block_resources(self.driver, self.lean_allow)
+
     def _human_like_delay(self, min_sec=0.5, max_sec=2.0):
         """인간처럼 랜덤 대기"""
         delay = uniform(min_sec, max_sec)
@@ -594,8 +697,34 @@ class SRT:
         except Exception as e:
             logger.debug(f"마우스 이동 시뮬레이션 중 오류 (무시): {e}")
 
+    def _launch_standby_driver(self):
+        """현재 driver 를 건드리지 않고 예비 WebDriver 를 띄워 반환 (백그라운드 스레드에서 호출).
+
+        저장된 세션 쿠키가 있으면 복원해 로그인 상태로 대기시킨다. 같은 Chrome 프로필
+        디렉토리는 두 브라우저가 동시에 쓸 수 없으므로 예비 브라우저는 프로필 없이 띄운다.
+
+        launcher 는 얕은 복사본이므로 세션 캐시·만료 추적은 따로 두어 메인 인스턴스 상태를
+        건드리지 않는다. 캐시는 읽기만 하고, 쿠키가 거부되어도 지우지 않는다 (교체 후 메인이 판단).
+        """
+        cookies = self.session_cache.load() if self.session_cache is not None else None
+        launcher = copy.copy(self)
+        launcher.driver = None
+        launcher.standby = None
+        launcher.session_cache = None
+        launcher.session_expiry = SessionExpiryTracker()
+        launcher.use_profile = False
+        launcher.run_driver()
+        try:
+            if cookies and not launcher._resume_session(cookies):
+                logger.debug("예비 브라우저 세션 복원 실패 (교체 후 로그인)")
+        except Exception as e:
+            logger.debug(f"예비 브라우저 세션 복원 실패 (교체 후 로그인): {e}")
+        return launcher.driver
+
     def close_driver(self):
         """WebDriver 리소스 정리"""
+        if self.standby is not None:
+            self.standby.close()
         if self.driver:
             try:
                 self.driver.quit()
@@ -620,18 +749,96 @@ class SRT:
             logger.error(f"Alert 처리 중 오류 발생: {e}")
             return False
 
+    # 페이지 준비 대기 최대 시간(초). 조건이 먼저 충족되면 즉시 진행한다.
+    PAGE_READY_TIMEOUT = 10
+    _WAIT_POLL_INTERVAL = 0.1
+
+    # 조회 결과 렌더링 완료 판정: 문서 로딩이 끝났고, 결과 표가 있거나
+    # 검색 폼이 없는 페이지(차단 안내 등)로 바뀐 경우
+    _RESULTS_READY_SCRIPT = """
+        if (document.readyState !== 'complete') { return false; }
+        return document.querySelector('#result-form') !== null
+            || document.querySelector('#dptDt') === null;
+    """
+
+    def _wait_for_page(self, condition, what, timeout=None):
+        """DOM 조건이 충족될 때까지 대기 (고정 sleep / implicit wait 대신 사용).
+
+        Alert 가 뜨면 그 자체를 페이지 준비 신호로 보고 즉시 반환한다 (처리는 호출자 몫).
+        시간 초과는 예외로 올리지 않는다 — 이후 단계가 현재 DOM 으로 판단을 이어간다.
+
+        Args:
+            condition: driver 를 받아 truthy 를 반환하면 준비 완료로 보는 함수
+            what: 로그용 대기 대상 이름
+            timeout: 최대 대기 시간(초). None이면 PAGE_READY_TIMEOUT
+
+        Returns:
+            bool: 조건 충족 여부 (시간 초과 시 경고 로그 후 False)
+        """
+        timeout = timeout or self.PAGE_READY_TIMEOUT
+
+        def _condition(driver):
+            try:
+                return condition(driver)
+            except UnexpectedAlertPresentException:
+                return True
+
+        try:
+            WebDriverWait(
+                self.driver,
+                timeout,
+                poll_frequency=self._WAIT_POLL_INTERVAL,
+                ignored_exceptions=(NoSuchElementException, JavascriptException),
+            ).until(_condition)
+            return True
+        except TimeoutException:
+            logger.warning(f"{what} 대기 시간 초과 ({timeout}초)")
+            return False
+
+    def _page_marker(self):
+        """현재 문서의 html 요소 (클릭 후 페이지 전환 감지용)"""
+        return self.driver.find_element(By.TAG_NAME, 'html')
+
+    @staticmethod
+    def _navigated_from(old_page, driver):
+        """old_page 문서가 새 문서로 교체되었는지 확인"""
+        try:
+            old_page.is_enabled()
+            return False
+        except StaleElementReferenceException:
+            return True
+
+    def _wait_for_results(self, old_page):
+        """조회 버튼 클릭 후 새 결과 페이지가 그려질 때까지 대기"""
+        return self._wait_for_page(
+            lambda d: self._navigated_from(old_page, d)
+            and d.execute_script(self._RESULTS_READY_SCRIPT) is True,
+            "조회 결과",
+        )
+
+    def _wait_for_booking_page(self, old_page):
+        """예약하기 클릭 후 예약 확인/잔여석 없음 페이지 로딩 완료까지 대기"""
+        return self._wait_for_page(
+            lambda d: self._navigated_from(old_page, d)
+            and d.execute_script("return document.readyState") == "complete",
+            "예약 페이지",
+        )
+
+    @timed("login")
     def login(self):
         """SRT 로그인 - 인간처럼 동작"""
         logger.info("로그인 페이지로 이동 중...")
+        REQUEST_BUDGET.acquire("login")
         try:
-            self.driver.get('https://etk.srail.co.kr/cmc/01/selectLoginForm.do')
+            self.driver.get(f'{self.base_url}/cmc/01/selectLoginForm.do')
             logger.info(f"현재 URL: {self.driver.current_url}")
             self._human_like_delay(1.0, 2.0)  # 페이지 로딩 대기
         except UnexpectedAlertPresentException:
             logger.warning("Alert 발생, 처리 중...")
             self.handle_alert()
-            # Alert 처리 후 다시 시도
-            self.driver.get('https://etk.srail.co.kr/cmc/01/selectLoginForm.do')
+            # Alert 처리 후 다시 시도 (요청 1회 추가)
+            REQUEST_BUDGET.acquire("login")
+            self.driver.get(f'{self.base_url}/cmc/01/selectLoginForm.do')
             self._human_like_delay(1.0, 2.0)
         except Exception as e:
             logger.error(f"로그인 페이지 로드 중 오류: {e}")
@@ -672,15 +879,15 @@ class SRT:
 
             logger.info("로그인 버튼 클릭 완료")
 
-            # 로그인 처리 대기
+            # 로그인 처리 대기 (완료 여부는 check_login 이 DOM 조건으로 확인)
             self._human_like_delay(2.0, 3.5)
-            self.driver.implicitly_wait(10)
             logger.info("로그인 시도 완료")
         except Exception as e:
             logger.error(f"로그인 중 오류 발생: {e}")
             raise
         return self.driver
 
+    @timed("check_login")
     def check_login(self):
         """로그인 성공 여부 확인"""
         try:
@@ -719,26 +926,196 @@ class SRT:
             logger.error(f"로그인 확인 중 오류: {e}")
             return False
 
+    def confirm_login(self, attempts=3):
+        """로그인 성공 여부를 최대 attempts회 확인. 확인되면 세션 쿠키를 저장한다.
+
+        check_login() 이 환영 메시지/로그인 폼 소멸을 DOM 조건으로 기다리므로
+        시도 사이에 고정 대기를 두지 않는다.
+        """
+        for attempt in range(attempts):
+            if self.check_login():
+                self.save_session()
+                return True
+            logger.info(f"로그인 확인 재시도 {attempt + 1}/{attempts}")
+        return False
+
+    # 결과 페이지에 남아 있는 검색 폼의 날짜/시간 select 만 바꾸는 스크립트.
+    # 출발/도착역이 그대로이고 옵션이 모두 있을 때만 값을 바꾸고
+    # [현재 html 요소, 조회 버튼] 을 돌려준다. 그 외에는 사유 문자열을 반환.
+    _SWITCH_CONDITION_SCRIPT = """
+        var dpt = arguments[0], arr = arguments[1], dt = arguments[2], tm = arguments[3];
+        if (!document.querySelector('#result-form')) { return 'no-results'; }
+        var dptStn = document.getElementById('dptRsStnCdNm');
+        var arvStn = document.getElementById('arvRsStnCdNm');
+        var dtSel = document.getElementById('dptDt');
+        var tmSel = document.getElementById('dptTm');
+        if (!dptStn || !arvStn || !dtSel || !tmSel) { return 'no-form'; }
+        if (dptStn.value !== dpt || arvStn.value !== arr) { return 'station-mismatch'; }
+        var dtOpt = Array.prototype.find.call(dtSel.options, function (o) { return o.value === dt; });
+        if (!dtOpt) { return 'no-date'; }
+        var tmOpt = Array.prototype.find.call(tmSel.options, function (o) { return o.text.trim() === tm; });
+        if (!tmOpt) { return 'no-time'; }
+        var submit = document.querySelector("input[value='조회하기']");
+        if (!submit) { return 'no-submit'; }
+        dtSel.value = dtOpt.value;
+        tmSel.value = tmOpt.value;
+        [dtSel, tmSel].forEach(function (el) { el.dispatchEvent(new Event('change', {bubbles: true})); });
+        return [document.documentElement, submit];
+    """
+
+    def _switch_condition_in_page(self, search_dt, search_tm):
+        """로드된 결과 페이지에서 날짜/시간만 바꿔 재조회 (페이지 이동 없이).
+
+        Returns:
+            bool: 재조회했으면 True, 폼이 없거나 조건이 맞지 않으면 False (호출자가 전체 이동)
+        """
+        try:
+            result = self.driver.execute_script(
+                self._SWITCH_CONDITION_SCRIPT, self.dpt_stn, self.arr_stn, search_dt, search_tm
+            )
+        except WebDriverException as e:
+            logger.debug(f"페이지 내 조건 전환 불가: {e}")
+            return False
+
+        if not (isinstance(result, list) and len(result) == 2
+                and all(isinstance(el, WebElement) for el in result)):
+            logger.debug(f"페이지 내 조건 전환 불가: {result if isinstance(result, str) else '알 수 없음'}")
+            return False
+
+        old_page, submit = result
+        try:
+            submit.click()
+        except WebDriverException as e:
+            logger.debug(f"페이지 내 조회 버튼 클릭 실패: {e}")
+            return False
+        logger.debug(f"조건 전환 조회: 날짜={search_dt}, 시간={search_tm}시 이후")
+        self._wait_for_results(old_page)
+        return True
+
+    _MAIN_PAGE_PATH = '/main/main.do'
+    _LOGIN_MARKER_SELECTOR = "#wrap > div.header.header-e > div.global.clear > div"
+
+    # 로그인 상태 확인 — 상단 메뉴의 환영 메시지 유무 (WebDriver 왕복 1회)
+    _SESSION_PROBE_SCRIPT = """
+        var menu = document.querySelector(arguments[0]);
+        return !!menu && menu.innerText.indexOf('환영합니다') >= 0;
+    """
+
+    _COOKIE_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'expiry', 'sameSite')
+
+    def save_session(self):
+        """현재 브라우저의 로그인 쿠키를 캐시에 저장하고 쿠키 만료 시각을 기록"""
+        try:
+            cookies = self.driver.get_cookies()
+        except (AttributeError, WebDriverException) as e:
+            logger.debug(f"세션 쿠키 조회 실패: {e}")
+            return False
+        self.session_expiry.update(cookies)
+        if self.session_cache is None:
+            return False
+        return self.session_cache.save(cookies)
+
+    def restore_session(self):
+        """저장된 로그인 쿠키를 새 브라우저에 복원하고 로그인 상태인지 확인.
+
+        메인 페이지 1회 로드 + 스크립트 1회로 판정한다. 쿠키가 없거나 서버가
+        거부하면 캐시를 지우고 False — 호출자가 login() 으로 진행한다.
+
+        Returns:
+            bool: 로그인 상태 복원 성공 여부
+        """
+        if self.session_cache is None:
+            return False
+        cookies = self.session_cache.load()
+        if not cookies:
+            return False
+
+        if self._resume_session(cookies):
+            logger.info("저장된 세션으로 로그인 상태 복원 (로그인 생략)")
+            return True
+
+        logger.info("저장된 세션이 만료되었습니다. 다시 로그인합니다")
+        self.session_cache.clear()
+        try:
+            self.driver.delete_all_cookies()
+        except WebDriverException:
+            pass
+        return False
+
+    def _resume_session(self, cookies):
+        """쿠키를 현재 브라우저에 주입하고 메인 페이지 1회 로드 + 스크립트 1회로 로그인 상태 확인.
+
+        로그인 상태면 쿠키 만료 시각 추적을 갱신하고 True.
+        """
+        try:
+            self._inject_cookies(cookies)
+            REQUEST_BUDGET.acquire("navigate")
+            self.driver.get(f'{self.base_url}{self._MAIN_PAGE_PATH}')
+            valid = self.driver.execute_script(self._SESSION_PROBE_SCRIPT, self._LOGIN_MARKER_SELECTOR) is True
+        except WebDriverException as e:
+            logger.warning(f"세션 쿠키 복원 실패: {e}")
+            return False
+        if valid:
+            self.session_expiry.update(cookies)
+        return valid
+
+    def _inject_cookies(self, cookies):
+        """쿠키 주입. Chrome 은 CDP 로 페이지 이동 없이, 그 외에는 사이트 방문 후 add_cookie."""
+        cdp_cookies = []
+        for cookie in cookies:
+            param = {k: cookie[k] for k in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite') if k in cookie}
+            if 'expiry' in cookie:
+                param['expires'] = cookie['expiry']
+            if 'domain' not in param:
+                param['url'] = self.base_url
+            cdp_cookies.append(param)
+        try:
+            self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': cdp_cookies})
+            return
+        except (AttributeError, WebDriverException) as e:
+            logger.debug(f"CDP 쿠키 주입 불가, add_cookie 로 대체: {e}")
+
+        REQUEST_BUDGET.acquire("navigate")
+        self.driver.get(f'{self.base_url}{self._MAIN_PAGE_PATH}')
+        for cookie in cookies:
+            self.driver.add_cookie({k: cookie[k] for k in self._COOKIE_FIELDS if k in cookie})
+
+    @timed("go_search")
     def go_search(self, dpt_dt=None, dpt_tm=None):
         """기차 조회 페이지로 이동 및 검색 조건 입력
 
+        in_page_search 가 켜져 있고 결과 페이지가 이미 로드되어 있으면
+        날짜/시간 select 만 바꿔 재조회하고, 아니면 조회 페이지로 이동해 전체 입력한다.
+
         Args:
             dpt_dt: 출발 날짜 (None이면 self.dpt_dt 사용) -- 하위 호환
             dpt_tm: 출발 시간 (None이면 self.dpt_tm 사용) -- 하위 호환
         """
         search_dt = dpt_dt if dpt_dt is not None else self.dpt_dt
         search_tm = dpt_tm if dpt_tm is not None else self.dpt_tm
+        self._searched_condition = {"dpt_dt": search_dt, "dpt_tm": search_tm}
+        REQUEST_BUDGET.acquire("search")
+        if self.result_cache is not None:
+            self.result_cache.navigated()
 
+        if self.in_page_search and self._switch_condition_in_page(search_dt, search_tm):
+            self.search_counts["in_page"] += 1
+            return
+        self.search_counts["full"] += 1
+
+        # 전체 이동은 조회 페이지 로드 + 조회 제출로 요청 2회
+        REQUEST_BUDGET.acquire("navigate")
         try:
-            self.driver.get('https://etk.srail.co.kr/hpg/hra/01/selectScheduleList.do')
+            self.driver.get(f'{self.base_url}/hpg/hra/01/selectScheduleList.do')
         except UnexpectedAlertPresentException:
             self.handle_alert()
-            # Alert 처리 후 다시 시도
-            self.driver.get('https://etk.srail.co.kr/hpg/hra/01/selectScheduleList.do')
-        self.driver.implicitly_wait(5)
+            # Alert 처리 후 다시 시도 (요청 1회 추가)
+            REQUEST_BUDGET.acquire("navigate")
+            self.driver.get(f'{self.base_url}/hpg/hra/01/selectScheduleList.do')
 
         # 출발지 입력
-        elm_dpt_stn = self.driver.find_element(By.ID, 'dptRsStnCdNm')
+        wait = WebDriverWait(self.driver, self.PAGE_READY_TIMEOUT)
+        elm_dpt_stn = wait.until(EC.presence_of_element_located((By.ID, 'dptRsStnCdNm')))
         elm_dpt_stn.clear()
         elm_dpt_stn.send_keys(self.dpt_stn)
 
@@ -748,7 +1125,6 @@ class SRT:
         elm_arr_stn.send_keys(self.arr_stn)
 
         # 출발 날짜 입력
-        wait = WebDriverWait(self.driver, 10)
         elm_dpt_dt = wait.until(EC.presence_of_element_located((By.ID, "dptDt")))
         self.driver.execute_script("arguments[0].setAttribute('style','display: True;')", elm_dpt_dt)
 
@@ -756,12 +1132,12 @@ class SRT:
 
         # 사용 가능한 날짜 옵션 확인
         available_dates = [option.get_attribute('value') for option in date_select.options if option.get_attribute('value')]
-        logger.info(f"사용 가능한 날짜 옵션 수: {len(available_dates)}")
+        logger.debug(f"사용 가능한 날짜 옵션 수: {len(available_dates)}")
 
         # 날짜 선택 시도
         try:
             date_select.select_by_value(search_dt)
-            logger.info(f"날짜 선택 성공: {search_dt}")
+            logger.debug(f"날짜 선택 성공: {search_dt}")
         except Exception as e:
             logger.error(f"날짜 선택 실패: {search_dt}")
             logger.error(f"사용 가능한 날짜 옵션: {available_dates[:10]}...")  # 처음 10개만 표시
@@ -772,65 +1148,74 @@ class SRT:
         self.driver.execute_script("arguments[0].setAttribute('style','display: True;')", elm_dpt_tm)
         Select(self.driver.find_element(By.ID, "dptTm")).select_by_visible_text(search_tm)
 
-        logger.info("기차를 조회합니다")
-        logger.info(f"출발역: {self.dpt_stn}, 도착역: {self.arr_stn}")
-        logger.info(f"날짜: {search_dt}, 시간: {search_tm}시 이후")
-        logger.info(f"{self.num_trains_to_check}개의 기차 중 예약 확인")
-        logger.info(f"예약 대기 사용: {self.want_reserve}")
+        logger.debug("기차를 조회합니다")
+        logger.debug(f"출발역: {self.dpt_stn}, 도착역: {self.arr_stn}")
+        logger.debug(f"날짜: {search_dt}, 시간: {search_tm}시 이후")
+        logger.debug(f"{self.num_trains_to_check}개의 기차 중 예약 확인")
+        logger.debug(f"예약 대기 사용: {self.want_reserve}")
 
         try:
+            old_page = self._page_marker()
             self.driver.find_element(By.XPATH, "//input[@value='조회하기']").click()
-            self.driver.implicitly_wait(5)
-            time.sleep(1)
         except Exception as e:
             logger.error(f"조회 버튼 클릭 중 오류 발생: {e}")
             raise
+        self._wait_for_results(old_page)
 
-    def book_ticket(self, standard_seat, i):
+    @timed("book_ticket")
+    def book_ticket(self, row: TrainRow):
         """
         일반석 예약 시도
-        :param standard_seat: 일반석 검색 결과 텍스트
-        :param i: 기차 번호 (테이블 행 번호)
+        :param row: 결과 표 스냅샷의 TrainRow (일반실 링크 요소가 있으면 그대로 클릭)
         :return: 예약 성공 시 driver, 실패 시 None
         """
-        if "예약하기" in standard_seat:
-            logger.info(f"{i}번째 기차 예약 가능 - 예약 시도")
+        if row.can_book:
+            i = row.index
+            logger.info(f"{i}번째 기차({row.train_no} {row.dpt_time}) 예약 가능 - 예약 시도")
 
+            REQUEST_BUDGET.acquire("book")
+            old_page = self._page_marker()
+            self._leave_results_page()
             # Error handling in case that click does not work
             try:
-                self.driver.find_element(By.CSS_SELECTOR,
-                                         f"#result-form > fieldset > div.tbl_wrap.th_thead > table > tbody > tr:nth-child({i}) > td:nth-child(7) > a").click()
+                self._click_seat_link(row.standard.link, i, 7)
             except ElementClickInterceptedException as err:
                 logger.warning(f"클릭 실패, ENTER 키로 재시도: {err}")
                 try:
-                    self.driver.find_element(By.CSS_SELECTOR,
-                                             f"#result-form > fieldset > div.tbl_wrap.th_thead > table > tbody > tr:nth-child({i}) > td:nth-child(7) > a").send_keys(Keys.ENTER)
+                    self.driver.find_element(By.CSS_SELECTOR, self._seat_link_selector(i, 7)).send_keys(Keys.ENTER)
                 except Exception as e:
                     logger.error(f"예약 버튼 클릭 실패: {e}")
                     return None
-            finally:
-                self.driver.implicitly_wait(3)
+            self._wait_for_booking_page(old_page)
+            booked = bool(self.driver.find_elements(By.ID, 'isFalseGotoMain'))
+            self._record_page("booking" if booked else "sold_out")
 
             # 예약이 성공하면
-            if self.driver.find_elements(By.ID, 'isFalseGotoMain'):
+            if booked:
                 self.is_booked = True
+                self._booked_row = row.without_links()
+                self._booked_seat_type = "일반석"
                 logger.info("예약 성공!")
                 return self.driver
             else:
                 logger.info("잔여석 없음. 다시 검색")
+                sold_out_page = self._page_marker()
                 self.driver.back()  # 뒤로가기
-                self.driver.implicitly_wait(5)
+                # 결과 페이지가 새 문서로 다시 그려지므로 스냅샷 링크는 stale (다음 후보는 _click_seat_link 가 다시 찾음)
+                self._wait_for_results(sold_out_page)
         return None
 
     def refresh_result(self):
         """검색 결과 새로고침"""
         try:
+            REQUEST_BUDGET.acquire("refresh")
+            old_page = self._page_marker()
             submit = self.driver.find_element(By.XPATH, "//input[@value='조회하기']")
             self.driver.execute_script("arguments[0].click();", submit)
             self.cnt_refresh += 1
+            METRICS.inc("srt_refreshes_total")
             logger.info(f"새로고침 {self.cnt_refresh}회")
-            self.driver.implicitly_wait(10)
-            time.sleep(0.5)
+            self._wait_for_results(old_page)
         except Exception as e:
             if _is_browser_session_lost(e):
                 logger.error("새로고침 중 브라우저 연결이 끊어졌습니다.")
@@ -838,14 +1223,22 @@ class SRT:
                 logger.error(f"새로고침 중 오류 발생: {e}")
             raise
 
-    def reserve_ticket(self, reservation, i):
-        """예약 대기 신청"""
-        if "신청하기" in reservation:
-            logger.info(f"{i}번째 기차 예약 대기 신청")
+    @timed("reserve_ticket")
+    def reserve_ticket(self, row: TrainRow):
+        """예약 대기 신청
+
+        :param row: 결과 표 스냅샷의 TrainRow (예약대기 링크 요소가 있으면 그대로 클릭)
+        """
+        if row.can_waitlist:
+            i = row.index
+            logger.info(f"{i}번째 기차({row.train_no} {row.dpt_time}) 예약 대기 신청")
+            REQUEST_BUDGET.acquire("reserve")
             try:
-                self.driver.find_element(By.CSS_SELECTOR,
-                                         f"#result-form > fieldset > div.tbl_wrap.th_thead > table > tbody > tr:nth-child({i}) > td:nth-child(8) > a").click()
+                self._leave_results_page()
+                self._click_seat_link(row.waitlist.link, i, 8)
                 self.is_booked = True
+                self._booked_row = row.without_links()
+                self._booked_seat_type = "예약대기"
                 logger.info("예약 대기 신청 완료")
                 return self.is_booked
             except Exception as e:
@@ -853,32 +1246,156 @@ class SRT:
                 return False
         return False
 
-    def _check_result_once(self):
-        """단일 검색 결과 확인 사이클 (네트워크 오류 복구에서 호출)"""
-        for i in range(1, self.num_trains_to_check + 1):
+    def _click_seat_link(self, link, i, column):
+        """결과 표 i번째 행, column번째 칸의 좌석 링크 클릭.
+
+        스냅샷 링크가 없거나 stale 이면 (잔여석 없음 후 뒤로가기로 결과 페이지가 다시 그려진 경우)
+        같은 칸의 링크를 선택자로 다시 찾아 클릭한다.
+        """
+        if link is not None:
             try:
-                standard_seat = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    f"#result-form > fieldset > div.tbl_wrap.th_thead > table > tbody > tr:nth-child({i}) > td:nth-child(7)"
-                ).text
-                reservation = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    f"#result-form > fieldset > div.tbl_wrap.th_thead > table > tbody > tr:nth-child({i}) > td:nth-child(8)"
-                ).text
+                link.click()
+                return
             except StaleElementReferenceException:
-                logger.warning(f"{i}번째 기차 정보를 가져올 수 없습니다 (StaleElement)")
-                standard_seat = "매진"
-                reservation = "매진"
-            except Exception as e:
-                logger.warning(f"{i}번째 기차 정보를 가져올 수 없습니다: {e}")
-                standard_seat = "매진"
-                reservation = "매진"
+                logger.debug(f"{i}번째 기차 좌석 링크가 stale - 다시 찾아 클릭")
+        self.driver.find_element(By.CSS_SELECTOR, self._seat_link_selector(i, column)).click()
+
+    _RESULT_ROW_SELECTOR = "#result-form > fieldset > div.tbl_wrap.th_thead > table > tbody > tr"
+
+    @classmethod
+    def _seat_link_selector(cls, i, column):
+        """결과 표 i번째 행, column번째 칸의 링크 CSS 선택자 (스냅샷이 없을 때의 폴백)"""
+        return f"{cls._RESULT_ROW_SELECTOR}:nth-child({i}) > td:nth-child({column}) > a"
+
+    # 검색 결과 표 전체를 WebDriver 왕복 1회로 읽는 스크립트.
+    # 칸 구성: 3=열차번호, 4=출발역/시각, 5=도착역/시각, 6=특실, 7=일반실, 8=예약대기.
+    # 좌석 칸의 링크는 WebElement 로 돌려받아 예약 클릭 시 다시 조회하지 않는다.
+    _RESULT_TABLE_SCRIPT = """
+        var rows = document.querySelectorAll(arguments[0]);
+        var textOf = function (td) {
+            return td ? (td.innerText || td.textContent || '').trim() : '';
+        };
+        var timeOf = function (td) {
+            var m = textOf(td).match(/\\d{1,2}:\\d{2}/);
+            return m ? m[0] : '';
+        };
+        var seatOf = function (td) {
+            var a = td ? td.querySelector('a') : null;
+            return {text: textOf(td), has_link: !!a, link: a};
+        };
+        var out = [];
+        for (var i = 0; i < rows.length; i++) {
+            var td = rows[i].children;
+            out.push({
+                index: i + 1,
+                train_no: textOf(td[2]),
+                dpt_time: timeOf(td[3]),
+                arr_time: timeOf(td[4]),
+                special: seatOf(td[5]),
+                standard: seatOf(td[6]),
+                waitlist: seatOf(td[7])
+            });
+        }
+        return out;
+    """
+
+    def snapshot_results(self) -> ResultPage:
+        """검색 결과 표를 execute_script 1회로 스냅샷하여 ResultPage로 파싱한다.
+
+        검색 조건은 직전 go_search() 의 날짜/시간을 사용한다. 파싱 결과는
+        last_result_page 에 저장되고, 링크를 뗀 사본이 result_history 에 쌓인다.
 
-            if self.book_ticket(standard_seat, i):
+        Returns:
+            ResultPage: 표를 읽지 못하면 행이 없는 ResultPage.
+        """
+        try:
+            raw_rows = self.driver.execute_script(self._RESULT_TABLE_SCRIPT, self._RESULT_ROW_SELECTOR)
+        except Exception as e:
+            logger.warning(f"검색 결과 표를 가져올 수 없습니다: {e}")
+            raw_rows = []
+        return self._store_snapshot(raw_rows)
+
+    def _store_snapshot(self, raw_rows) -> ResultPage:
+        """스크립트가 돌려준 행 목록을 직전 검색 조건의 ResultPage 로 만들어 보관"""
+        condition = self._searched_condition
+        # mock 환경 등에서 비정상 반환 시 ResultPage.from_snapshot 이 빈 결과로 처리
+        page = ResultPage.from_snapshot(raw_rows, condition["dpt_dt"], condition["dpt_tm"])
+        self.last_result_page = page
+        self.result_history.append(page.without_links())
+        if self.result_cache is not None:
+            self.result_cache.put(self.dpt_stn, self.arr_stn, page)
+        return page
+
+    def _leave_results_page(self):
+        """예약 클릭·재로그인 등으로 결과 페이지를 떠남 — 보관한 결과의 링크 요소가 무효가 된다."""
+        self.planner.invalidate()
+        if self.result_cache is not None:
+            self.result_cache.navigated()
+
+    def _shared_page(self, condition):
+        """다른 작업이 이번 순회에 조회한 같은 슬롯의 결과로 condition 을 확인할 수 있으면 반환.
+
+        브라우저에 그 결과가 그대로 떠 있으면(live) 링크째 쓰고, 아니면 이 작업 기준
+        상위 열차 중 예약/예약대기할 수 있는 열차가 없을 때만 링크 없는 결과를 쓴다.
+        클릭할 열차가 있으면 None — 직접 조회해 살아 있는 링크를 얻는다.
+        """
+        if self.result_cache is None:
+            return None
+        page, live = self.result_cache.get(self.dpt_stn, self.arr_stn, condition["dpt_dt"], condition["dpt_tm"])
+        if page is None:
+            return None
+        if not live and any(row.can_book or (self.want_reserve and row.can_waitlist)
+                            for row in page.candidates(self.num_trains_to_check)):
+            return None
+        METRICS.inc("srt_shared_results_total")
+        return page
+
+    @timed("post_search_probe")
+    def _probe_after_search(self):
+        """검색 직후 페이지 종류·URL·결과 행을 스크립트 1회로 확인.
+
+        Returns:
+            dict: kind (results/block/login/alert/error), url, 그리고 kind 별로 rows 또는
+                  matched/request_id. 판별할 수 없으면 (드라이버 오류, mock 등) None —
+                  호출자는 기존의 개별 확인 경로로 진행한다.
+        """
+        try:
+            probe = self.driver.execute_script(self._POST_SEARCH_PROBE_SCRIPT, self._RESULT_ROW_SELECTOR)
+        except UnexpectedAlertPresentException:
+            return {"kind": "alert", "url": None}
+        except WebDriverException as e:
+            logger.debug(f"검색 후 페이지 확인 실패: {e}")
+            return None
+        if not isinstance(probe, dict) or probe.get("kind") not in self._PROBE_KINDS:
+            return None
+        return probe
+
+    @timed("check_result_once")
+    def _check_result_once(self, page=None):
+        """단일 검색 결과 확인 사이클 (네트워크 오류 복구에서 호출)
+
+        결과 표는 snapshot_results() 로 한 번만 읽고, 예약/예약대기 판단은 ResultPage로 한다.
+
+        Args:
+            page: 이전 조회 결과로 덮인 조건이면 SearchPlanner 가 좁혀 준 ResultPage.
+                  None 이면 현재 페이지를 스냅샷한다.
+        """
+        if page is None:
+            page = self.snapshot_results()
+            self.planner.record(page)
+        self._last_page = page
+        candidates = page.candidates(self.num_trains_to_check)
+        if candidates:
+            logger.debug("검색 결과: " + " | ".join(row.describe() for row in candidates))
+        if len(candidates) < self.num_trains_to_check:
+            logger.warning(f"{len(candidates) + 1}번째 기차 정보를 가져올 수 없습니다")
+
+        for row in candidates:
+            if self.book_ticket(row):
                 return self.driver
 
             if self.want_reserve:
-                if self.reserve_ticket(reservation, i):
+                if self.reserve_ticket(row):
                     return self.driver
 
         return None
@@ -892,28 +1409,72 @@ class SRT:
         "매크로 프로그램 사용",
         "회원 자격상실",
     )
+    _BLOCK_MIN_MATCHES = 2
+
+    # 시그너처 매칭과 요청 ID 추출을 페이지 안에서 수행 — 본문 전체 대신 매칭된 시그너처와
+    # 요청 ID 만 돌려받는다. 시그너처 목록은 클래스 정의 시 한 번 스크립트에 박아 둔다.
+    # (matched, requestId, blocked 변수를 만드는 조각 — 검색 후 통합 probe 에서도 사용)
+    _BLOCK_MATCH_JS = """
+        var text = document.body ? (document.body.innerText || "") : "";
+        var matched = %s.filter(function (sig) { return text.indexOf(sig) !== -1; });
+        var blocked = matched.length >= %d;
+        var idMatch = blocked ? /요청\\s*ID\\s*[:：]?\\s*([\\w-]+)/.exec(text) : null;
+        var requestId = idMatch ? idMatch[1] : null;
+    """ % (json.dumps(_BLOCK_SIGNATURES, ensure_ascii=False), _BLOCK_MIN_MATCHES)
+
+    _BLOCK_PROBE_SCRIPT = _BLOCK_MATCH_JS + """
+        return {matched: matched, request_id: requestId};
+    """
+
+    # 검색 직후 페이지 판별을 WebDriver 왕복 1회로: 차단(block) / 로그인(login) /
+    # 결과 표(results, 행 포함) / 그 밖(error). 열린 alert 은 execute_script 예외로 드러난다.
+    # 페이지 로드 기록(lean.LOAD_RECORDER_SCRIPT)이 남긴 전송량·로드 시간도 같은 왕복으로 읽어 온다 (loads).
+    _PROBE_KINDS = ("results", "block", "login", "error")
+    _POST_SEARCH_PROBE_SCRIPT = _BLOCK_MATCH_JS + TAKE_LOADS_JS + """
+        var url = location.href;
+        if (blocked) {
+            return {kind: 'block', url: url, matched: matched, request_id: requestId, loads: loads};
+        }
+        if (/login|member/i.test(location.pathname) || document.getElementById('srchDvNm01')) {
+            return {kind: 'login', url: url, matched: matched, loads: loads};
+        }
+        if (!document.querySelector('#result-form')) {
+            return {kind: 'error', url: url, matched: matched, loads: loads};
+        }
+        var rows = (function () {""" + _RESULT_TABLE_SCRIPT + """})(arguments[0]);
+        return {kind: 'results', url: url, rows: rows, matched: matched, loads: loads};
+    """
 
+    @timed("detect_blocked_page")
     def _detect_blocked_page(self):
         """현재 페이지가 SRT IP 차단 페이지인지 감지.
 
         검색 결과 페이지 자리에 "접속 제한 안내" 페이지가 떴는지 본문 텍스트로 확인한다.
         감지 시 BlockedByServerError 를 raise — 호출자(check_result)가 즉시 종료시킨다.
+
+        Returns:
+            list: 차단 판정 기준에 못 미친 채 매칭된 시그너처 (스케줄러의 차단 신호)
         """
         try:
-            body_text = self.driver.execute_script("return document.body.innerText") or ""
+            probe = self.driver.execute_script(self._BLOCK_PROBE_SCRIPT)
         except Exception:
-            return
-        if not isinstance(body_text, str):
+            return []
+        if not isinstance(probe, dict) or not isinstance(probe.get("matched"), list):
             # mock 환경 등에서 비정상 반환 시 검사 생략
-            return
+            return []
 
-        matches = [sig for sig in self._BLOCK_SIGNATURES if sig in body_text]
-        if len(matches) < 2:
-            return
+        return self._raise_if_blocked(probe)
 
-        import re
-        m = re.search(r"요청\s*ID\s*[:：]?\s*([\w-]+)", body_text)
-        request_id = m.group(1) if m else "unknown"
+    def _raise_if_blocked(self, probe):
+        """페이지 내 매칭 결과(matched, request_id)가 차단 페이지면 알림 후 BlockedByServerError.
+
+        기준 미만이면 매칭된 시그너처 목록을 돌려준다 (없으면 빈 목록).
+        """
+        matches = [sig for sig in probe.get("matched") or () if sig in self._BLOCK_SIGNATURES]
+        if len(matches) < self._BLOCK_MIN_MATCHES:
+            return matches
+
+        request_id = probe.get("request_id") or "unknown"
 
         logger.error(
             f"🚨 SRT IP 차단 페이지 감지 (요청 ID: {request_id}). "
@@ -941,75 +1502,292 @@ class SRT:
         다중 조건이면 모든 조건을 1회씩 순회 후 대기, 다시 처음부터 반복.
         """
         while True:
-            for condition in self.search_conditions:
-                dpt_dt = condition["dpt_dt"]
-                dpt_tm = condition["dpt_tm"]
+            rotation_started = time.perf_counter()
+            result, search_seconds, errors = self.check_rotation()
+            if result is not None:
+                return result
+
+            # 모든 조건 1회 순회 완료 -- 대기 후 다시 처음부터
+            delay = self._next_delay(search_seconds, errors)
+            self._log_rotation(rotation_started, delay)
+            self.maybe_recycle_browser()
+            METRICS.inc("srt_cycles_total")
+            export_metrics()
+            time.sleep(delay)
+            self.cnt_refresh += 1
+
+    def check_rotation(self):
+        """모든 검색 조건을 1회 순회하며 결과 확인 및 예약 시도 (대기 없음).
+
+        check_result() 의 순회 1회분. 다중 작업 데몬은 작업마다 이것을 번갈아 호출하고
+        대기 시간은 데몬이 정한다.
 
-                logger.info(f"검색 조건: 날짜={dpt_dt}, 시간={dpt_tm}")
+        Returns:
+            tuple: (예약 성공 시 driver 아니면 None, 조회에 걸린 시간 합계(초), 복구 시도 수)
+        """
+        self.planner.start_rotation()
+        if self.page_loads is not None:
+            self.page_loads.start_rotation()
+        search_seconds = 0.0  # 실제 조회(go_search + 페이지 확인)에 걸린 시간 합계
+        recoveries = self.recovery_context.attempts  # 순회 중 네트워크/세션 복구 시도 수 = 순회 후 차이
+        expired = 0  # 순회 중 세션 만료 감지 수
+        for condition in self.search_conditions:
+            dpt_dt = condition["dpt_dt"]
+            dpt_tm = condition["dpt_tm"]
+            started = time.perf_counter()
+            self._last_page = None
+
+            # 같은 날짜의 이전 조회 결과가 이 조건의 상위 열차를 모두 포함하면 조회 생략,
+            # 아니면 다른 작업이 방금 조회한 같은 슬롯의 결과를 쓸 수 있는지 확인
+            covered = self.planner.covered_page(condition)
+            shared = self._shared_page(condition) if covered is None else None
+            source = "coalesced" if covered is not None else "shared" if shared is not None else "query"
+            if covered is not None:
+                logger.debug(f"검색 조건: 날짜={dpt_dt}, 시간={dpt_tm} (이전 조회 결과로 확인)")
+                operation = partial(self._check_result_once, covered)
+            elif shared is not None:
+                logger.debug(f"검색 조건: 날짜={dpt_dt}, 시간={dpt_tm} (다른 작업의 조회 결과로 확인)")
+                self.search_counts["shared"] += 1
+                operation = partial(self._check_result_once, shared)
+            else:
+                logger.debug(f"검색 조건: 날짜={dpt_dt}, 시간={dpt_tm}")
+
+                # 로그인 쿠키 만료가 임박하면 검색이 실패하기 전에 미리 재로그인
+                if self.session_expiry.expires_soon():
+                    self._refresh_expiring_session()
 
                 self.go_search(dpt_dt=dpt_dt, dpt_tm=dpt_tm)
 
-                # 검색 직후 차단 페이지 감지 — 표 파싱 전에 끊는다.
-                # 차단 상태에서 새로고침을 반복하면 회원 자격에 영향이 갈 수 있다.
-                self._detect_blocked_page()
+                # 검색 직후 페이지 종류(차단/로그인/결과 표)와 결과 행을 한 번에 확인.
+                # 차단 상태에서 새로고침을 반복하면 회원 자격에 영향이 갈 수 있으므로
+                # 차단 페이지는 표 파싱 전에 끊는다.
+                probe = self._probe_after_search()
+                kind = probe["kind"] if probe else None
+                if probe and self.page_loads is not None:
+                    self.page_loads.add(probe.get("loads"))
+                if kind in self._PROBE_KINDS:
+                    self._record_page(kind)
+                if kind is None:
+                    # 통합 확인을 쓸 수 없는 드라이버 — 기존의 개별 확인 경로
+                    signals = self._detect_blocked_page()
+                else:
+                    signals = self._raise_if_blocked(probe)
+                if signals and self.scheduler is not None:
+                    self.scheduler.note_block_signal(signals)
+                search_seconds += time.perf_counter() - started
+                if kind in ("login", "alert"):
+                    expired += 1
+                    self._log_condition(condition, source, started, time.perf_counter(), "session_expired")
+                    if kind == "alert":
+                        self.handle_alert()
+                    self._recover_expired_session()
+                    continue  # 현재 조건 건너뛰고 다음 조건으로
+                if kind == "results":
+                    page = self._store_snapshot(probe["rows"])
+                    self.planner.record(page)
+                    operation = self._probed_operation(page)
+                else:
+                    operation = self._check_result_once
+            searched = time.perf_counter()
 
-                try:
-                    result = NetworkErrorRecovery.recover(
-                        operation=self._check_result_once,
-                        context=self.recovery_context,
-                    )
-                    if result is not None:
-                        self._booked_condition = condition
-                        return result
-                except RecoveryError as e:
-                    logger.error(f"네트워크 오류 복구 실패: {e}")
+            try:
+                result = NetworkErrorRecovery.recover(
+                    operation=operation,
+                    context=self.recovery_context,
+                )
+                self._log_condition(condition, source, started, searched,
+                                    "none" if result is None else "booked")
+                if result is not None:
+                    self._booked_condition = condition
+                    return result, search_seconds, self.recovery_context.attempts - recoveries + expired
+            except RecoveryError as e:
+                logger.error(f"네트워크 오류 복구 실패: {e}")
+                raise
+            except Exception as e:
+                if SessionRecovery.is_session_expired(self.driver):
+                    expired += 1
+                    self._log_condition(condition, source, started, searched, "session_expired")
+                    self._recover_expired_session()
+                    continue  # 현재 조건 건너뛰고 다음 조건으로
+                else:
                     raise
-                except Exception as e:
-                    if SessionRecovery.is_session_expired(self.driver):
-                        logger.warning("세션 만료 감지. 재로그인 시도...")
-                        try:
-                            SessionRecovery.recover(
-                                driver=self.driver,
-                                srt_instance=self,
-                                context=self.recovery_context,
-                            )
-                            continue  # 현재 조건 건너뛰고 다음 조건으로
-                        except RecoveryError as recovery_err:
-                            logger.error(f"세션 복구 실패: {recovery_err}")
-                            raise
-                    else:
-                        raise
 
-            if self.is_booked:
-                return self.driver
+        errors = self.recovery_context.attempts - recoveries + expired
+        if self.is_booked:
+            return self.driver, search_seconds, errors
+
+        self.search_counts["coalesced"] += self.planner.saved
+        return None, search_seconds, errors
+
+    def _next_delay(self, search_seconds, errors):
+        """순회 후 대기 시간(초). 스케줄러가 없으면 retry_delay_min~retry_delay_max 균등 난수."""
+        if self.scheduler is None:
+            return randint(self.retry_delay_min, self.retry_delay_max)
+        sent = REQUEST_BUDGET.total
+        requests, self._requests_seen = sent - self._requests_seen, sent
+        self.scheduler.record_rotation(self.planner.queries, search_seconds, errors, requests=requests)
+        return self.scheduler.next_delay(len(self.search_conditions))
+
+    def _record_page(self, kind):
+        """record_pages 가 켜져 있으면 현재 페이지를 kind 로 녹화 (실패는 무시)"""
+        if self.recorder is None:
+            return
+        try:
+            html = self.driver.page_source
+            url = self.driver.current_url
+        except WebDriverException as e:
+            logger.debug(f"페이지 녹화 생략 ({kind}): {e}")
+            return
+        self.recorder.record(kind, html, url, self._searched_condition)
 
-            # 모든 조건 1회 순회 완료 -- 대기 후 다시 처음부터
-            delay = randint(self.retry_delay_min, self.retry_delay_max)
-            logger.info(f"모든 조건 확인 완료. {delay}초 대기 후 다시 처음부터 검색...")
-            time.sleep(delay)
-            self.cnt_refresh += 1
+    def _probed_operation(self, page):
+        """첫 시도는 probe 로 읽은 결과를 쓰고, 네트워크 복구 후 재시도는 페이지를 다시 읽는 operation"""
+        pending = [page]
 
-    def run(self, login_id, login_psw):
+        def operation():
+            return self._check_result_once(pending.pop() if pending else None)
+        return operation
+
+    def _recover_expired_session(self):
+        """세션 만료 시 조회 캐시를 버리고 재로그인 (실패하면 RecoveryError 전파)"""
+        logger.warning("세션 만료 감지. 재로그인 시도...")
+        self._leave_results_page()
+        try:
+            SessionRecovery.recover(
+                driver=self.driver,
+                srt_instance=self,
+                context=self.recovery_context,
+            )
+        except RecoveryError as recovery_err:
+            logger.error(f"세션 복구 실패: {recovery_err}")
+            raise
+
+    def _refresh_expiring_session(self):
+        """쿠키 만료 직전 선제 재로그인. 재로그인 후에도 만료 시각이 그대로면 추적을 멈춘다."""
+        logger.info(f"로그인 쿠키 만료 임박 ({self.session_expiry.seconds_left():.0f}초 남음). 미리 재로그인합니다")
+        METRICS.inc("srt_session_refreshes_total")
+        self._recover_expired_session()
+        if self.session_expiry.expires_soon():
+            logger.warning("재로그인 후에도 쿠키 만료 시각이 갱신되지 않아 선제 재로그인을 중단합니다")
+            self.session_expiry.clear()
+
+    _OUTCOME_TEXT = {
+        "none": "예약 가능 없음",
+        "booked": "예약 완료",
+        "session_expired": "세션 만료",
+    }
+
+    _SOURCE_TEXT = {
+        "query": "",
+        "coalesced": " (이전 조회 결과로 확인)",
+        "shared": " (다른 작업의 조회 결과로 확인)",
+    }
+
+    def _log_condition(self, condition, source, started, searched, outcome):
+        """검색 조건 1건의 결과를 로그 레코드 1개로 남긴다.
+
+        source 는 결과 출처: query(직접 조회) / coalesced(이전 조회 결과) / shared(다른 작업의 조회 결과).
+
+        텍스트 로그에는 한 줄 요약이, JSON 로그(--log-format json)에는 extra 의
+        fields(소요시간, 상위 열차 상태, 결과)가 그대로 기록된다.
         """
-        SRT 예약 프로세스 실행
-        :param login_id: 로그인 ID
-        :param login_psw: 로그인 비밀번호
+        finished = time.perf_counter()
+        METRICS.inc("srt_conditions_total", outcome=outcome)
+        page = self._last_page
+        rows = page.candidates(self.num_trains_to_check) if isinstance(page, ResultPage) else ()
+        fields = {
+            "event": "condition",
+            "rotation": self.cnt_refresh + 1,
+            "dpt_dt": condition["dpt_dt"],
+            "dpt_tm": condition["dpt_tm"],
+            "source": source,
+            "search_ms": round((searched - started) * 1000, 1),
+            "check_ms": round((finished - searched) * 1000, 1),
+            "rows": [row.to_record() for row in rows],
+            "outcome": outcome,
+        }
+        logger.info(
+            f"검색 조건: 날짜={condition['dpt_dt']}, 시간={condition['dpt_tm']}"
+            f"{self._SOURCE_TEXT[source]} — {self._OUTCOME_TEXT[outcome]}, "
+            f"열차 {len(rows)}개 (조회 {fields['search_ms']:.0f}ms, 확인 {fields['check_ms']:.0f}ms)",
+            extra={"fields": fields},
+        )
+
+    def _log_rotation(self, rotation_started, delay):
+        """조건 전체 1회 순회 요약 레코드"""
+        elapsed = time.perf_counter() - rotation_started
+        fields = {
+            "event": "rotation",
+            "rotation": self.cnt_refresh + 1,
+            "conditions": len(self.search_conditions),
+            "queries": self.planner.queries,
+            "coalesced": self.planner.saved,
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "delay_s": delay,
+        }
+        coalesced = f", 이전 결과로 확인 {self.planner.saved}회" if self.planner.saved else ""
+        loads = self.page_loads.summary() if self.page_loads is not None else None
+        if loads:
+            fields.update(pages_loaded=self.page_loads.pages, transfer_bytes=self.page_loads.bytes,
+                          page_load_ms=round(self.page_loads.load_ms, 1))
+        logger.info(
+            f"모든 조건 확인 완료 (조건 {len(self.search_conditions)}개, 조회 {self.planner.queries}회"
+            f"{coalesced}{f', {loads}' if loads else ''}, {elapsed:.1f}초). {delay}초 대기 후 다시 처음부터 검색...",
+            extra={"fields": fields},
+        )
+
+    def maybe_recycle_browser(self):
+        """순회 사이(대기 전)에 호출: 브라우저 메모리가 한도를 넘었으면 recycle_browser().
+
+        Returns:
+            bool: 브라우저를 교체했으면 True
+        """
+        if not self.memory_watchdog.over_limit(self.driver):
+            return False
+        logger.info(f"브라우저 메모리 {self.memory_watchdog.last_rss_mb:.0f}MB ≥ 한도 "
+                    f"{self.memory_watchdog.limit_mb:.0f}MB. 로그인 쿠키를 유지한 채 브라우저를 교체합니다")
+        self.recycle_browser()
+        return True
+
+    @timed("recycle_browser")
+    def recycle_browser(self):
+        """계획된 브라우저 교체: 현재 쿠키를 들고 새 브라우저(예비가 있으면 예비)로 옮겨 로그인 생략.
+
+        쿠키로 로그인 상태를 되살리지 못하면 sign_in() 으로 로그인한다. 새 브라우저를 띄우지 못하면
+        크래시 복구(BrowserRecovery) 경로로 넘긴다 (실패 시 RecoveryError).
         """
+        try:
+            cookies = self.driver.get_cookies()
+        except WebDriverException as e:
+            logger.debug(f"교체 전 쿠키 조회 실패 (교체 후 로그인): {e}")
+            cookies = []
+        if cookies and self.session_cache is not None:
+            self.session_cache.save(cookies)
+
+        self._leave_results_page()
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
         try:
             self.run_driver()
-            self.set_log_info(login_id, login_psw)
+            if not (cookies and self._resume_session(cookies)):
+                self.sign_in()
+        except BlockedByServerError:
+            raise
+        except Exception as e:
+            logger.warning(f"브라우저 교체 실패 ({e}). 크래시 복구 경로로 다시 띄웁니다")
+            BrowserRecovery.recover(driver=self.driver, srt_instance=self, context=self.recovery_context)
+        self.memory_watchdog.record_recycle()
+        logger.info(f"브라우저 교체 완료 (누적 {self.memory_watchdog.recycles}회)")
+
+    def sign_in(self):
+        """저장된 세션 쿠키 복원, 안 되면 로그인 (실패 시 Exception)"""
+        # 저장된 세션 쿠키가 유효하면 로그인 과정 전체를 생략
+        if not self.restore_session():
             self.login()
-            
-            # 로그인 확인 (여러 번 시도)
-            login_success = False
-            for attempt in range(3):
-                time.sleep(2)  # 페이지 로딩 대기
-                if self.check_login():
-                    login_success = True
-                    break
-                logger.info(f"로그인 확인 재시도 {attempt + 1}/3")
-            
-            if not login_success:
+
+            if not self.confirm_login():
                 logger.error("로그인 실패")
                 # 현재 페이지 정보 출력 (디버깅용)
                 try:
@@ -1018,26 +1796,50 @@ class SRT:
                 except:
                     pass
                 raise Exception("로그인에 실패했습니다.")
-            logger.info("로그인 성공")
+        logger.info("로그인 성공")
+
+    def report_booking(self, job=None):
+        """예약 성공 요약을 로그로 남기고 알림 발송 (job: 다중 작업 데몬의 작업 이름)"""
+        logger.info("=" * 60)
+        logger.info(f"예약 성공! ({job})" if job else "예약 성공!")
+        logger.info(f"  출발역: {self.dpt_stn}")
+        logger.info(f"  도착역: {self.arr_stn}")
+        condition = self._booked_condition
+        row = self._booked_row
+        logger.info(f"  날짜: {condition.get('dpt_dt', 'N/A')}")
+        logger.info(f"  시간: {condition.get('dpt_tm', 'N/A')}시 이후")
+        if row is not None:
+            logger.info(f"  열차: {row.train_no} ({row.dpt_time}→{row.arr_time})")
+        logger.info(f"  새로고침 횟수: {self.cnt_refresh}")
+        logger.info("=" * 60)
+        train_info = {
+            "dept_time": row.dpt_time if row else condition.get('dpt_tm', 'N/A'),
+            "arri_time": (row.arr_time or "N/A") if row else "N/A",
+            "seat_type": self._booked_seat_type or "일반석",
+        }
+        if job:
+            train_info["job"] = job
+        self.notifier.notify_success(train_info)
+
+    def run(self, login_id, login_psw):
+        """
+        SRT 예약 프로세스 실행
+        :param login_id: 로그인 ID
+        :param login_psw: 로그인 비밀번호
+        """
+        try:
+            self.run_driver()
+            self.set_log_info(login_id, login_psw)
+            self.sign_in()
+
+            # 크래시 복구용 예비 브라우저 준비 (standby_memory_mb > 0 일 때만)
+            self.standby.prepare()
 
             # go_search()는 check_result() 내부에서 조건별로 호출됨
             self.check_result()
 
             if self.is_booked:
-                logger.info("=" * 60)
-                logger.info("예약 성공!")
-                logger.info(f"  출발역: {self.dpt_stn}")
-                logger.info(f"  도착역: {self.arr_stn}")
-                condition = self._booked_condition
-                logger.info(f"  날짜: {condition.get('dpt_dt', 'N/A')}")
-                logger.info(f"  시간: {condition.get('dpt_tm', 'N/A')}시 이후")
-                logger.info(f"  새로고침 횟수: {self.cnt_refresh}")
-                logger.info("=" * 60)
-                self.notifier.notify_success({
-                    "dept_time": condition.get('dpt_tm', 'N/A'),
-                    "arri_time": "N/A",
-                    "seat_type": "일반석",
-                })
+                self.report_booking()
             else:
                 logger.warning("예약을 완료하지 못했습니다.")
 
@@ -1067,6 +1869,10 @@ class SRT:
                 self.notifier.notify_failure(str(e))
             raise
         finally:
+            # 예비 브라우저는 모드와 관계없이 정리 (결제용으로 남기는 것은 현재 브라우저뿐)
+            self.standby.close()
+            # 예약 성공/실패 알림이 전달된 뒤 종료되도록 대기 (시간 제한 있음)
+            self.notifier.flush(self.notifier.FLUSH_TIMEOUT)
             if self.headless:
                 self.close_driver()
 
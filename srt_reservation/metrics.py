@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+단계별 소요시간 / 카운터 계측 (Prometheus 텍스트 형식)
+
+run_driver, login, go_search 같은 단계의 소요시간을 히스토그램으로, 순회·새로고침·
+복구 횟수를 카운터로 모아 로컬 /metrics HTTP 엔드포인트나 node-exporter textfile
+collector 용 파일로 내보냅니다.
+
+프로세스 전체가 하나의 레지스트리(METRICS)를 공유합니다. configure() 로 켜기 전에는
+span()/inc()/observe() 가 enabled 플래그만 보고 바로 반환하므로 비용이 거의 없습니다.
+
+사용 예:
+    from srt_reservation.metrics import METRICS, configure, timed
+
+    configure(port=9108)                      # http://127.0.0.1:9108/metrics
+    configure(textfile="/var/lib/node_exporter/srt.prom")
+
+    @timed("go_search")
+    def go_search(self): ...
+
+    with METRICS.span("page_load"):
+        ...
+    METRICS.inc("srt_recoveries_total", error_type="network")
+"""
+import functools
+import logging
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger('srt')
+
+# 초 단위 히스토그램 버킷 (DOM 대기 수십 ms ~ 브라우저 기동/복구 수십 초)
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+PHASE_HISTOGRAM = "srt_phase_seconds"
+
+_HELP = {
+    PHASE_HISTOGRAM: "단계별 소요시간(초)",
+    "srt_cycles_total": "조건 전체 순회 횟수",
+    "srt_refreshes_total": "검색 결과 새로고침 횟수",
+    "srt_conditions_total": "검색 조건 확인 횟수 (결과별)",
+    "srt_recoveries_total": "에러 복구 시도 횟수 (ErrorType 별)",
+    "srt_session_refreshes_total": "쿠키 만료 임박으로 미리 재로그인한 횟수",
+    "srt_requests_total": "서버로 보낸 요청 수 (종류별)",
+    "srt_budget_wait_seconds_total": "요청 예산 소진으로 대기한 시간 합계(초)",
+    "srt_budget_tokens": "요청 예산 잔여 토큰",
+    "srt_jobs_pending": "다중 작업 데몬에서 아직 예약하지 못한 작업 수",
+    "srt_shared_results_total": "다른 작업의 조회 결과로 확인해 생략한 조회 수",
+    "srt_browser_rss_mb": "브라우저 프로세스 트리 RSS(MB, 순회 사이 측정)",
+    "srt_browser_recycles_total": "메모리 한도 초과로 계획된 브라우저 교체 횟수",
+    "srt_page_bytes_total": "브라우저가 페이지 로드에 받은 바이트 (--lean-loading 사용 시 집계)",
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class _NoopSpan:
+    """비활성 상태에서 span() 이 돌려주는 공유 객체"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("_registry", "_phase", "_start")
+
+    def __init__(self, registry: "Metrics", phase: str):
+        self._registry = registry
+        self._phase = phase
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._registry.observe(self._phase, time.perf_counter() - self._start)
+        return False
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class Metrics:
+    """단계 히스토그램 + 카운터 + 게이지 레지스트리"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.enabled = False
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, _Histogram] = {}
+        self._counters: Dict[Tuple[str, LabelKey], float] = {}
+        self._gauges: Dict[Tuple[str, LabelKey], float] = {}
+
+    def span(self, phase: str):
+        """with 블록 소요시간을 phase 히스토그램에 기록 (비활성이면 no-op)"""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, phase)
+
+    def observe(self, phase: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            hist = self._histograms.get(phase)
+            if hist is None:
+                hist = self._histograms[phase] = _Histogram(len(self.buckets))
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    hist.counts[i] += 1
+            hist.sum += seconds
+            hist.count += 1
+
+    def inc(self, name: str, by: float = 1, **labels: str) -> None:
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + by
+
+    def set(self, name: str, value: float, **labels: str) -> None:
+        """게이지 값 설정"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def gauge(self, name: str, **labels: str) -> Optional[float]:
+        return self._gauges.get((name, tuple(sorted(labels.items()))))
+
+    def counter(self, name: str, **labels: str) -> float:
+        return self._counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def histogram(self, phase: str) -> Optional[Tuple[int, float]]:
+        """(관측 수, 합계 초). 관측이 없으면 None."""
+        hist = self._histograms.get(phase)
+        return (hist.count, hist.sum) if hist else None
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식 (text/plain; version=0.0.4)"""
+        with self._lock:
+            histograms = {phase: (list(h.counts), h.sum, h.count) for phase, h in self._histograms.items()}
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+
+        lines = []
+        if histograms:
+            lines.append(f"# HELP {PHASE_HISTOGRAM} {_HELP[PHASE_HISTOGRAM]}")
+            lines.append(f"# TYPE {PHASE_HISTOGRAM} histogram")
+            for phase in sorted(histograms):
+                counts, total, count = histograms[phase]
+                for bound, n in zip(self.buckets, counts):
+                    lines.append(f'{PHASE_HISTOGRAM}_bucket{{phase="{phase}",le="{bound:g}"}} {n}')
+                lines.append(f'{PHASE_HISTOGRAM}_bucket{{phase="{phase}",le="+Inf"}} {count}')
+                lines.append(f'{PHASE_HISTOGRAM}_sum{{phase="{phase}"}} {total:.6f}')
+                lines.append(f'{PHASE_HISTOGRAM}_count{{phase="{phase}"}} {count}')
+
+        _render_series(lines, "counter", counters)
+        _render_series(lines, "gauge", gauges)
+        return "\n".join(lines) + "\n"
+
+
+def _render_series(lines: list, kind: str, series: Dict[Tuple[str, LabelKey], float]) -> None:
+    for name in sorted({name for name, _ in series}):
+        if name in _HELP:
+            lines.append(f"# HELP {name} {_HELP[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+        for (metric, labels), value in sorted(series.items()):
+            if metric != name:
+                continue
+            label_text = ",".join(f'{k}="{v}"' for k, v in labels)
+            lines.append(f"{name}{{{label_text}}} {value:g}" if label_text else f"{name} {value:g}")
+
+
+METRICS = Metrics()
+
+_textfile: Optional[str] = None
+_server: Optional[ThreadingHTTPServer] = None
+
+
+def timed(phase: str):
+    """메서드/함수 소요시간을 phase 히스토그램에 기록하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not METRICS.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                METRICS.observe(phase, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = METRICS.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def configure(port: int = 0, textfile: Optional[str] = None, host: str = "127.0.0.1") -> bool:
+    """계측을 켜고 내보내기 방식을 설정한다. port 와 textfile 이 모두 없으면 꺼진 채로 둔다.
+
+    Args:
+        port: /metrics 를 서비스할 로컬 포트 (0 이면 HTTP 엔드포인트 없음)
+        textfile: node-exporter textfile collector 용 .prom 파일 경로 (export() 때마다 갱신)
+        host: 바인드 주소 (기본 로컬 전용)
+
+    Returns:
+        bool: 계측이 켜졌으면 True
+    """
+    global _textfile, _server
+
+    _textfile = textfile or None
+    if port and _server is None:
+        try:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        except OSError as e:
+            logger.warning(f"메트릭 엔드포인트를 열 수 없습니다 ({host}:{port}): {e}")
+        else:
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="srt-metrics", daemon=True).start()
+            logger.info(f"메트릭 엔드포인트: http://{host}:{_server.server_address[1]}/metrics")
+
+    METRICS.enabled = bool(_server or _textfile)
+    return METRICS.enabled
+
+
+def export() -> None:
+    """textfile 이 설정되어 있으면 현재 값을 원자적으로 기록 (순회마다 호출)"""
+    if not METRICS.enabled or not _textfile:
+        return
+    directory = os.path.dirname(os.path.abspath(_textfile))
+    tmp_path = None
+    try:
+        # node-exporter 가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 rename
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".srt-metrics", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(METRICS.render())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, _textfile)
+    except OSError as e:
+        logger.warning(f"메트릭 파일 기록 실패: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def shutdown() -> None:
+    """HTTP 엔드포인트를 닫고 계측을 끈다 (마지막 값은 textfile 에 기록)."""
+    global _server, _textfile
+
+    export()
+    server, _server = _server, None
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+    _textfile = None
+    METRICS.enabled = False
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+검색 결과 모델
+
+검색 1회당 한 번 파싱한 결과 표를 예약, 예약대기, 로깅, 알림이 함께 사용하도록
+가볍고 불변인 타입으로 표현합니다. 링크 요소(WebElement)를 떼어낸 사본은
+여러 사이클의 이력을 메모리에 저렴하게 보관하는 데 사용합니다.
+"""
+import time
+from typing import Any, Iterator, NamedTuple, Optional, Tuple
+
+
+class SeatCell(NamedTuple):
+    """결과 표의 좌석 칸 (특실/일반실/예약대기)"""
+
+    text: str
+    has_link: bool
+    link: Any = None  # 스냅샷 시점의 WebElement. 페이지가 바뀌면 무효
+
+    @classmethod
+    def from_snapshot(cls, raw: Any) -> "SeatCell":
+        if not isinstance(raw, dict):
+            return EMPTY_SEAT
+        return cls(str(raw.get("text") or ""), bool(raw.get("has_link")), raw.get("link"))
+
+
+EMPTY_SEAT = SeatCell("", False, None)
+
+
+class TrainRow(NamedTuple):
+    """결과 표 한 행 (열차 1편)"""
+
+    index: int        # 표에서의 행 번호 (1부터)
+    train_no: str
+    dpt_time: str     # HH:MM
+    arr_time: str     # HH:MM
+    special: SeatCell
+    standard: SeatCell
+    waitlist: SeatCell
+
+    @classmethod
+    def from_snapshot(cls, raw: dict) -> "TrainRow":
+        return cls(
+            index=int(raw.get("index") or 0),
+            train_no=str(raw.get("train_no") or ""),
+            dpt_time=str(raw.get("dpt_time") or ""),
+            arr_time=str(raw.get("arr_time") or ""),
+            special=SeatCell.from_snapshot(raw.get("special")),
+            standard=SeatCell.from_snapshot(raw.get("standard")),
+            waitlist=SeatCell.from_snapshot(raw.get("waitlist")),
+        )
+
+    @property
+    def can_book(self) -> bool:
+        """일반실 예약하기 가능 여부"""
+        return "예약하기" in self.standard.text
+
+    @property
+    def can_waitlist(self) -> bool:
+        """예약대기 신청하기 가능 여부"""
+        return "신청하기" in self.waitlist.text
+
+    def without_links(self) -> "TrainRow":
+        """WebElement 참조를 제거한 사본 (이력 보관용)"""
+        return self._replace(
+            special=self.special._replace(link=None),
+            standard=self.standard._replace(link=None),
+            waitlist=self.waitlist._replace(link=None),
+        )
+
+    def to_record(self) -> dict:
+        """구조화 로그용 dict (링크 제외)"""
+        return {
+            "train_no": self.train_no,
+            "dpt_time": self.dpt_time,
+            "arr_time": self.arr_time,
+            "special": self.special.text,
+            "standard": self.standard.text,
+            "waitlist": self.waitlist.text,
+        }
+
+    def describe(self) -> str:
+        """로그용 한 줄 요약 ex) 301 08:00→10:35 일반:매진 대기:신청하기"""
+        return (
+            f"{self.train_no} {self.dpt_time}→{self.arr_time} "
+            f"일반:{self.standard.text or '-'} 대기:{self.waitlist.text or '-'}"
+        )
+
+
+class ResultPage:
+    """검색 1회의 결과 표 (검색 조건 + 행 목록)"""
+
+    __slots__ = ("dpt_dt", "dpt_tm", "rows", "fetched_at")
+
+    def __init__(self, dpt_dt: str, dpt_tm: str, rows: Tuple[TrainRow, ...], fetched_at: Optional[float] = None):
+        self.dpt_dt = dpt_dt
+        self.dpt_tm = dpt_tm
+        self.rows = tuple(rows)
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+
+    @classmethod
+    def from_snapshot(cls, raw_rows: Any, dpt_dt: str, dpt_tm: str) -> "ResultPage":
+        """snapshot 스크립트가 돌려준 dict 목록으로 ResultPage를 만든다."""
+        if not isinstance(raw_rows, list):
+            raw_rows = []
+        rows = tuple(TrainRow.from_snapshot(raw) for raw in raw_rows if isinstance(raw, dict))
+        return cls(dpt_dt, dpt_tm, rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[TrainRow]:
+        return iter(self.rows)
+
+    def __repr__(self) -> str:
+        return f"ResultPage(dpt_dt={self.dpt_dt!r}, dpt_tm={self.dpt_tm!r}, rows={len(self.rows)})"
+
+    def candidates(self, num: int) -> Tuple[TrainRow, ...]:
+        """예약 확인 대상인 상위 num개 행"""
+        return self.rows[:num]
+
+    def departing_from(self, dpt_tm: str) -> "ResultPage":
+        """dpt_tm 시 이후 출발 행만 남긴 사본 (같은 날짜의 뒤 시간대 조건 확인용)"""
+        start = f"{int(dpt_tm):02d}:00"
+        rows = tuple(row for row in self.rows if row.dpt_time and row.dpt_time.zfill(5) >= start)
+        return ResultPage(self.dpt_dt, dpt_tm, rows, self.fetched_at)
+
+    def without_links(self) -> "ResultPage":
+        """WebElement 참조를 제거한 사본 (이력 보관용)"""
+        return ResultPage(self.dpt_dt, self.dpt_tm, tuple(row.without_links() for row in self.rows), self.fetched_at)
@@ -1,14 +1,233 @@
 # -*- coding: utf-8 -*-
-import urllib.request
 import urllib.parse
-import urllib.error
+import atexit
+import http.client
 import json
 import logging
 import os
+import queue
+import threading
+import time
 from pathlib import Path
+from typing import Callable, Dict, List
 
 logger = logging.getLogger(__name__)
 
+_ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
+
+
+class EnvFileLoader:
+    """.env 파일이 바뀐 경우에만 다시 파싱하는 로더.
+
+    (inode, mtime_ns, size) 서명을 기억해 두고 같으면 stat 1회로 끝낸다. 편집기가
+    임시 파일을 rename 해 저장하는 경우에도 inode 가 바뀌므로 변경을 놓치지 않는다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._signature = None
+        self.loads = 0  # 실제로 파싱한 횟수
+
+    def refresh(self) -> bool:
+        """파일이 바뀌었으면 override=False 로 환경변수에 반영. 다시 읽었으면 True."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            self._signature = None
+            return False
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if signature == self._signature:
+            return False
+        from dotenv import load_dotenv
+        load_dotenv(self.path, override=False)
+        self._signature = signature
+        self.loads += 1
+        return True
+
+
+# load_dotenv 는 프로세스 전체 환경변수를 바꾸므로 인스턴스가 아니라 모듈 단위로 공유
+_env_loader = EnvFileLoader(_ENV_PATH)
+
+
+class KeepAliveTransport:
+    """HTTP/1.1 keep-alive 연결을 재사용하는 폼 POST 전송기 (http.client 기반).
+
+    매 요청마다 DNS·TCP·TLS 핸드셰이크를 하지 않도록 유휴 연결을 최대 MAX_IDLE 개까지
+    보관해 재사용한다. 재사용한 연결이 서버 쪽에서 이미 끊겨 있으면 새 연결로 1회 재시도한다.
+    """
+
+    MAX_IDLE = 2
+
+    # 재사용 연결이 끊겨 있을 때 나는 오류 — 요청이 서버에 도달하지 않았으므로 재시도해도 안전
+    _STALE_ERRORS = (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                     BrokenPipeError, ConnectionResetError, ConnectionAbortedError)
+
+    def __init__(self, base_url: str, timeout: float = 5):
+        parsed = urllib.parse.urlsplit(base_url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise ValueError(f"지원하지 않는 URL: {base_url}")
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname
+        self.port = parsed.port
+        self.prefix = parsed.path.rstrip("/")
+        self.timeout = timeout
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def post_form(self, path: str, fields: Dict[str, str]) -> int:
+        """application/x-www-form-urlencoded POST 후 HTTP 상태 코드를 반환.
+
+        연결/프로토콜 오류는 OSError, http.client.HTTPException 으로 전파된다.
+        """
+        body = urllib.parse.urlencode(fields).encode("utf-8")
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        conn, reused = self._acquire()
+        try:
+            response = self._request(conn, self.prefix + path, body, headers)
+        except self._STALE_ERRORS:
+            conn.close()
+            if not reused:
+                raise
+            conn, reused = self._new_connection(), False
+            try:
+                response = self._request(conn, self.prefix + path, body, headers)
+            except BaseException:
+                conn.close()
+                raise
+        except BaseException:
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+        return response.status
+
+    @staticmethod
+    def _request(conn, path, body, headers):
+        conn.request("POST", path, body=body, headers=headers)
+        response = conn.getresponse()
+        response.read()  # 본문을 끝까지 읽어야 같은 연결로 다음 요청 가능
+        return response
+
+    def _acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return self._new_connection(), False
+
+    def _release(self, conn) -> None:
+        with self._lock:
+            if len(self._idle) < self.MAX_IDLE:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def _new_connection(self):
+        self.connections_opened += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def close(self) -> None:
+        """유휴 연결을 모두 닫는다."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class NotificationDispatcher:
+    """백그라운드 알림 발송기.
+
+    submit() 은 메시지를 크기 제한 큐에 넣고 즉시 반환하며, 워커 스레드가 순서대로
+    발송한다. 실패하면 지수 백오프로 재시도하고, 프로세스 종료 시(atexit) 남은 메시지를
+    EXIT_FLUSH_TIMEOUT 까지 마저 보낸다. 큐가 가득 차면 가장 오래된 메시지를 버린다.
+    """
+
+    MAX_QUEUE = 100
+    MAX_ATTEMPTS = 3
+    BACKOFF_BASE = 1.0  # 초. 재시도 간격 1, 2, 4 ...
+    EXIT_FLUSH_TIMEOUT = 10.0
+
+    def __init__(self, send: Callable[[str], bool], maxsize: int = MAX_QUEUE,
+                 max_attempts: int = MAX_ATTEMPTS, backoff_base: float = BACKOFF_BASE):
+        self._send = send
+        self._queue: "queue.Queue[str]" = queue.Queue(maxsize=maxsize)
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self._lock = threading.Lock()
+        self._worker = None
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+
+    def submit(self, message: str) -> bool:
+        """메시지를 발송 큐에 넣는다 (블로킹 없음). 넣었으면 True."""
+        self._ensure_worker()
+        while True:
+            try:
+                self._queue.put_nowait(message)
+                return True
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                    self.dropped += 1
+                    logger.warning("[Telegram] 알림 큐가 가득 차 가장 오래된 메시지를 버립니다")
+                except queue.Empty:
+                    pass
+
+    def flush(self, timeout: float = None) -> bool:
+        """큐의 메시지가 모두 처리될 때까지 대기. 시간 내 비우면 True."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def pending(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            first_start = self._worker is None
+            self._worker = threading.Thread(target=self._run, name="telegram-notifier", daemon=True)
+            self._worker.start()
+        if first_start:
+            atexit.register(self._flush_at_exit)
+
+    def _run(self) -> None:
+        while True:
+            message = self._queue.get()
+            try:
+                self._deliver(message)
+            except Exception as e:  # 워커는 어떤 경우에도 죽지 않는다
+                logger.warning(f"[Telegram] 알림 워커 오류: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _deliver(self, message: str) -> None:
+        for attempt in range(1, self.max_attempts + 1):
+            if self._send(message):
+                self.sent += 1
+                return
+            if attempt < self.max_attempts:
+                time.sleep(self.backoff_base * (2 ** (attempt - 1)))
+        self.failed += 1
+        logger.warning(f"[Telegram] {self.max_attempts}회 시도 후 발송 실패 — 메시지를 버립니다")
+
+    def _flush_at_exit(self) -> None:
+        if self.pending() and not self.flush(self.EXIT_FLUSH_TIMEOUT):
+            logger.warning(f"[Telegram] 종료 시 미발송 알림 {self.pending()}건")
+
 
 class TelegramNotifier:
     """Telegram Bot API를 통한 알림 발송 클래스.
@@ -16,25 +235,37 @@ class TelegramNotifier:
     환경변수 TELEGRAM_TOKEN, TELEGRAM_CHAT_ID 설정 시 활성화됩니다.
     발송 실패 시에도 예외를 전파하지 않으므로 예약 프로세스에 영향을 주지 않습니다.
 
-    is_configured() 호출 시마다 .env 파일을 다시 읽어 토큰/chat_id 변경을 hot-reload 합니다.
-    백그라운드 실행 중에 chat_id를 추가해도 즉시 반영됩니다.
+    is_configured() 호출 시마다 .env 파일 변경 여부를 확인해 토큰/chat_id 변경을 hot-reload 합니다.
+    백그라운드 실행 중에 chat_id를 추가해도 즉시 반영되며, 파일이 그대로면 다시 파싱하지 않습니다.
+
+    background=True 이면 send_message() 가 NotificationDispatcher 큐에 넣고 바로 반환하여
+    느린 Telegram API 가 예약 흐름을 멈추지 않습니다 (반환값은 큐 등록 여부).
     """
 
-    def __init__(self) -> None:
+    API_BASE = "https://api.telegram.org"
+    REQUEST_TIMEOUT = 5
+    # run() 종료 시 대기 중인 알림을 기다리는 최대 시간(초)
+    FLUSH_TIMEOUT = 10.0
+
+    def __init__(self, background: bool = False, api_base: str = None) -> None:
+        """
+        :param background: True 면 send_message() 가 큐에 넣고 즉시 반환
+        :param api_base: Bot API 주소 (테스트용 로컬 스탠드인). 기본 API_BASE
+        """
         self._reload_env()
+        # 연결을 재사용해 연속 알림(차단 감지 → 실패 알림)의 핸드셰이크 비용을 없앤다
+        self._transport = KeepAliveTransport(api_base or self.API_BASE, timeout=self.REQUEST_TIMEOUT)
+        self._dispatcher = NotificationDispatcher(lambda m: self._send_now(m)) if background else None
 
     def _reload_env(self) -> None:
-        """프로젝트 루트의 .env를 다시 읽어 토큰/chat_id를 갱신한다.
+        """프로젝트 루트의 .env가 바뀌었으면 다시 읽고 토큰/chat_id를 갱신한다.
 
         override=False 이므로 이미 환경변수에 값이 있으면 덮어쓰지 않는다.
         pytest 실행 중에는 환경변수 모킹을 보호하기 위해 .env 로드를 건너뛴다.
         """
         if not os.environ.get("PYTEST_CURRENT_TEST"):
             try:
-                env_path = Path(__file__).resolve().parent.parent / ".env"
-                if env_path.exists():
-                    from dotenv import load_dotenv
-                    load_dotenv(env_path, override=False)
+                _env_loader.refresh()
             except Exception as e:
                 logger.debug(f"[Telegram] .env 재로딩 실패: {e}")
         self.token: str | None = os.environ.get("TELEGRAM_TOKEN")
@@ -57,29 +288,35 @@ class TelegramNotifier:
             logger.debug("[Telegram] 미설정 상태 — 메시지 발송 생략")
             return False
 
+        if self._dispatcher is not None:
+            return self._dispatcher.submit(message)
+        return self._send_now(message)
+
+    def flush(self, timeout: float = None) -> bool:
+        """백그라운드 모드에서 대기 중인 알림을 모두 보낼 때까지 대기 (동기 모드는 즉시 True)"""
+        if self._dispatcher is None:
+            return True
+        return self._dispatcher.flush(timeout)
+
+    def _send_now(self, message: str) -> bool:
+        """Telegram API 호출 1회 (timeout 5초, keep-alive 연결 재사용)"""
         try:
-            url = f"https://api.telegram.org/bot{self.token}/sendMessage"
-            data = urllib.parse.urlencode(
+            status = self._transport.post_form(
+                f"/bot{self.token}/sendMessage",
                 {
                     "chat_id": self.chat_id,
                     "text": message,
-                }
-            ).encode("utf-8")
-
-            req = urllib.request.Request(url, data=data)
-            with urllib.request.urlopen(req, timeout=5) as response:
-                if response.status == 200:
-                    logger.debug("[Telegram] 메시지 발송 성공")
-                    return True
+                },
+            )
+            if status == 200:
+                logger.debug("[Telegram] 메시지 발송 성공")
+                return True
 
-            logger.warning("[Telegram] API 응답 오류")
+            logger.warning(f"[Telegram] API 응답 오류: HTTP {status}")
             return False
 
-        except urllib.error.HTTPError as e:
-            logger.warning(f"[Telegram] HTTP 오류: {e.code} {e.reason}")
-            return False
-        except urllib.error.URLError as e:
-            logger.warning(f"[Telegram] URL 오류: {e.reason}")
+        except (OSError, http.client.HTTPException) as e:
+            logger.warning(f"[Telegram] 연결 오류: {e}")
             return False
         except Exception as e:
             logger.warning(f"[Telegram] 메시지 발송 실패: {str(e)}")
@@ -89,7 +326,7 @@ class TelegramNotifier:
         """예약 성공 알림 발송.
 
         :param train_info: 열차 정보 dict.
-                           키: dept_time, arri_time, seat_type
+                           키: dept_time, arri_time, seat_type, job(선택, 다중 작업 데몬의 작업 이름)
         :return: 발송 성공 여부
         """
         dept_time = train_info.get("dept_time", "N/A")
@@ -100,6 +337,8 @@ class TelegramNotifier:
             f"- 열차: {dept_time}~{arri_time}\n"
             f"- 좌석: {seat_type}"
         )
+        if train_info.get("job"):
+            message += f"\n- 작업: {train_info['job']}"
         return self.send_message(message)
 
     def notify_failure(self, reason: str = "최대 재시도 초과") -> bool:
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+검색 조건 병합 (coalescing)
+
+날짜 × 시간 조건을 그대로 순회하면 같은 날짜의 08시 조회 결과에 이미 10시, 12시
+출발 열차가 들어 있어도 조건마다 다시 조회하게 됩니다. SearchPlanner 는 한 순회
+동안 받은 결과 페이지로 뒤 시간대 조건의 상위 N개 열차를 모두 확인할 수 있는지
+판단하고, 확인할 수 있으면 조회를 생략하게 합니다. 덮지 못하면 평소처럼 조회합니다.
+조건 순서는 사용자가 적은 순서(--tm 우선순위)를 그대로 따르므로, 앞서 조회한 이른 시간대가
+뒤에 적힌 늦은 시간대를 덮을 때만 생략됩니다 (예: "08,10" 은 병합, "10,08" 은 각각 조회).
+
+다중 작업 데몬에서는 SharedResultCache 가 작업 사이의 같은 슬롯(출발역, 도착역, 날짜,
+시간) 조회를 짧은 TTL 동안 한 번으로 줄입니다.
+"""
+import logging
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from srt_reservation.models import ResultPage
+
+logger = logging.getLogger('srt')
+
+
+class SearchPlanner:
+    """한 순회(rotation) 안에서 이전 조회 결과로 덮이는 조건을 찾아 조회를 생략"""
+
+    def __init__(self, num_trains_to_check: int, enabled: bool = True):
+        self.num_trains_to_check = num_trains_to_check
+        self.enabled = enabled
+        self._pages: Dict[str, ResultPage] = {}  # 날짜별 현재 브라우저에 떠 있는 결과 페이지
+        self.queries = 0  # 이번 순회의 실제 조회 수
+        self.saved = 0  # 이번 순회에서 생략한 조회 수
+        self.total_saved = 0
+
+    def start_rotation(self) -> None:
+        """새 순회 시작 — 이전 순회 결과는 오래되었으므로 버린다."""
+        self._pages.clear()
+        self.queries = 0
+        self.saved = 0
+
+    def record(self, page: ResultPage) -> None:
+        """실제 조회로 얻은 결과 페이지 등록 (이전 페이지는 브라우저에서 사라졌으므로 버린다)"""
+        self.queries += 1
+        self._pages.clear()
+        if len(page):
+            self._pages[page.dpt_dt] = page
+
+    def invalidate(self) -> None:
+        """예약 클릭 등으로 페이지를 떠났을 때 호출 — 링크 요소가 더 이상 유효하지 않다."""
+        self._pages.clear()
+
+    def covered_page(self, condition: dict) -> Optional[ResultPage]:
+        """condition 을 이전 조회 결과로 확인할 수 있으면 해당 시간대로 좁힌 ResultPage 반환.
+
+        상위 num_trains_to_check 개 열차가 모두 이전 결과에 있어야 덮인 것으로 본다.
+        하나라도 모자라면 None (호출자가 조회).
+        """
+        if not self.enabled:
+            return None
+        page = self._pages.get(condition["dpt_dt"])
+        if page is None or int(page.dpt_tm) > int(condition["dpt_tm"]):
+            return None
+        narrowed = page.departing_from(condition["dpt_tm"])
+        if len(narrowed) < self.num_trains_to_check:
+            return None
+        self.saved += 1
+        self.total_saved += 1
+        return narrowed
+
+
+SlotKey = Tuple[str, str, str, str]
+
+
+class SharedResultCache:
+    """작업 간 조회 결과 공유 — (출발역, 도착역, 날짜, 시간) 슬롯별 결과 페이지를 ttl 초 보관.
+
+    같은 슬롯을 찾는 다른 작업은 조회하지 않고 보관된 TrainRow 에 자기 조건(확인할 열차 수,
+    예약대기 여부)을 적용한다. 예약 링크는 브라우저가 그 결과 페이지에 머무는 동안만
+    유효하므로 마지막으로 조회한 슬롯만 live 로 두고, 브라우저가 이동하면 live 를 지운다.
+    live 가 아닌 결과는 링크를 뗀 사본으로만 돌려준다.
+    """
+
+    def __init__(self, ttl: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: Dict[SlotKey, Tuple[float, ResultPage]] = {}
+        self._live: Optional[SlotKey] = None
+
+    @staticmethod
+    def key(dpt_stn: str, arr_stn: str, dpt_dt: str, dpt_tm: str) -> SlotKey:
+        return dpt_stn, arr_stn, dpt_dt, f"{int(dpt_tm):02d}"
+
+    def put(self, dpt_stn: str, arr_stn: str, page: ResultPage) -> None:
+        """실제 조회로 얻은 결과 페이지 등록 (현재 브라우저에 떠 있는 live 페이지가 된다)"""
+        now = self._clock()
+        for key in [key for key, (stored, _) in self._entries.items() if now - stored >= self.ttl]:
+            del self._entries[key]
+        key = self.key(dpt_stn, arr_stn, page.dpt_dt, page.dpt_tm)
+        self._entries[key] = (now, page)
+        self._live = key
+
+    def get(self, dpt_stn: str, arr_stn: str, dpt_dt: str, dpt_tm: str) -> Tuple[Optional[ResultPage], bool]:
+        """슬롯의 보관 결과와 live 여부. 없거나 ttl 이 지났으면 (None, False).
+
+        live 이면 링크가 살아 있는 페이지 그대로, 아니면 링크를 뗀 사본을 돌려준다.
+        """
+        key = self.key(dpt_stn, arr_stn, dpt_dt, dpt_tm)
+        entry = self._entries.get(key)
+        if entry is None or self._clock() - entry[0] >= self.ttl:
+            return None, False
+        page = entry[1]
+        if key == self._live:
+            return page, True
+        return page.without_links(), False
+
+    def navigated(self) -> None:
+        """브라우저가 결과 페이지를 떠났을 때 호출 — 보관 결과의 링크 요소가 모두 무효가 된다."""
+        self._live = None
+
+    def __len__(self):
+        return len(self._entries)
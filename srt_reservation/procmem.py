@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+프로세스 메모리 측정 (Linux /proc 기반, subprocess/psutil 없이)
+
+/proc 가 없는 환경(macOS, Windows)에서는 모든 함수가 None 을 반환하며,
+호출자는 None 을 "측정 불가"로 취급해 기능을 건너뛰지 않고 그대로 진행한다.
+"""
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger('srt')
+
+_PROC = "/proc"
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def available_memory_mb() -> Optional[float]:
+    """시스템의 사용 가능 메모리(MemAvailable, MB)"""
+    try:
+        with open(os.path.join(_PROC, "meminfo"), encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _parent_map() -> Dict[int, int]:
+    """pid → ppid (/proc/<pid>/stat 4번째 필드)"""
+    parents = {}
+    try:
+        entries = os.listdir(_PROC)
+    except OSError:
+        return parents
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(os.path.join(_PROC, entry, "stat"), encoding="ascii", errors="replace") as f:
+                stat = f.read()
+            # comm 에 공백/괄호가 들어갈 수 있으므로 마지막 ')' 이후를 파싱
+            parents[int(entry)] = int(stat[stat.rindex(")") + 2:].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+    return parents
+
+
+def _rss_bytes(pid: int) -> int:
+    try:
+        with open(os.path.join(_PROC, str(pid), "statm"), encoding="ascii") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def process_tree_pids(root_pids: Iterable[int]) -> List[int]:
+    """root_pids 와 그 자손 프로세스 pid 목록"""
+    roots = [pid for pid in root_pids if pid]
+    if not roots:
+        return []
+    children: Dict[int, List[int]] = {}
+    for pid, ppid in _parent_map().items():
+        children.setdefault(ppid, []).append(pid)
+    seen, stack = set(), list(roots)
+    while stack:
+        pid = stack.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        stack.extend(children.get(pid, ()))
+    return sorted(seen)
+
+
+def process_tree_rss_mb(root_pids: Iterable[int]) -> Optional[float]:
+    """root_pids 프로세스 트리의 RSS 합계(MB). 측정할 수 없으면 None."""
+    if not os.path.isdir(_PROC):
+        return None
+    pids = process_tree_pids(root_pids)
+    if not pids:
+        return None
+    return sum(_rss_bytes(pid) for pid in pids) / (1024 * 1024)
+
+
+def driver_root_pids(driver: Any) -> List[int]:
+    """WebDriver 가 띄운 프로세스 트리의 루트 pid (chromedriver 서비스, undetected 의 Chrome)"""
+    pids = []
+    try:
+        pid = driver.service.process.pid
+        if isinstance(pid, int):
+            pids.append(pid)
+    except AttributeError:
+        pass
+    browser_pid = getattr(driver, "browser_pid", None)
+    if isinstance(browser_pid, int):
+        pids.append(browser_pid)
+    return pids
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+페이지 녹화 (fixture 코퍼스 수집)
+
+SRT 가 실제로 본 페이지(결과 표, 예약 확인, 잔여석 없음, 차단 안내, 로그인 리다이렉트)를
+개인정보를 지운 HTML 로 저장합니다. 저장한 코퍼스는 benchmarks/replay.py 의 ReplayDriver
+로 Chrome·네트워크 없이 _check_result_once / book_ticket / _detect_blocked_page 에 다시
+흘려 파싱·판단 지연을 측정하거나 회귀 테스트에 씁니다.
+
+파일 구성:
+    <directory>/<kind>/<sha1 12자리>.html
+
+첫 줄의 주석에 kind, 경로(쿼리 제외), 검색 조건을 남깁니다. 내용이 같은 페이지는
+한 번만 저장하고, kind 별 파일 수는 max_per_kind 로 제한합니다.
+
+사용 예:
+    python quickstart.py ... --record-pages fixtures/pages
+"""
+import hashlib
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger('srt')
+
+PAGE_KINDS = ("results", "booking", "sold_out", "block", "login", "error")
+
+_HEADER = re.compile(r"^<!-- srt-fixture (.*?) -->\n")
+
+# 버튼 라벨처럼 판단에 쓰이는 value 는 남긴다
+_KEEP_VALUES = {"조회하기", "확인", "메인으로", "예약하기", "신청하기"}
+
+
+def _mask_value(match: "re.Match") -> str:
+    quoted = match.group(2)
+    if quoted[1:-1] in _KEEP_VALUES:
+        return match.group(0)
+    return f"{match.group(1)}{quoted[0]}{quoted[0]}"
+
+
+def _mask_request_id(match: "re.Match") -> str:
+    return match.group(1) + "x" * len(match.group(2))
+
+
+# (패턴, 치환) — 순서대로 적용
+_SANITIZE_RULES = (
+    # 스크립트/스타일 본문, 주석, 인라인 이벤트 핸들러 (세션 토큰·예약 파라미터가 섞여 있음)
+    (re.compile(r"<script\b[^>]*>.*?</script>", re.S | re.I), "<script></script>"),
+    (re.compile(r"<style\b[^>]*>.*?</style>", re.S | re.I), "<style></style>"),
+    (re.compile(r"<!--.*?-->", re.S), ""),
+    (re.compile(r"""\s+on[a-z]+\s*=\s*("[^"]*"|'[^']*')""", re.I), ""),
+    # 입력값 (아이디·비밀번호·hidden 토큰)
+    (re.compile(r"""(<input\b[^>]*?\bvalue\s*=\s*)("[^"]*"|'[^']*')""", re.I), _mask_value),
+    # 로그인 사용자 이름
+    (re.compile(r"환영합니다\s*[^<\s|]+\s*님"), "환영합니다 ○○○님"),
+    # 이메일, 전화번호, 10자리 회원번호
+    (re.compile(r"[\w.+-]+@[\w-]+(\.[\w-]+)+"), "user@example.com"),
+    (re.compile(r"\b01[016789]-?\d{3,4}-?\d{4}\b"), "010-0000-0000"),
+    (re.compile(r"\b\d{10}\b"), "0000000000"),
+    # 차단 페이지 요청 ID (길이만 유지)
+    (re.compile(r"(요청\s*ID\s*[:：]?\s*)([\w-]+)"), _mask_request_id),
+)
+
+
+def sanitize_html(html: str) -> str:
+    """개인정보·세션 토큰을 지운 HTML (구조와 판단에 쓰이는 문구는 유지)"""
+    for pattern, replacement in _SANITIZE_RULES:
+        html = pattern.sub(replacement, html)
+    return html
+
+
+def read_fixture(path: Path) -> Dict[str, str]:
+    """녹화 파일 → {"kind", "path", "dpt_dt", "dpt_tm", "html"}"""
+    text = Path(path).read_text(encoding="utf-8")
+    meta = {}
+    match = _HEADER.match(text)
+    if match:
+        for item in match.group(1).split():
+            key, _, value = item.partition("=")
+            meta[key] = value
+        text = text[match.end():]
+    meta["html"] = text
+    return meta
+
+
+class PageRecorder:
+    """페이지를 kind 별 디렉토리에 중복 없이 저장"""
+
+    def __init__(self, directory, max_per_kind: int = 500):
+        self.directory = Path(directory)
+        self.max_per_kind = max_per_kind
+        self.saved = 0
+        self._counts: Dict[str, int] = {}
+
+    def _count(self, kind: str) -> int:
+        if kind not in self._counts:
+            kind_dir = self.directory / kind
+            self._counts[kind] = len(list(kind_dir.glob("*.html"))) if kind_dir.is_dir() else 0
+        return self._counts[kind]
+
+    def record(self, kind: str, html: str, url: Optional[str] = None,
+               condition: Optional[dict] = None) -> Optional[Path]:
+        """페이지 1개 저장. 이미 있거나 한도를 넘었거나 기록 실패면 None."""
+        if kind not in PAGE_KINDS or not isinstance(html, str):
+            return None
+        body = sanitize_html(html)
+        path = self.directory / kind / f"{hashlib.sha1(body.encode('utf-8')).hexdigest()[:12]}.html"
+        if path.exists() or self._count(kind) >= self.max_per_kind:
+            return None
+
+        meta = [f"kind={kind}"]
+        if isinstance(url, str):
+            meta.append(f"path={urlsplit(url).path or '/'}")
+        for key in ("dpt_dt", "dpt_tm"):
+            if condition and condition.get(key):
+                meta.append(f"{key}={condition[key]}")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(f"<!-- srt-fixture {' '.join(meta)} -->\n{body}", encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"페이지 녹화 실패 ({kind}): {e}")
+            return None
+        self._counts[kind] += 1
+        self.saved += 1
+        logger.debug(f"페이지 녹화: {path}")
+        return path
@@ -8,13 +8,15 @@ import logging
 import random
 import time
 from enum import Enum
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Optional
 
 from selenium.common.exceptions import (
-    NoAlertPresentException,
     TimeoutException,
+    UnexpectedAlertPresentException,
 )
 
+from srt_reservation.metrics import METRICS, timed
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,8 +41,10 @@ class RecoveryContext:
             ErrorType.SESSION: 0,
             ErrorType.BROWSER: 0,
         }
+        self.attempts = 0  # 누적 복구 시도 수 (reset 과 무관, 스케줄러가 순회별 오류 수 계산에 사용)
 
     def increment(self, error_type: ErrorType) -> int:
+        self.attempts += 1
         self.retry_count[error_type] += 1
         return self.retry_count[error_type]
 
@@ -86,58 +90,81 @@ class NetworkErrorRecovery:
         Raises:
             RecoveryError: 최대 재시도 횟수 초과 시
         """
-        while context.can_retry(ErrorType.NETWORK):
-            try:
-                result = operation()
-                context.reset(ErrorType.NETWORK)
-                return result
-            except Exception as e:
-                if not NetworkErrorRecovery.should_retry(e):
-                    raise
-
-                count = context.increment(ErrorType.NETWORK)
-                wait_time = NetworkErrorRecovery.get_wait_time(count)
+        # 첫 네트워크 오류부터 재시도가 끝날 때까지(대기 + 재시도한 operation)를 recovery_network 로 기록.
+        # 오류 없이 끝난 호출은 복구가 아니므로 기록하지 않는다.
+        recovering_since = None
+        try:
+            while context.can_retry(ErrorType.NETWORK):
+                try:
+                    result = operation()
+                    context.reset(ErrorType.NETWORK)
+                    return result
+                except Exception as e:
+                    if not NetworkErrorRecovery.should_retry(e):
+                        raise
+                    if recovering_since is None:
+                        recovering_since = time.perf_counter()
+
+                    count = context.increment(ErrorType.NETWORK)
+                    METRICS.inc("srt_recoveries_total", error_type=ErrorType.NETWORK.value)
+                    wait_time = NetworkErrorRecovery.get_wait_time(count)
+
+                    logger.warning(
+                        f"[{count}/{max_retries}] 네트워크 오류 재시도. "
+                        f"{wait_time:.1f}초 대기 후 재시도..."
+                    )
+                    time.sleep(wait_time)
+
+            context.reset(ErrorType.NETWORK)
+            raise RecoveryError(
+                f"네트워크 오류: 최대 재시도({max_retries}회) 초과"
+            )
+        finally:
+            if recovering_since is not None:
+                METRICS.observe("recovery_network", time.perf_counter() - recovering_since)
 
-                logger.warning(
-                    f"[{count}/{max_retries}] 네트워크 오류 재시도. "
-                    f"{wait_time:.1f}초 대기 후 재시도..."
-                )
-                time.sleep(wait_time)
 
-        context.reset(ErrorType.NETWORK)
-        raise RecoveryError(
-            f"네트워크 오류: 최대 재시도({max_retries}회) 초과"
-        )
+def _is_login_url(url: Any) -> bool:
+    if not isinstance(url, str):
+        return False
+    url = url.lower()
+    return "login" in url or "member" in url
 
 
 class SessionRecovery:
     """세션 만료 감지 및 재로그인 전략"""
 
+    # 현재 URL 과 로그인 폼(아이디 입력란) 유무를 WebDriver 왕복 1회로 읽는다
+    _SESSION_STATE_SCRIPT = """
+        return {url: location.href, login_form: !!document.getElementById('srchDvNm01')};
+    """
+
     @staticmethod
     def is_session_expired(driver: Any) -> bool:
         """
-        세션 만료 여부 판단.
-        - 현재 URL이 로그인 페이지인 경우
-        - 예상치 못한 Alert 발생 시
+        세션 만료 여부 판단 (브라우저 상태는 바꾸지 않음).
+        - 현재 URL이 로그인/회원 페이지이거나 로그인 폼이 보이는 경우
+        - 열린 Alert 때문에 스크립트가 거부된 경우 (Alert 은 닫지 않음)
         """
         try:
-            current_url = driver.current_url
-            if "login" in current_url.lower() or "member" in current_url.lower():
-                return True
-        except Exception:
-            pass
-
-        try:
-            alert = driver.switch_to.alert
+            state = driver.execute_script(SessionRecovery._SESSION_STATE_SCRIPT)
+        except UnexpectedAlertPresentException:
             logger.warning("예상치 못한 Alert 감지: 세션 만료 가능성")
-            alert.accept()
             return True
-        except (NoAlertPresentException, Exception):
-            pass
+        except Exception:
+            state = None
 
-        return False
+        if isinstance(state, dict):
+            return bool(state.get("login_form")) or _is_login_url(state.get("url"))
+
+        # 스크립트 결과를 쓸 수 없는 드라이버 — URL 만 확인
+        try:
+            return _is_login_url(driver.current_url)
+        except Exception:
+            return False
 
     @staticmethod
+    @timed("recovery_session")
     def recover(
         driver: Any,
         srt_instance: Any,
@@ -149,7 +176,7 @@ class SessionRecovery:
 
         Args:
             driver: Selenium WebDriver
-            srt_instance: SRT 클래스 인스턴스 (login 메서드 사용)
+            srt_instance: SRT 클래스 인스턴스 (login, confirm_login 메서드 사용 — 확인 시 세션 쿠키 저장)
             context: RecoveryContext 객체
             max_retries: 최대 재시도 횟수
 
@@ -161,8 +188,12 @@ class SessionRecovery:
         """
         while context.can_retry(ErrorType.SESSION):
             try:
+                METRICS.inc("srt_recoveries_total", error_type=ErrorType.SESSION.value)
                 logger.info("[세션 복구] 자동 재로그인 시도...")
                 srt_instance.login()
+                # 로그인 확인 시 새 쿠키를 세션 캐시에 저장하고 만료 시각 추적을 갱신
+                if not srt_instance.confirm_login():
+                    raise RuntimeError("재로그인 후 로그인 상태를 확인하지 못했습니다")
                 logger.info("[세션 복구] 재로그인 성공. 검색 재개...")
                 context.reset(ErrorType.SESSION)
                 return True
@@ -179,6 +210,43 @@ class SessionRecovery:
         )
 
 
+class SessionExpiryTracker:
+    """로그인 쿠키 만료 시각 추적.
+
+    만료 직전에 미리 재로그인해 검색이 실패한 뒤에야 세션 만료를 알아채는 일을 줄인다.
+    서버가 내려준 httpOnly 쿠키 중 만료 시각(expiry)이 있는 것의 가장 이른 시각을
+    기준으로 삼는다 (분석용 스크립트 쿠키는 httpOnly 가 아니므로 제외). 만료 시각 없는
+    세션 쿠키만 있으면 추적하지 않는다.
+    """
+
+    def __init__(self, margin: float = 60.0, clock: Callable[[], float] = time.time):
+        self.margin = margin
+        self._clock = clock
+        self.deadline: Optional[float] = None
+
+    def update(self, cookies: Iterable[dict]) -> Optional[float]:
+        """로그인 직후(또는 쿠키 복원 직후) 쿠키 목록으로 만료 시각 갱신"""
+        expiries = [
+            c["expiry"] for c in cookies or ()
+            if isinstance(c, dict) and c.get("httpOnly") and isinstance(c.get("expiry"), (int, float))
+        ]
+        self.deadline = min(expiries) if expiries else None
+        return self.deadline
+
+    def clear(self) -> None:
+        self.deadline = None
+
+    def seconds_left(self) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return self.deadline - self._clock()
+
+    def expires_soon(self) -> bool:
+        """만료까지 margin 초 이하 남았으면 True"""
+        left = self.seconds_left()
+        return left is not None and left <= self.margin
+
+
 class BrowserRecovery:
     """브라우저 크래시 감지 및 복구 전략"""
 
@@ -192,6 +260,7 @@ class BrowserRecovery:
             return False
 
     @staticmethod
+    @timed("recovery_browser")
     def recover(
         driver: Any,
         srt_instance: Any,
@@ -201,7 +270,8 @@ class BrowserRecovery:
         브라우저 크래시 시 복구.
         - 기존 WebDriver 정리
         - 새 WebDriver 초기화
-        - 로그인 및 검색 재시작
+        - 저장된 세션 쿠키 복원, 실패 시 로그인
+        - 검색 재시작
 
         Returns:
             bool: 복구 성공 여부
@@ -211,6 +281,7 @@ class BrowserRecovery:
         """
         try:
             count = context.increment(ErrorType.BROWSER)
+            METRICS.inc("srt_recoveries_total", error_type=ErrorType.BROWSER.value)
             logger.warning(
                 f"[{count}/1] 브라우저 크래시 감지. 자동 복구 중..."
             )
@@ -223,7 +294,11 @@ class BrowserRecovery:
 
             # 새 WebDriver 초기화 및 재시작
             srt_instance.run_driver()
-            srt_instance.login()
+            if not srt_instance.restore_session():
+                srt_instance.login()
+                # 새 로그인 쿠키를 세션 캐시에 저장 (다음 실행·복구에서 로그인 생략)
+                if not srt_instance.confirm_login():
+                    raise RuntimeError("재로그인 후 로그인 상태를 확인하지 못했습니다")
             srt_instance.go_search()
 
             logger.info("[브라우저 복구] 완료. 검색 재개...")
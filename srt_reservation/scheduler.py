@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+순회 간 대기 시간 스케줄러 (polling scheduler)
+
+check_result() 는 기본적으로 순회마다 retry_delay_min~retry_delay_max 사이의 균등
+난수만큼 쉽니다. SRT(scheduler=...) 로 PollScheduler 를 넘기면 대기 시간을 그
+스케줄러가 정합니다.
+
+AdaptiveScheduler 는
+  - 조회 지연이 평소보다 커지거나 오류(네트워크 재시도·세션 만료)가 생기면 간격을 늘리고,
+    정상 순회가 이어지면 천천히 원래 간격으로 돌아오며,
+  - 차단 안내 문구가 하나라도 보이면 일정 시간 보수적인 간격을 유지하고 (집중 구간도 무시),
+  - 취소표가 풀리는 시각으로 알려진 집중 구간(focus window)에는 간격을 좁히되,
+  - 어떤 경우에도 최근 1시간 요청 수 + 다음 순회 최대 조회 수가 시간당 예산을 넘지 않을
+    만큼 기다립니다 (예산은 대기 시간 계산 단계에서 강제). 요청 수는 조회뿐 아니라 로그인·
+    예약 클릭·세션 복원 등 REQUEST_BUDGET 이 센 모든 요청입니다.
+
+사용 예:
+    from srt_reservation.scheduler import AdaptiveScheduler
+
+    scheduler = AdaptiveScheduler(60, 120, hourly_budget=60, focus_windows="06:55-07:10,23:55-00:10")
+    srt = SRT(..., scheduler=scheduler)
+"""
+import logging
+import math
+import random
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime
+from typing import Callable, Deque, Iterable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger('srt')
+
+
+class PollScheduler(ABC):
+    """순회 간 대기 시간 결정 인터페이스.
+
+    check_result() 가 순회를 마칠 때마다 record_rotation() 으로 결과를 알려주고
+    next_delay() 로 대기 시간(초)을 받는다. 차단 안내 문구가 보이면 note_block_signal().
+    """
+
+    def record_rotation(self, queries: int, search_seconds: float, errors: int,
+                        requests: Optional[int] = None) -> None:
+        """순회 1회 결과 (실제 조회 수, 조회에 걸린 시간 합계(초), 복구 시도 수).
+
+        requests 는 지난 기록 이후 서버에 보낸 전체 요청 수 (로그인·재로그인·예약 클릭·세션 복원·
+        브라우저 교체 페이지 로드 포함, REQUEST_BUDGET 집계). None 이면 queries 로 본다.
+        """
+
+    def note_block_signal(self, signatures: Sequence[str]) -> None:
+        """페이지에서 차단 안내 문구가 감지됨 (차단 판정 기준 미만 포함)"""
+
+    @abstractmethod
+    def next_delay(self, upcoming_queries: int) -> int:
+        """다음 순회 전 대기 시간(초). upcoming_queries 는 다음 순회의 최대 조회 수."""
+
+
+class FocusWindow:
+    """하루 중 집중 구간 ("HH:MM-HH:MM", 자정을 넘는 구간 허용)"""
+
+    def __init__(self, spec: str):
+        try:
+            start, end = (part.strip() for part in spec.split("-"))
+            self.start = self._minutes(start)
+            self.end = self._minutes(end)
+        except ValueError:
+            raise ValueError(f"집중 구간 형식이 올바르지 않습니다 (HH:MM-HH:MM): {spec!r}") from None
+        self.spec = spec.strip()
+
+    @staticmethod
+    def _minutes(text: str) -> int:
+        hour, minute = text.split(":")
+        hour, minute = int(hour), int(minute)
+        if not (0 <= hour < 24 and 0 <= minute < 60):
+            raise ValueError(text)
+        return hour * 60 + minute
+
+    def contains(self, moment: datetime) -> bool:
+        minute = moment.hour * 60 + moment.minute
+        if self.start <= self.end:
+            return self.start <= minute < self.end
+        return minute >= self.start or minute < self.end
+
+    @classmethod
+    def parse_all(cls, specs: Union[None, str, Iterable[str]]) -> List["FocusWindow"]:
+        """쉼표 구분 문자열 또는 문자열 목록 → FocusWindow 목록"""
+        if not specs:
+            return []
+        if isinstance(specs, str):
+            specs = specs.split(",")
+        return [cls(spec) for spec in specs if spec.strip()]
+
+
+class AdaptiveScheduler(PollScheduler):
+    """지연·오류·차단 신호에 따라 간격을 조절하고 시간당 조회 예산을 지키는 스케줄러"""
+
+    WINDOW_SECONDS = 3600
+    LATENCY_ALPHA = 0.3  # 조회 지연 지수이동평균 가중치
+    RELAX_FACTOR = 0.75  # 정상 순회마다 늘어난 간격을 줄이는 비율
+    CONSERVATIVE_BACKOFF = 4.0  # 차단 신호 후 최소 배수
+
+    def __init__(self, delay_min: int = 60, delay_max: int = 120, hourly_budget: int = 60,
+                 focus_windows: Union[None, str, Iterable[str]] = None, focus_ratio: float = 0.25,
+                 latency_factor: float = 2.0, max_backoff: float = 8.0, block_cooldown: float = 3600,
+                 clock: Callable[[], float] = time.time, now: Callable[[], datetime] = datetime.now,
+                 rand: Callable[[float, float], float] = random.uniform):
+        """
+        Args:
+            delay_min, delay_max: 평상시 대기 범위(초)
+            hourly_budget: 최근 1시간 동안 보낼 수 있는 최대 요청 수 (조회·로그인·예약 클릭 등)
+            focus_windows: 집중 구간 ("06:55-07:10,23:55-00:10" 또는 목록)
+            focus_ratio: 집중 구간에서 대기 범위에 곱하는 비율
+            latency_factor: 조회 지연이 기준(관측 최솟값)의 몇 배를 넘으면 간격을 늘릴지
+            max_backoff: 간격 배수 상한
+            block_cooldown: 차단 신호 후 보수적 간격을 유지할 시간(초)
+        """
+        if hourly_budget < 1:
+            raise ValueError("시간당 조회 예산은 1 이상이어야 합니다")
+        self.delay_min = delay_min
+        self.delay_max = delay_max
+        self.hourly_budget = hourly_budget
+        self.focus_windows = FocusWindow.parse_all(focus_windows)
+        self.focus_ratio = focus_ratio
+        self.latency_factor = latency_factor
+        self.max_backoff = max_backoff
+        self.block_cooldown = block_cooldown
+        self._clock = clock
+        self._now = now
+        self._rand = rand
+
+        self.backoff = 1.0
+        self.latency: Optional[float] = None  # 조회 1회 지연 지수이동평균(초)
+        self.baseline: Optional[float] = None  # 관측된 최소 조회 지연(초)
+        self.conservative_until = 0.0
+        self._sent: Deque[Tuple[float, int]] = deque()  # (시각, 조회 수)
+
+    def record_rotation(self, queries: int, search_seconds: float, errors: int,
+                        requests: Optional[int] = None) -> None:
+        now = self._clock()
+        sent = queries if requests is None else requests
+        if sent:
+            self._sent.append((now, sent))
+        if queries:
+            per_query = search_seconds / queries
+            self.baseline = per_query if self.baseline is None else min(self.baseline, per_query)
+            self.latency = per_query if self.latency is None else (
+                self.LATENCY_ALPHA * per_query + (1 - self.LATENCY_ALPHA) * self.latency
+            )
+
+        if errors:
+            self.backoff = min(self.max_backoff, self.backoff * 2)
+        elif self.latency is not None and self.latency > self.baseline * self.latency_factor:
+            self.backoff = min(self.max_backoff, self.backoff * 1.5)
+        else:
+            self.backoff = max(1.0, self.backoff * self.RELAX_FACTOR)
+
+    def note_block_signal(self, signatures: Sequence[str]) -> None:
+        if not self.conservative:
+            logger.warning(f"차단 안내 문구 감지 ({', '.join(signatures)}). "
+                           f"{self.block_cooldown / 60:.0f}분 동안 조회 간격을 늘립니다")
+        self.conservative_until = self._clock() + self.block_cooldown
+        self.backoff = max(self.backoff, self.CONSERVATIVE_BACKOFF)
+
+    @property
+    def conservative(self) -> bool:
+        return self._clock() < self.conservative_until
+
+    def in_focus(self) -> bool:
+        moment = self._now()
+        return any(window.contains(moment) for window in self.focus_windows)
+
+    def sent_last_hour(self) -> int:
+        self._prune()
+        return sum(count for _, count in self._sent)
+
+    def _prune(self) -> None:
+        cutoff = self._clock() - self.WINDOW_SECONDS
+        while self._sent and self._sent[0][0] <= cutoff:
+            self._sent.popleft()
+
+    def budget_wait(self, upcoming_queries: int) -> float:
+        """다음 순회(최대 upcoming_queries 회 조회)가 시간당 예산을 넘지 않도록 기다려야 할 시간(초)"""
+        self._prune()
+        upcoming = min(max(upcoming_queries, 1), self.hourly_budget)
+        excess = sum(count for _, count in self._sent) + upcoming - self.hourly_budget
+        if excess <= 0:
+            return 0.0
+        # 가장 오래된 기록부터 1시간 창에서 빠져나가며 excess 만큼 여유가 생기는 시각까지
+        now = self._clock()
+        for sent_at, count in self._sent:
+            excess -= count
+            if excess <= 0:
+                return sent_at + self.WINDOW_SECONDS - now
+        return self.WINDOW_SECONDS
+
+    def next_delay(self, upcoming_queries: int) -> int:
+        conservative = self.conservative
+        backoff = max(self.backoff, self.CONSERVATIVE_BACKOFF) if conservative else self.backoff
+        low, high = self.delay_min, self.delay_max
+        if not conservative and self.in_focus():
+            low, high = low * self.focus_ratio, high * self.focus_ratio
+        delay = self._rand(low, high) * backoff
+
+        budget_wait = self.budget_wait(upcoming_queries)
+        if budget_wait > delay:
+            logger.info(f"시간당 조회 예산({self.hourly_budget}회) 도달. {budget_wait:.0f}초 대기")
+            delay = budget_wait
+        return max(1, math.ceil(delay))
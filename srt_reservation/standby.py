@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+웜 스탠바이 브라우저
+
+브라우저 복구(BrowserRecovery)는 driver.quit() → run_driver() → login() → go_search()
+를 순서대로 수행해 수십 초 동안 좌석을 보지 못합니다. StandbyBrowser 는 예비 WebDriver 를
+백그라운드 스레드에서 미리 띄워 두고(가능하면 저장된 세션 쿠키로 로그인 상태까지),
+크래시 시 run_driver() 가 이를 즉시 넘겨받게 합니다. 넘겨준 뒤에는 다음 예비를 다시 준비합니다.
+
+메모리 예산(MB)이 0 이면 꺼지고, 사용 가능 메모리가 예산보다 적거나 띄운 예비 브라우저가
+예산을 넘으면 예비를 두지 않습니다.
+"""
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+from srt_reservation.procmem import available_memory_mb, driver_root_pids, process_tree_rss_mb
+
+logger = logging.getLogger('srt')
+
+
+class StandbyBrowser:
+    """예비 WebDriver 1개를 관리"""
+
+    # 예비 브라우저 준비 중 크래시가 나면 새로 띄우는 것보다 기다리는 편이 빠르다
+    TAKE_TIMEOUT = 30
+
+    def __init__(self, launcher: Callable[[], Any], memory_budget_mb: float = 0):
+        """
+        Args:
+            launcher: 새 WebDriver 를 만들어 반환하는 함수 (백그라운드 스레드에서 호출)
+            memory_budget_mb: 예비 브라우저에 허용할 메모리(MB). 0 이하면 비활성
+        """
+        self._launcher = launcher
+        self.memory_budget_mb = memory_budget_mb
+        self._lock = threading.Lock()
+        self._driver = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.memory_budget_mb > 0 and not self._closed
+
+    @property
+    def ready(self) -> bool:
+        with self._lock:
+            return self._driver is not None
+
+    def prepare(self) -> bool:
+        """예비 브라우저 준비를 백그라운드에서 시작. 이미 있거나 준비 중이면 아무것도 하지 않는다.
+
+        Returns:
+            bool: 준비를 시작했거나 이미 준비된 상태면 True
+        """
+        if not self.enabled:
+            return False
+        with self._lock:
+            if self._driver is not None or (self._thread is not None and self._thread.is_alive()):
+                return True
+            available = available_memory_mb()
+            if available is not None and available < self.memory_budget_mb:
+                logger.info(
+                    f"사용 가능 메모리 {available:.0f}MB < 예산 {self.memory_budget_mb:.0f}MB — 예비 브라우저 생략"
+                )
+                return False
+            self._thread = threading.Thread(target=self._launch, name="srt-standby-browser", daemon=True)
+            self._thread.start()
+        return True
+
+    def _launch(self) -> None:
+        try:
+            driver = self._launcher()
+        except Exception as e:
+            logger.warning(f"예비 브라우저 준비 실패: {e}")
+            return
+
+        rss = process_tree_rss_mb(driver_root_pids(driver))
+        if rss is not None and rss > self.memory_budget_mb:
+            logger.warning(
+                f"예비 브라우저 메모리 {rss:.0f}MB 가 예산 {self.memory_budget_mb:.0f}MB 를 넘어 종료합니다"
+            )
+            self._quit(driver)
+            return
+
+        with self._lock:
+            if self._closed:
+                keep = False
+            else:
+                self._driver, keep = driver, True
+        if keep:
+            logger.info("예비 브라우저 준비 완료" + (f" ({rss:.0f}MB)" if rss is not None else ""))
+        else:
+            self._quit(driver)
+
+    def take(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """예비 브라우저를 넘겨받는다. 준비 중이면 timeout 까지 기다린다.
+
+        Returns:
+            살아 있는 WebDriver, 없으면 None (호출자가 새로 띄운다)
+        """
+        if not self.enabled:
+            return None
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            thread.join(self.TAKE_TIMEOUT if timeout is None else timeout)
+        with self._lock:
+            driver, self._driver = self._driver, None
+        if driver is None:
+            return None
+        try:
+            _ = driver.current_window_handle
+        except Exception as e:
+            logger.warning(f"예비 브라우저가 응답하지 않습니다: {e}")
+            self._quit(driver)
+            return None
+        return driver
+
+    def close(self) -> None:
+        """예비 브라우저 종료 (프로그램 종료 시). 준비 중인 브라우저도 끝나는 대로 닫힌다."""
+        with self._lock:
+            self._closed = True
+            driver, self._driver = self._driver, None
+        if driver is not None:
+            self._quit(driver)
+
+    @staticmethod
+    def _quit(driver: Any) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
@@ -30,6 +30,24 @@ def parse_cli_args():
     parser.add_argument("--use-profile", help="Use real Chrome profile (True/False)", type=str_to_bool, metavar="True/False", default=None)
     parser.add_argument("--profile-dir", help="Chrome profile directory path", type=str, metavar="/path/to/chrome/profile", default=None)
     parser.add_argument("--headless", help="브라우저 UI 없이 백그라운드 실행 (True/False)", type=str_to_bool, metavar="True/False", default=None)
+    parser.add_argument("--in-page-search", help="결과 페이지에서 날짜/시간만 바꿔 재조회 (True/False)", type=str_to_bool, metavar="True/False", default=None)
+    parser.add_argument("--coalesce-conditions", help="--tm 에 앞서 적은 이른 시간 조회 결과로 뒤 시간대 조건을 확인하고 조회 생략 (True/False)", type=str_to_bool, metavar="True/False", default=None)
+    parser.add_argument("--standby-memory-mb", help="크래시 복구용 예비 브라우저 메모리 예산(MB), 0이면 끔", type=int, metavar="800", default=None)
+    parser.add_argument("--browser-memory-limit-mb", help="브라우저 메모리(RSS)가 이 값을 넘으면 순회 사이에 로그인 유지한 채 브라우저 교체(MB), 0이면 끔", type=int, metavar="1500", default=None)
+    parser.add_argument("--async-logging", help="로그 포맷팅/파일 쓰기를 백그라운드 스레드에서 처리 (True/False)", type=str_to_bool, metavar="True/False", default=None)
+    parser.add_argument("--metrics-port", help="단계별 소요시간 메트릭을 http://127.0.0.1:PORT/metrics 로 노출 (0이면 끔)", type=int, metavar="9108", default=None)
+    parser.add_argument("--metrics-textfile", help="node-exporter textfile collector 용 메트릭 파일 경로", type=str, metavar="/path/srt.prom", default=None)
+    parser.add_argument("--poll-scheduler", help="순회 간격 스케줄러 (fixed: 균등 난수, adaptive: 지연/오류/차단 신호·집중 구간·시간당 예산 반영)", type=str, default=None, choices=['fixed', 'adaptive'])
+    parser.add_argument("--hourly-budget", help="adaptive 스케줄러의 시간당 최대 요청 수 (로그인·예약 클릭 포함)", type=int, metavar="60", default=None)
+    parser.add_argument("--focus-windows", help="adaptive 스케줄러 집중 구간, 쉼표 구분 HH:MM-HH:MM", type=str, metavar="06:55-07:10,23:55-00:10", default=None)
+    parser.add_argument("--request-budget", help="go_search/새로고침/예약 클릭/로그인 요청의 시간당 상한 (0이면 끔)", type=int, metavar="120", default=None)
+    parser.add_argument("--request-burst", help="요청 예산의 최대 연속 요청 수", type=int, metavar="10", default=None)
+    parser.add_argument("--record-pages", help="본 페이지를 개인정보를 지운 HTML 로 저장할 디렉토리 (replay 벤치마크용)", type=str, metavar="fixtures/pages", default=None)
+    parser.add_argument("--jobs", dest="jobs_file", help="다중 작업 파일(JSON). 지정하면 작업들을 브라우저 1개·로그인 1회로 번갈아 조회", type=str, metavar="jobs.json", default=None)
+    parser.add_argument("--result-cache-ttl", help="다중 작업에서 같은 노선·날짜·시간 조회 결과를 작업끼리 공유할 시간(초). 0이면 공유 안 함", type=int, metavar="30", default=None)
+    parser.add_argument("--lean-loading", help="이미지·웹폰트·미디어·분석 스크립트 요청을 차단하는 경량 로드 모드 (True/False)", type=str_to_bool, metavar="True/False", default=None)
+    parser.add_argument("--lean-allow", help="경량 모드에서도 불러올 묶음(images/fonts/media/analytics) 또는 URL 패턴, 쉼표 구분", type=str, metavar="fonts", default=None)
+    parser.add_argument("--log-format", help="로그 파일 형식 (text/json)", type=str, default=None, choices=['text', 'json'])
     parser.add_argument(
         '--log-level',
         type=str,
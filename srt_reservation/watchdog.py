@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+브라우저 메모리 감시 (계획된 브라우저 교체)
+
+Chrome 은 장시간 새로고침하면 메모리가 계속 늘어납니다 (1시간에 약 200MB). 지금까지는
+실제 크래시가 나야 BrowserRecovery 가 브라우저를 새로 띄웠습니다. MemoryWatchdog 는 순회 사이마다
+WebDriver 프로세스 트리(chromedriver 서비스 pid 와 그 자손 Chrome 프로세스)의 RSS 를 /proc 에서 읽고,
+한도를 넘으면 SRT.recycle_browser() 가 로그인 쿠키를 유지한 채 브라우저를 교체하게 합니다.
+
+한도(MB)가 0 이면 교체하지 않으며, 계측이 켜져 있으면 RSS 는 한도와 관계없이 게이지로 남깁니다.
+/proc 가 없는 환경(macOS, Windows)에서는 측정할 수 없으므로 아무것도 하지 않습니다.
+"""
+import logging
+from typing import Any, Optional
+
+from srt_reservation.metrics import METRICS
+from srt_reservation.procmem import driver_root_pids, process_tree_rss_mb
+
+logger = logging.getLogger('srt')
+
+
+class MemoryWatchdog:
+    """브라우저 프로세스 트리 RSS 를 재고 교체 시점을 알려 준다"""
+
+    def __init__(self, limit_mb: float = 0):
+        """
+        Args:
+            limit_mb: 브라우저 교체 기준 RSS(MB). 0 이하면 교체하지 않음
+        """
+        self.limit_mb = limit_mb
+        self.last_rss_mb: Optional[float] = None
+        self.recycles = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit_mb > 0
+
+    def sample(self, driver: Any) -> Optional[float]:
+        """driver 프로세스 트리의 RSS(MB). 측정할 수 없으면 None."""
+        rss = process_tree_rss_mb(driver_root_pids(driver))
+        self.last_rss_mb = rss
+        if rss is not None:
+            METRICS.set("srt_browser_rss_mb", round(rss, 1))
+        return rss
+
+    def over_limit(self, driver: Any) -> bool:
+        """순회 사이에 호출: 한도를 넘었으면 True (계측만 켜져 있으면 RSS 만 기록)"""
+        if not (self.enabled or METRICS.enabled):
+            return False
+        rss = self.sample(driver)
+        return self.enabled and rss is not None and rss >= self.limit_mb
+
+    def record_recycle(self) -> None:
+        self.recycles += 1
+        METRICS.inc("srt_browser_recycles_total")
@@ -5,6 +5,11 @@ SRT IP 차단 페이지 감지 테스트.
 실제로 한 번 차단을 당한 후 추가한 안전망. 본문 텍스트에 매크로 차단 안내
 문구가 두 개 이상 매칭되면 BlockedByServerError 가 raise되어야 한다.
 """
+import json
+import re
+import shutil
+import subprocess
+
 import pytest
 from unittest.mock import MagicMock
 
@@ -23,11 +28,20 @@ REAL_BLOCK_PAGE_BODY = (
 )
 
 
+def _probe(body_text: str) -> dict:
+    """_BLOCK_PROBE_SCRIPT 가 body.innerText == body_text 인 페이지에서 돌려줄 값 (Python 으로 재현)."""
+    matched = [sig for sig in SRT._BLOCK_SIGNATURES if sig in body_text]
+    if len(matched) < SRT._BLOCK_MIN_MATCHES:
+        return {"matched": matched, "request_id": None}
+    m = re.search(r"요청\s*ID\s*[:：]?\s*([A-Za-z0-9_-]+)", body_text)
+    return {"matched": matched, "request_id": m.group(1) if m else None}
+
+
 def _make_srt_with_body(body_text: str) -> SRT:
-    """body.innerText 가 body_text 를 돌려주는 mock driver 를 가진 SRT 인스턴스."""
+    """body.innerText 가 body_text 인 페이지를 띄운 mock driver 를 가진 SRT 인스턴스."""
     srt = SRT("동탄", "동대구", "20260601", "08", 2, False)
     srt.driver = MagicMock()
-    srt.driver.execute_script.return_value = body_text
+    srt.driver.execute_script.return_value = _probe(body_text)
     # notifier 도 mock 으로 (실제 텔레그램 발송 방지)
     srt.notifier = MagicMock()
     srt.notifier.is_configured.return_value = False
@@ -84,6 +98,19 @@ class TestDetectBlockedPage:
         # 예외 안 던지고 None 리턴
         srt._detect_blocked_page()
 
+    def test_only_probe_result_crosses_the_wire(self):
+        """본문 전체가 아니라 페이지 내 매칭 스크립트 1회만 실행"""
+        srt = _make_srt_with_body(REAL_BLOCK_PAGE_BODY)
+        with pytest.raises(BlockedByServerError):
+            srt._detect_blocked_page()
+        srt.driver.execute_script.assert_called_once_with(SRT._BLOCK_PROBE_SCRIPT)
+
+    def test_unexpected_probe_result_ignored(self):
+        """스크립트가 dict 가 아닌 값을 돌려주면 (예: mock) 검사 생략"""
+        srt = _make_srt_with_body("")
+        srt.driver.execute_script.return_value = REAL_BLOCK_PAGE_BODY
+        srt._detect_blocked_page()
+
     def test_no_request_id_uses_unknown(self):
         """요청 ID 가 본문에 없을 때 'unknown' 으로 채워짐"""
         body = "접속 제한 안내. 비정상적인 접근이 감지되었습니다. 매크로 프로그램 사용은 금지."
@@ -112,3 +139,26 @@ class TestBlockNotification:
         with pytest.raises(BlockedByServerError):
             srt._detect_blocked_page()
         srt.notifier.send_message.assert_not_called()
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node 필요")
+class TestBlockProbeScript:
+    """_BLOCK_PROBE_SCRIPT 를 실제 JS 엔진(node)에서 실행해 Python 재현과 비교"""
+
+    @staticmethod
+    def _run(body_text):
+        program = (
+            f"const document = {{body: {{innerText: {json.dumps(body_text)}}}}};\n"
+            f"console.log(JSON.stringify((function () {{ {SRT._BLOCK_PROBE_SCRIPT} }})()));"
+        )
+        out = subprocess.run(["node", "-e", program], capture_output=True, text=True, timeout=30, check=True)
+        return json.loads(out.stdout)
+
+    @pytest.mark.parametrize("body", [
+        REAL_BLOCK_PAGE_BODY,
+        "공지: 일부 시간대에 접속 제한이 있을 수 있습니다.",
+        "접속 제한 안내. 비정상적인 접근이 감지되었습니다.",
+        "",
+    ])
+    def test_matches_python_reference(self, body):
+        assert self._run(body) == _probe(body)
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""프로세스 전체 요청 예산 (srt_reservation.budget) 테스트"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import UnexpectedAlertPresentException, WebDriverException
+
+from srt_reservation import budget, metrics
+from srt_reservation.budget import REQUEST_BUDGET, RequestBudget
+from srt_reservation.main import SRT
+from srt_reservation.metrics import METRICS
+from srt_reservation.models import TrainRow
+
+
+class FakeTime:
+    """clock/sleep 쌍 — sleep 하면 시계가 그만큼 간다"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake():
+    return FakeTime()
+
+
+@pytest.fixture
+def bucket(fake):
+    bucket = RequestBudget(clock=fake.clock, sleep=fake.sleep)
+    bucket.configure(per_hour=360, burst=3)  # 10초에 1개
+    return bucket
+
+
+@pytest.fixture(autouse=True)
+def _reset_global():
+    yield
+    REQUEST_BUDGET.reset()
+    metrics.shutdown()
+    METRICS.reset()
+
+
+class TestRequestBudget:
+    def test_disabled_only_counts(self, fake):
+        bucket = RequestBudget(clock=fake.clock, sleep=fake.sleep)
+        for _ in range(100):
+            assert bucket.acquire("search") == 0.0
+        assert bucket.counts["search"] == 100
+        assert fake.sleeps == []
+        assert bucket.configure(per_hour=0) is False
+
+    def test_burst_then_waits_for_refill(self, bucket, fake):
+        # 마지막 1개는 예약 전용이므로 조회는 burst-1 개까지 바로 나간다
+        assert bucket.acquire("search") == 0
+        assert bucket.acquire("search") == 0
+        waited = bucket.acquire("search")
+        assert waited == pytest.approx(10.0)
+        assert bucket.waited == pytest.approx(10.0)
+
+    def test_booking_uses_reserved_token(self, bucket, fake):
+        bucket.acquire("search")
+        bucket.acquire("search")
+        assert bucket.acquire("book") == 0
+        assert fake.sleeps == []
+
+    def test_rate_is_bounded(self, bucket, fake):
+        start = fake.now
+        for _ in range(50):
+            bucket.acquire("refresh")
+        # 처음 2개(예약 전용 1개 제외) 이후는 10초에 1개
+        assert fake.now - start == pytest.approx(48 * 10.0)
+
+    def test_refill_capped_at_capacity(self, bucket, fake):
+        fake.now += 100000
+        assert bucket.remaining == 3
+
+    def test_metrics(self, fake):
+        METRICS.enabled = True
+        bucket = RequestBudget(clock=fake.clock, sleep=fake.sleep)
+        bucket.configure(per_hour=360, burst=2)
+        bucket.acquire("login")
+        bucket.acquire("search")
+
+        assert METRICS.counter("srt_requests_total", kind="login") == 1
+        assert METRICS.counter("srt_budget_wait_seconds_total", kind="search") == pytest.approx(10.0)
+        assert METRICS.gauge("srt_budget_tokens") == pytest.approx(1.0)  # 예약 전용 1개
+        assert "# TYPE srt_budget_tokens gauge" in METRICS.render()
+
+
+def _row(standard="매진", waitlist=""):
+    def cell(text):
+        return {"text": text, "has_link": bool(text) and text != "매진", "link": MagicMock()}
+    return TrainRow.from_snapshot({
+        "index": 1, "train_no": "301", "dpt_time": "10:10", "arr_time": "12:40",
+        "special": cell("매진"), "standard": cell(standard), "waitlist": cell(waitlist),
+    })
+
+
+class TestSRTAcquires:
+    """SRT 의 요청 지점이 전역 예산에서 토큰을 받는지"""
+
+    def test_go_search_and_login(self):
+        srt = SRT("수서", "부산", "20260315", "08")
+        srt.set_log_info("user", "pass")
+        srt.driver = MagicMock()
+        with patch("srt_reservation.main.WebDriverWait"), \
+             patch("srt_reservation.main.Select"), \
+             patch.object(srt, "_human_like_delay"), \
+             patch.object(srt, "_random_mouse_movement"), \
+             patch.object(srt, "_wait_for_results"):
+            srt.go_search()
+            try:
+                srt.login()
+            except Exception:
+                pass
+
+        assert REQUEST_BUDGET.counts["search"] == 1
+        assert REQUEST_BUDGET.counts["navigate"] == 1
+        assert REQUEST_BUDGET.counts["login"] == 1
+
+    def test_session_resume_loads(self):
+        srt = SRT("수서", "부산", "20260315", "08")
+        srt.driver = MagicMock()
+        cookies = [{"name": "JSESSIONID", "value": "abc"}]
+        srt._resume_session(cookies)  # CDP 주입 후 메인 페이지 1회
+        assert REQUEST_BUDGET.counts["navigate"] == 1
+
+        srt.driver.execute_cdp_cmd.side_effect = WebDriverException("no cdp")
+        srt._resume_session(cookies)  # add_cookie 용 사이트 방문 + 메인 페이지
+        assert REQUEST_BUDGET.counts["navigate"] == 3
+
+    def test_alert_retry_takes_another_token(self):
+        srt = SRT("수서", "부산", "20260315", "08", in_page_search=False)
+        srt.set_log_info("user", "pass")
+        srt.driver = MagicMock()
+        srt.driver.get.side_effect = [UnexpectedAlertPresentException(), None,
+                                      UnexpectedAlertPresentException(), None]
+        with patch("srt_reservation.main.WebDriverWait"), \
+             patch("srt_reservation.main.Select"), \
+             patch.object(srt, "handle_alert"), \
+             patch.object(srt, "_human_like_delay"), \
+             patch.object(srt, "_random_mouse_movement"), \
+             patch.object(srt, "_wait_for_results"):
+            srt.go_search()
+            try:
+                srt.login()
+            except Exception:
+                pass
+
+        assert REQUEST_BUDGET.counts["navigate"] == 2
+        assert REQUEST_BUDGET.counts["login"] == 2
+
+    def test_book_and_reserve(self):
+        srt = SRT("수서", "부산", "20260315", "08", want_reserve=True)
+        srt.driver = MagicMock()
+        with patch.object(srt, "_wait_for_booking_page"):
+            srt.book_ticket(_row(standard="예약하기"))
+        srt.reserve_ticket(_row(waitlist="신청하기"))
+
+        assert REQUEST_BUDGET.counts["book"] == 1
+        assert REQUEST_BUDGET.counts["reserve"] == 1
+
+    def test_no_token_for_unavailable_seat(self):
+        srt = SRT("수서", "부산", "20260315", "08")
+        srt.driver = MagicMock()
+        srt.book_ticket(_row())
+        assert REQUEST_BUDGET.counts["book"] == 0
+
+    def test_configure_helper(self):
+        assert budget.configure(per_hour=60, burst=5) is True
+        assert REQUEST_BUDGET.capacity == 5
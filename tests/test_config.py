@@ -1,6 +1,7 @@
 """Config 클래스 단위 테스트"""
 
 import argparse
+import json
 import os
 from unittest.mock import patch
 
@@ -305,3 +306,51 @@ class TestValidateRequired:
         with pytest.raises(ValueError) as exc_info:
             Config.validate_required({})
         assert '.env' in str(exc_info.value)
+
+
+# ---------------------------------------------------------------------------
+# load_jobs 테스트
+# ---------------------------------------------------------------------------
+
+class TestLoadJobs:
+    BASE = {'num': 3, 'reserve': False, 'dt': '20260315'}
+
+    def _write(self, tmp_path, data):
+        path = tmp_path / 'jobs.json'
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        return str(path)
+
+    def test_jobs_inherit_base_values(self, tmp_path):
+        """작업에 없는 키는 공통 설정 값"""
+        path = self._write(tmp_path, {'jobs': [
+            {'name': '부산', 'dpt': '수서', 'arr': '부산', 'tm': ['08', '10']},
+            {'dpt': '수서', 'arr': '동대구', 'dt': '20260316', 'tm': '14', 'num': 1, 'reserve': 'true'},
+        ]})
+        jobs = Config.load_jobs(path, self.BASE)
+        assert jobs[0] == {'name': '부산', 'dpt': '수서', 'arr': '부산', 'dt': '20260315',
+                           'tm': '08,10', 'num': 3, 'reserve': False}
+        assert jobs[1]['name'] == '수서→동대구 20260316'
+        assert jobs[1]['num'] == 1 and jobs[1]['reserve'] is True
+
+    def test_plain_list(self, tmp_path):
+        path = self._write(tmp_path, [{'dpt': '수서', 'arr': '부산', 'dt': '20260315', 'tm': '08'}])
+        assert Config.load_jobs(path)[0]['num'] == Config.DEFAULTS['num']
+
+    @pytest.mark.parametrize('data, message', [
+        ({'jobs': []}, '작업 목록'),
+        ([{'dpt': '수서', 'arr': '부산', 'dt': '20260315'}], 'tm'),
+        ([{'dpt': '수서', 'arr': '부산', 'dt': '20260315', 'tm': '08', 'user': 'x'}], 'user'),
+        ([{'name': 'a', 'dpt': '수서', 'arr': '부산', 'dt': '1', 'tm': '08'}] * 2, '중복'),
+    ])
+    def test_invalid(self, tmp_path, data, message):
+        with pytest.raises(ValueError, match=message):
+            Config.load_jobs(self._write(tmp_path, data))
+
+    def test_unreadable_file(self, tmp_path):
+        (tmp_path / 'bad.json').write_text('{', encoding='utf-8')
+        with pytest.raises(ValueError, match='읽을 수 없습니다'):
+            Config.load_jobs(str(tmp_path / 'bad.json'))
+
+    def test_jobs_file_only_requires_account(self):
+        """작업 파일을 쓰면 노선/날짜/시간은 필수가 아님"""
+        assert Config.validate_required({'user': 'id', 'psw': 'pw', 'jobs_file': 'jobs.json'}) is True
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""다중 작업 데몬 (srt_reservation.daemon) 테스트"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException
+
+from srt_reservation.daemon import Job, JobDaemon
+from srt_reservation.exceptions import BlockedByServerError
+from srt_reservation.main import SRT
+from srt_reservation.models import EMPTY_SEAT, ResultPage, SeatCell, TrainRow
+from srt_reservation.planner import SharedResultCache
+from srt_reservation.scheduler import PollScheduler
+
+
+def _job(name, dpt_tm="08", outcomes=()):
+    """check_rotation 이 outcomes 를 차례로 돌려주는 작업 (True 면 예약 성공)"""
+    srt = SRT("수서", "부산", "20260315", dpt_tm, num_trains_to_check=1)
+    srt.driver = MagicMock()
+    srt.notifier = MagicMock()
+    outcomes = list(outcomes)
+
+    def rotation():
+        booked = outcomes.pop(0) if outcomes else False
+        if isinstance(booked, Exception):
+            raise booked
+        srt.planner.queries = len(srt.search_conditions)
+        if booked:
+            srt.is_booked = True
+            return srt.driver, 0.5, 0
+        return None, 0.5, 0
+
+    srt.check_rotation = MagicMock(side_effect=rotation)
+    srt.report_booking = MagicMock()
+    return Job(name, srt)
+
+
+class TestJobDaemon:
+    def test_requires_jobs(self):
+        with pytest.raises(ValueError):
+            JobDaemon([])
+
+    def test_start_logs_in_once_and_shares_driver(self):
+        a, b = _job("a"), _job("b")
+        daemon = JobDaemon([a, b])
+        driver = MagicMock()
+
+        def run_driver():
+            a.srt.driver = driver
+
+        with patch.object(a.srt, "run_driver", side_effect=run_driver), \
+             patch.object(b.srt, "run_driver") as b_run_driver, \
+             patch.object(a.srt, "sign_in") as a_sign_in, \
+             patch.object(b.srt, "sign_in") as b_sign_in:
+            daemon.start("id", "pw")
+
+        a_sign_in.assert_called_once_with()
+        b_run_driver.assert_not_called()
+        b_sign_in.assert_not_called()
+        assert b.srt.driver is driver
+        assert b.srt.login_id == "id"
+        assert b.srt.session_expiry is a.srt.session_expiry
+
+    def test_booked_job_drops_out(self):
+        a, b = _job("a", outcomes=[True]), _job("b", "10,12", outcomes=[False, True])
+        daemon = JobDaemon([a, b])
+
+        with patch.object(daemon, "start"), \
+             patch("srt_reservation.daemon.randint", return_value=7), \
+             patch("srt_reservation.daemon.time.sleep") as sleep:
+            booked = daemon.run("id", "pw")
+
+        assert booked == [a, b]
+        assert a.srt.check_rotation.call_count == 1
+        assert b.srt.check_rotation.call_count == 2
+        sleep.assert_called_once_with(7)
+        a.srt.report_booking.assert_called_once_with(job="a")
+        b.srt.report_booking.assert_called_once_with(job="b")
+
+    def test_shared_scheduler_sees_all_jobs(self):
+        scheduler = MagicMock(spec=PollScheduler)
+        scheduler.next_delay.return_value = 3
+        a, b = _job("a", outcomes=[False, True]), _job("b", "10,12", outcomes=[False, True])
+        daemon = JobDaemon([a, b], scheduler=scheduler)
+        assert a.srt.scheduler is scheduler and b.srt.scheduler is scheduler
+
+        with patch.object(daemon, "start"), patch("srt_reservation.daemon.time.sleep"):
+            daemon.run("id", "pw")
+
+        queries, search_seconds, errors = scheduler.record_rotation.call_args.args
+        assert (queries, search_seconds, errors) == (3, 1.0, 0)
+        scheduler.next_delay.assert_called_once_with(3)
+
+    def test_block_stops_every_job(self):
+        a, b = _job("a", outcomes=[BlockedByServerError("차단")]), _job("b")
+        daemon = JobDaemon([a, b])
+
+        with patch.object(daemon, "start"), pytest.raises(BlockedByServerError):
+            daemon.run("id", "pw")
+
+        b.srt.check_rotation.assert_not_called()
+        b.srt.notifier.notify_failure.assert_not_called()
+
+    def test_other_error_notifies_each_pending_job(self):
+        a, b = _job("a", outcomes=[RuntimeError("boom")]), _job("b")
+        daemon = JobDaemon([a, b])
+
+        with patch.object(daemon, "start"), pytest.raises(RuntimeError):
+            daemon.run("id", "pw")
+
+        a.srt.notifier.notify_failure.assert_called_once_with("[a] boom")
+        b.srt.notifier.notify_failure.assert_called_once_with("[b] boom")
+
+    def test_browser_loss_recovers_and_reshares(self):
+        a, b = _job("a"), _job("b", outcomes=[InvalidSessionIdException("invalid session id")])
+        daemon = JobDaemon([a, b])
+        new_driver = MagicMock()
+
+        def recover(driver, srt_instance, context):
+            srt_instance.driver = new_driver
+
+        with patch("srt_reservation.daemon.BrowserRecovery.recover", side_effect=recover) as recover_mock:
+            queries, _, errors = daemon.run_rotation()
+
+        assert recover_mock.call_args.kwargs["srt_instance"] is a.srt
+        assert b.srt.driver is new_driver
+        assert errors == 1 and queries == 1
+
+
+class TestSharedResults:
+    SOLD_OUT = [{"index": i, "train_no": str(299 + 2 * i), "dpt_time": f"08:{10 * i}", "arr_time": "",
+                 "standard": {"text": "매진", "has_link": False}} for i in (1, 2)]
+
+    def _srt(self, arr="부산", num=1, reserve=False):
+        srt = SRT("수서", arr, "20260315", "08", num_trains_to_check=num, want_reserve=reserve)
+        srt.notifier = MagicMock()
+        return srt
+
+    def test_second_job_uses_first_jobs_query(self):
+        a, b, other = self._srt(), self._srt(num=2, reserve=True), self._srt(arr="동대구")
+        daemon = JobDaemon([Job("a", a), Job("b", b), Job("c", other)])
+        assert b.result_cache is daemon.result_cache is other.result_cache
+        driver = MagicMock()
+        driver.execute_script.return_value = {"kind": "results", "url": "u", "rows": self.SOLD_OUT}
+
+        searches = {}
+        for srt in (a, b, other):
+            srt.driver = driver
+            with patch.object(srt, "go_search") as go_search:
+                assert srt.check_rotation()[0] is None
+            searches[srt.arr_stn, srt.num_trains_to_check] = go_search.call_count
+
+        assert searches == {("부산", 1): 1, ("부산", 2): 0, ("동대구", 1): 1}
+        assert b.search_counts["shared"] == 1 and b.planner.queries == 0
+        assert [row.train_no for row in b._last_page.candidates(2)] == ["301", "303"]
+
+    def test_stale_page_with_bookable_row_queries_again(self):
+        srt = self._srt(reserve=True)
+        srt.result_cache = SharedResultCache()
+        waitlist = TrainRow(1, "301", "08:10", "", EMPTY_SEAT, SeatCell("매진", False), SeatCell("신청하기", True))
+        srt.result_cache.put("수서", "부산", ResultPage("20260315", "08", (waitlist,)))
+        condition = {"dpt_dt": "20260315", "dpt_tm": "08"}
+
+        assert srt._shared_page(condition) is not None  # 브라우저에 그대로 떠 있음
+        srt.result_cache.navigated()
+        assert srt._shared_page(condition) is None
+        srt.want_reserve = False
+        assert srt._shared_page(condition).rows[0].waitlist.link is None
+
+    def test_disabled_with_zero_ttl(self):
+        daemon = JobDaemon([_job("a")], result_cache_ttl=0)
+        assert daemon.result_cache is None and daemon.lead.result_cache is None
+
+
+class TestCheckRotation:
+    def test_one_pass_without_sleep(self):
+        srt = SRT("수서", "부산", "20260315", "08,10", num_trains_to_check=1, coalesce_conditions=False)
+        srt.driver = MagicMock()
+        srt.driver.execute_script.return_value = {"kind": "results", "url": "u", "rows": [], "matched": []}
+
+        with patch.object(srt, "go_search") as go_search, \
+             patch("srt_reservation.main.time.sleep") as sleep:
+            result, search_seconds, errors = srt.check_rotation()
+
+        assert result is None and errors == 0 and search_seconds >= 0
+        assert go_search.call_count == 2
+        sleep.assert_not_called()
+
+
+class TestReportBooking:
+    def test_job_name_in_notification(self):
+        srt = SRT("수서", "부산", "20260315", "08")
+        srt.notifier = MagicMock()
+        srt._booked_condition = {"dpt_dt": "20260315", "dpt_tm": "08"}
+        srt.report_booking(job="부산 주말")
+        assert srt.notifier.notify_success.call_args.args[0]["job"] == "부산 주말"
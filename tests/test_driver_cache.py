@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Chrome 버전 / chromedriver 경로 캐시 (DriverResolutionCache) 테스트"""
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from srt_reservation.cache import DriverResolutionCache
+from srt_reservation.main import SRT
+
+
+@pytest.fixture
+def chrome(tmp_path):
+    binary = tmp_path / "google-chrome"
+    binary.write_text("#!/bin/sh\n")
+    return binary
+
+
+@pytest.fixture
+def chromedriver(tmp_path):
+    binary = tmp_path / "chromedriver"
+    binary.write_text("driver")
+    return binary
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestDriverResolutionCache:
+    def test_version_roundtrip_persists(self, tmp_path, chrome):
+        cache = DriverResolutionCache(tmp_path, chrome_binary=str(chrome))
+        assert cache.chrome_version() is None
+        cache.remember_chrome_version(131)
+
+        reloaded = DriverResolutionCache(tmp_path, chrome_binary=str(chrome))
+        assert reloaded.chrome_version() == 131
+
+    def test_chrome_update_invalidates(self, tmp_path, chrome, chromedriver):
+        cache = DriverResolutionCache(tmp_path, chrome_binary=str(chrome))
+        cache.remember_chrome_version(131)
+        cache.remember_chromedriver(str(chromedriver))
+
+        _bump_mtime(chrome)
+        assert cache.chrome_version() is None
+        assert cache.chromedriver_path() is None
+
+    def test_chromedriver_roundtrip_and_replacement(self, tmp_path, chrome, chromedriver):
+        cache = DriverResolutionCache(tmp_path, chrome_binary=str(chrome))
+        cache.remember_chromedriver(str(chromedriver))
+        assert DriverResolutionCache(tmp_path, chrome_binary=str(chrome)).chromedriver_path() == str(chromedriver)
+
+        _bump_mtime(chromedriver)
+        assert cache.chromedriver_path() is None
+
+        chromedriver.unlink()
+        assert cache.chromedriver_path() is None
+
+    def test_version_and_driver_kept_together(self, tmp_path, chrome, chromedriver):
+        cache = DriverResolutionCache(tmp_path, chrome_binary=str(chrome))
+        cache.remember_chrome_version(131)
+        cache.remember_chromedriver(str(chromedriver))
+        assert cache.chrome_version() == 131
+
+    def test_no_chrome_binary_disables_cache(self, tmp_path):
+        cache = DriverResolutionCache(tmp_path, chrome_binary=str(tmp_path / "missing"))
+        cache.remember_chrome_version(131)
+        assert cache.chrome_version() is None
+        assert not cache.path.exists()
+
+    def test_corrupt_file_ignored(self, tmp_path, chrome):
+        (tmp_path / DriverResolutionCache.FILENAME).write_text("[broken", encoding="utf-8")
+        cache = DriverResolutionCache(tmp_path, chrome_binary=str(chrome))
+        assert cache.chrome_version() is None
+        cache.remember_chrome_version(131)
+        assert DriverResolutionCache(tmp_path, chrome_binary=str(chrome)).chrome_version() == 131
+
+    def test_find_chrome_binary_linux(self, chrome):
+        with patch("srt_reservation.cache.platform.system", return_value="Linux"), \
+             patch("srt_reservation.cache.shutil.which", side_effect=lambda name: str(chrome) if name == "chromium" else None):
+            assert DriverResolutionCache.find_chrome_binary() == os.path.realpath(chrome)
+
+
+def _make_srt(tmp_path, chrome):
+    srt = SRT("수서", "부산", "20260315", "08")
+    srt.driver_cache = DriverResolutionCache(tmp_path, chrome_binary=str(chrome))
+    return srt
+
+
+class TestSRTUsesDriverCache:
+    def test_version_detected_once(self, tmp_path, chrome):
+        srt = _make_srt(tmp_path, chrome)
+        result = MagicMock(stdout="Google Chrome 131.0.6778.85")
+        with patch("subprocess.run", return_value=result) as mock_run, \
+             patch("platform.system", return_value="Linux"):
+            assert srt._get_chrome_version() == 131
+            assert _make_srt(tmp_path, chrome)._get_chrome_version() == 131
+        assert mock_run.call_count == 1
+
+    @patch("srt_reservation.main.ChromeDriverManager")
+    @patch("srt_reservation.main.Service")
+    @patch("srt_reservation.main.webdriver.Chrome")
+    def test_cached_chromedriver_used_offline(self, mock_chrome, mock_service, mock_manager, tmp_path, chrome, chromedriver):
+        srt = _make_srt(tmp_path, chrome)
+        srt.driver_cache.remember_chromedriver(str(chromedriver))
+
+        srt._start_chrome(MagicMock())
+
+        mock_service.assert_called_once_with(str(chromedriver))
+        mock_manager.assert_not_called()
+        assert srt.driver is mock_chrome.return_value
+
+    @patch("srt_reservation.main.chromedriver_path", "/nonexistent/chromedriver")
+    @patch("srt_reservation.main.ChromeDriverManager")
+    @patch("srt_reservation.main.Service")
+    @patch("srt_reservation.main.webdriver.Chrome")
+    def test_manager_result_remembered(self, mock_chrome, mock_service, mock_manager, tmp_path, chrome, chromedriver):
+        mock_manager.return_value.install.return_value = str(chromedriver)
+        mock_chrome.side_effect = [WebDriverException("not found"), MagicMock()]
+        srt = _make_srt(tmp_path, chrome)
+
+        srt._start_chrome(MagicMock())
+
+        mock_manager.return_value.install.assert_called_once()
+        assert srt.driver_cache.chromedriver_path() == str(chromedriver)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""결과 페이지 내 조건 전환 (날짜/시간 select 만 바꿔 재조회) 테스트"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import UnexpectedAlertPresentException
+from selenium.webdriver.remote.webelement import WebElement
+
+from srt_reservation.config import Config
+from srt_reservation.main import SRT
+
+
+def _make_srt(in_page_search=True):
+    srt = SRT("수서", "부산", "20260315", "08,10", in_page_search=in_page_search)
+    srt.driver = MagicMock()
+    return srt
+
+
+def _page_elements():
+    return [MagicMock(spec=WebElement), MagicMock(spec=WebElement)]
+
+
+@patch("srt_reservation.main.Select")
+@patch("srt_reservation.main.WebDriverWait")
+class TestGoSearchInPage:
+    def test_switches_condition_without_navigation(self, mock_wait, mock_select):
+        srt = _make_srt()
+        old_page, submit = _page_elements()
+        srt.driver.execute_script.return_value = [old_page, submit]
+
+        srt.go_search(dpt_dt="20260315", dpt_tm="10")
+
+        srt.driver.get.assert_not_called()
+        srt.driver.execute_script.assert_called_once_with(
+            SRT._SWITCH_CONDITION_SCRIPT, "수서", "부산", "20260315", "10"
+        )
+        submit.click.assert_called_once()
+        assert srt.search_counts == {"in_page": 1}
+        assert srt._searched_condition == {"dpt_dt": "20260315", "dpt_tm": "10"}
+
+    @pytest.mark.parametrize("reason", ["no-results", "no-form", "station-mismatch", "no-date"])
+    def test_falls_back_to_full_navigation(self, mock_wait, mock_select, reason):
+        srt = _make_srt()
+        srt.driver.execute_script.return_value = reason
+
+        srt.go_search(dpt_dt="20260315", dpt_tm="10")
+
+        srt.driver.get.assert_called_once_with(f"{srt.base_url}/hpg/hra/01/selectScheduleList.do")
+        assert srt.search_counts == {"full": 1}
+
+    def test_falls_back_when_script_fails(self, mock_wait, mock_select):
+        srt = _make_srt()
+        srt.driver.execute_script.side_effect = [UnexpectedAlertPresentException("alert"), None, None]
+
+        srt.go_search()
+
+        srt.driver.get.assert_called_once()
+        assert srt.search_counts["full"] == 1
+
+    def test_falls_back_when_submit_click_fails(self, mock_wait, mock_select):
+        srt = _make_srt()
+        old_page, submit = _page_elements()
+        submit.click.side_effect = UnexpectedAlertPresentException("alert")
+        srt.driver.execute_script.return_value = [old_page, submit]
+
+        srt.go_search()
+
+        srt.driver.get.assert_called_once()
+
+    def test_disabled_always_navigates(self, mock_wait, mock_select):
+        srt = _make_srt(in_page_search=False)
+
+        srt.go_search()
+
+        srt.driver.get.assert_called_once()
+        for call in srt.driver.execute_script.call_args_list:
+            assert call.args[0] != SRT._SWITCH_CONDITION_SCRIPT
+        assert srt.search_counts == {"full": 1}
+
+
+class TestInPageSearchConfig:
+    def test_default_enabled(self):
+        assert Config.DEFAULTS["in_page_search"] is True
+        assert SRT("수서", "부산", "20260315", "08").in_page_search is True
+
+    def test_env_mapping(self, monkeypatch):
+        monkeypatch.setenv("IN_PAGE_SEARCH", "false")
+        with patch("srt_reservation.config.load_dotenv"):
+            assert Config.load_from_env()["in_page_search"] is False
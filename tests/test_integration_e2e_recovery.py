@@ -10,6 +10,7 @@ from selenium.common.exceptions import (
     TimeoutException,
     InvalidSessionIdException,
     NoAlertPresentException,
+    UnexpectedAlertPresentException,
 )
 
 from srt_reservation.recovery import (
@@ -130,24 +131,22 @@ class TestScenario2SessionExpiredRedirect:
 # ─────────────────────────────────────────────────────────────
 
 class TestScenario3SessionExpiredAlert:
-    def test_alert_detected_and_accepted(self):
-        """Alert 발생 시 accept 후 세션 만료 반환"""
+    def test_alert_detected_without_side_effects(self):
+        """Alert 때문에 스크립트가 거부되면 세션 만료 반환 (Alert 은 건드리지 않음)"""
         driver = MagicMock()
-        driver.current_url = "https://etk.srail.co.kr/normal/page"
+        driver.execute_script.side_effect = UnexpectedAlertPresentException("세션이 만료되었습니다")
         alert = MagicMock()
         driver.switch_to.alert = alert
 
         expired = SessionRecovery.is_session_expired(driver)
         assert expired is True
-        alert.accept.assert_called_once()
+        alert.accept.assert_not_called()
 
     @patch("srt_reservation.recovery.time.sleep")
     def test_alert_session_then_relogin(self, mock_sleep):
         """Alert 처리 후 재로그인 성공"""
         driver = MagicMock()
-        alert = MagicMock()
-        driver.switch_to.alert = alert
-        driver.current_url = "https://etk.srail.co.kr/normal"
+        driver.execute_script.side_effect = UnexpectedAlertPresentException("세션이 만료되었습니다")
 
         srt = MagicMock()
         ctx = RecoveryContext(max_retries=2)
@@ -176,8 +175,9 @@ class TestScenario4BrowserCrashRecovery:
         # 브라우저 죽었음 확인
         assert BrowserRecovery.is_browser_alive(driver) is False
 
-        # 복구
+        # 복구 (저장된 세션 없음 → 로그인)
         srt = MagicMock()
+        srt.restore_session.return_value = False
         ctx = RecoveryContext()
         result = BrowserRecovery.recover(driver, srt, ctx)
 
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""경량 페이지 로드 (srt_reservation.lean) 테스트"""
+import json
+import logging
+import shutil
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from benchmarks.bench_cycle import lean_savings
+from srt_reservation.lean import (
+    LOAD_RECORDER_SCRIPT, PageLoadStats, block_resources, blocked_patterns, install_load_recorder,
+)
+from srt_reservation.main import SRT
+
+
+class TestBlockedPatterns:
+    def test_default_blocks_every_group(self):
+        patterns = blocked_patterns()
+        assert {"*.png", "*.png?*", "*.woff2", "*.mp4", "*google-analytics.com*", "*/analytics.js*"} <= set(patterns)
+        assert not any(pattern.endswith((".css", ".css?*")) for pattern in patterns)
+
+    def test_allow_group_and_pattern(self):
+        patterns = blocked_patterns("fonts, *.svg")
+        assert "*.woff2" not in patterns
+        assert "*.svg" not in patterns and "*.svg?*" not in patterns
+        assert "*.png" in patterns
+
+    def test_unknown_allow_entry_warns(self, caplog):
+        with caplog.at_level(logging.WARNING, logger="srt"):
+            assert blocked_patterns(["banners"]) == blocked_patterns()
+        assert "banners" in caplog.text
+
+
+class TestDriverSetup:
+    def test_block_resources_uses_cdp(self):
+        driver = MagicMock()
+        assert block_resources(driver, ["images"]) is True
+        enable, blocked = driver.execute_cdp_cmd.call_args_list
+        assert enable.args == ("Network.enable", {})
+        assert blocked.args[0] == "Network.setBlockedURLs"
+        assert "*.png" not in blocked.args[1]["urls"]
+
+    def test_driver_without_cdp(self):
+        driver = MagicMock()
+        driver.execute_cdp_cmd.side_effect = WebDriverException("unknown command")
+        assert block_resources(driver) is False
+        assert install_load_recorder(driver) is False
+        assert install_load_recorder(object()) is False
+
+    def test_run_driver_applies_lean_mode(self):
+        srt = SRT("수서", "부산", "20260315", "08", anti_bot_method="enhanced",
+                  lean_loading=True, lean_allow="fonts")
+        srt.standby = None
+        srt.driver = MagicMock()
+        with patch.object(srt, "_run_driver_enhanced"):
+            srt.run_driver()
+
+        commands = [c.args[0] for c in srt.driver.execute_cdp_cmd.call_args_list]
+        assert commands == ["Page.addScriptToEvaluateOnNewDocument", "Network.enable", "Network.setBlockedURLs"]
+
+    def test_off_by_default(self):
+        srt = SRT("수서", "부산", "20260315", "08", anti_bot_method="enhanced")
+        srt.standby = None
+        srt.driver = MagicMock()
+        with patch.object(srt, "_run_driver_enhanced"):
+            srt.run_driver()
+        srt.driver.execute_cdp_cmd.assert_not_called()
+        assert srt.page_loads is None
+
+
+class TestPageLoadStats:
+    def test_rotation_totals(self):
+        stats = PageLoadStats()
+        stats.add([[2048, 120], [1024, 80.5]])
+        stats.add([["x", 1], [10], None, [-1, 5]])
+        stats.add(None)
+        assert (stats.pages, stats.bytes, stats.load_ms) == (2, 3072, 200.5)
+        assert stats.summary() == "페이지 2개 3KB, 로드 200ms"
+
+        stats.start_rotation()
+        assert stats.summary() is None
+        assert (stats.total_pages, stats.total_bytes) == (2, 3072)
+
+    def test_check_rotation_collects_probe_loads(self, caplog):
+        srt = SRT("수서", "부산", "20260315", "08", num_trains_to_check=1, lean_loading=True)
+        srt.driver = MagicMock()
+        srt.driver.execute_script.return_value = {
+            "kind": "results", "url": "u", "rows": [], "matched": [], "loads": [[40960, 300]],
+        }
+        with patch.object(srt, "go_search"):
+            srt.check_rotation()
+        assert (srt.page_loads.pages, srt.page_loads.bytes) == (1, 40960)
+
+        with caplog.at_level(logging.INFO, logger="srt"):
+            srt._log_rotation(0.0, 5)
+        (record,) = [r for r in caplog.records if "모든 조건 확인 완료" in r.getMessage()]
+        assert "페이지 1개 40KB, 로드 300ms" in record.getMessage()
+        assert record.fields["transfer_bytes"] == 40960
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node 필요")
+class TestLoadRecorderScript:
+    def test_probe_reads_and_clears_recorded_loads(self):
+        program = f"""
+        const store = {{}};
+        global.sessionStorage = {{
+            getItem: (k) => (k in store ? store[k] : null),
+            setItem: (k, v) => {{ store[k] = String(v); }},
+            removeItem: (k) => {{ delete store[k]; }},
+        }};
+        const handlers = [];
+        global.window = {{addEventListener: (event, f) => handlers.push(f)}};
+        global.performance = {{getEntriesByType: (type) => type === 'navigation'
+            ? [{{transferSize: 1000, startTime: 0, loadEventEnd: 250.4}}]
+            : [{{transferSize: 500}}, {{}}]}};
+        {LOAD_RECORDER_SCRIPT}
+        handlers.forEach((f) => f());
+        setTimeout(() => {{
+            const location = {{href: "https://etk.srail.kr/", pathname: "/"}};
+            const document = {{body: {{innerText: ""}}, getElementById: () => null, querySelector: () => null}};
+            const probe = () => (function () {{ {SRT._POST_SEARCH_PROBE_SCRIPT} }})("tr");
+            console.log(JSON.stringify([probe().loads, probe().loads]));
+        }}, 5);
+        """
+        out = subprocess.run(["node", "-e", program], capture_output=True, text=True, timeout=30, check=True)
+        assert json.loads(out.stdout) == [[[1500, 250]], None]
+
+
+class TestLeanSavings:
+    def test_per_cycle_difference(self):
+        full = {"_page_bytes": [100_000, 120_000], "page_load": [0.5, 0.7], "_asset_hits": 10}
+        lean = {"_page_bytes": [20_000, 20_000], "page_load": [0.2, 0.2], "_asset_hits": 4}
+        savings = lean_savings(full, lean)
+        assert savings["bytes_saved_per_cycle"] == 90_000
+        assert savings["load_seconds_saved_per_cycle"] == pytest.approx(0.4)
+        assert savings["asset_requests_saved"] == 6
@@ -8,7 +8,7 @@ from unittest.mock import patch
 
 import pytest
 
-from srt_reservation.logger import setup_logger
+from srt_reservation.logger import setup_logger, shutdown_logger
 
 
 @pytest.fixture(autouse=True)
@@ -238,5 +238,78 @@ class TestFileAppend:
         assert '두 번째 메시지' in content
 
 
+
+# ── 비동기(QueueHandler/QueueListener) 모드 테스트 ─────────────────────────────
+
+@pytest.fixture()
+def async_logger(temp_logs_dir):
+    logger = setup_logger('INFO', async_logging=True)
+    yield logger
+    shutdown_logger()
+    for handler in logger.handlers:
+        handler.close()
+
+
+def _read_log():
+    with open('logs/srt.log', encoding='utf-8') as f:
+        return f.read()
+
+
+class TestAsyncLogging:
+    def test_only_queue_handler_on_logger(self, async_logger):
+        # pytest 가 로그 캡처 핸들러를 덧붙일 수 있으므로 srt 핸들러만 확인
+        handlers = [h for h in async_logger.handlers if type(h).__module__ != '_pytest.logging']
+        assert len(handlers) == 1
+        assert isinstance(handlers[0], logging.handlers.QueueHandler)
+
+    def test_listener_owns_console_and_file_handlers(self, async_logger):
+        from srt_reservation import logger as logger_module
+        handler_types = {type(h) for h in logger_module._listener.handlers}
+        assert handler_types == {logging.StreamHandler, logging.handlers.TimedRotatingFileHandler}
+
+    def test_shutdown_flushes_queued_records(self, async_logger):
+        for i in range(200):
+            async_logger.info('비동기 메시지 %d', i)
+        shutdown_logger()
+        content = _read_log()
+        assert '비동기 메시지 0' in content
+        assert '비동기 메시지 199' in content
+
+    def test_logging_after_shutdown_goes_direct(self, async_logger):
+        shutdown_logger()
+        assert not any(isinstance(h, logging.handlers.QueueHandler) for h in async_logger.handlers)
+        async_logger.info('종료 후 메시지')
+        assert '종료 후 메시지' in _read_log()
+
+    def test_handler_levels_respected(self, temp_logs_dir):
+        logger = setup_logger('WARNING', async_logging=True)
+        logger.info('기록되면 안 됨')
+        logger.warning('경고 메시지')
+        shutdown_logger()
+        content = _read_log()
+        assert '경고 메시지' in content
+        assert '기록되면 안 됨' not in content
+
+    def test_exception_formatted_by_listener(self, async_logger):
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            async_logger.exception('예외 발생')
+        shutdown_logger()
+        content = _read_log()
+        assert 'ValueError: boom' in content
+
+    def test_setup_again_stops_previous_listener(self, async_logger):
+        from srt_reservation import logger as logger_module
+        first = logger_module._listener
+        setup_logger('INFO')
+        assert logger_module._listener is None
+        assert first._thread is None
+
+    def test_shutdown_is_noop_in_sync_mode(self, temp_logs_dir):
+        logger = setup_logger()
+        shutdown_logger()
+        assert len(logger.handlers) == 2
+
 # ── import 필요 ────────────────────────────────────────────────────────────────
 import logging.handlers
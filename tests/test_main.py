@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 from selenium.common.exceptions import WebDriverException, NoAlertPresentException
 
 from srt_reservation.main import SRT
+from srt_reservation.models import SeatCell, TrainRow
 from srt_reservation.exceptions import (
     InvalidStationNameError,
     InvalidDateError,
@@ -18,6 +19,15 @@ from srt_reservation.exceptions import (
 from srt_reservation.validation import station_list
 
 
+def _train_row(standard="매진", waitlist="매진", index=1):
+    """링크 요소가 없는 (CSS 선택자 폴백 경로) TrainRow"""
+    return TrainRow(
+        index=index, train_no="301", dpt_time="08:00", arr_time="10:35",
+        special=SeatCell("매진", False), standard=SeatCell(standard, False),
+        waitlist=SeatCell(waitlist, False),
+    )
+
+
 class TestSRTInputValidation:
     """입력 검증 테스트"""
     
@@ -327,7 +337,8 @@ class TestSRTCheckLogin:
 class TestSRTBookTicket:
     """티켓 예약 테스트"""
     
-    def test_book_ticket_available(self):
+    @patch('srt_reservation.main.WebDriverWait')
+    def test_book_ticket_available(self, mock_wait):
         """예약 가능한 경우 테스트"""
         srt = SRT("동탄", "동대구", "20240115", "08")
         mock_driver = Mock()
@@ -336,12 +347,13 @@ class TestSRTBookTicket:
         mock_driver.find_elements.return_value = [Mock()]  # 예약 성공 요소 존재
         srt.driver = mock_driver
         
-        result = srt.book_ticket("예약하기", 1)
+        result = srt.book_ticket(_train_row(standard="예약하기"))
         
         assert result == mock_driver
         assert srt.is_booked is True
     
-    def test_book_ticket_unavailable(self):
+    @patch('srt_reservation.main.WebDriverWait')
+    def test_book_ticket_unavailable(self, mock_wait):
         """예약 불가능한 경우 테스트"""
         srt = SRT("동탄", "동대구", "20240115", "08")
         mock_driver = Mock()
@@ -350,7 +362,7 @@ class TestSRTBookTicket:
         mock_driver.find_elements.return_value = []  # 예약 성공 요소 없음
         srt.driver = mock_driver
         
-        result = srt.book_ticket("예약하기", 1)
+        result = srt.book_ticket(_train_row(standard="예약하기"))
         
         assert result is None
         assert srt.is_booked is False
@@ -362,7 +374,7 @@ class TestSRTBookTicket:
         mock_driver = Mock()
         srt.driver = mock_driver
         
-        result = srt.book_ticket("매진", 1)
+        result = srt.book_ticket(_train_row(standard="매진"))
         
         assert result is None
         assert not mock_driver.find_element.called
@@ -379,7 +391,7 @@ class TestSRTReserveTicket:
         mock_driver.find_element.return_value = mock_element
         srt.driver = mock_driver
         
-        result = srt.reserve_ticket("신청하기", 1)
+        result = srt.reserve_ticket(_train_row(waitlist="신청하기"))
         
         assert result is True
         assert srt.is_booked is True
@@ -391,7 +403,7 @@ class TestSRTReserveTicket:
         mock_driver = Mock()
         srt.driver = mock_driver
         
-        result = srt.reserve_ticket("매진", 1)
+        result = srt.reserve_ticket(_train_row(waitlist="매진"))
         
         assert result is False
         assert not mock_driver.find_element.called
@@ -400,7 +412,8 @@ class TestSRTReserveTicket:
 class TestSRTRefreshResult:
     """결과 새로고침 테스트"""
     
-    def test_refresh_result(self):
+    @patch('srt_reservation.main.WebDriverWait')
+    def test_refresh_result(self, mock_wait):
         """새로고침 테스트"""
         srt = SRT("동탄", "동대구", "20240115", "08")
         mock_driver = Mock()
@@ -422,9 +435,13 @@ class TestSRTCheckResult:
         """예약 성공 시 결과 확인 테스트 -- check_result가 내부에서 go_search 호출"""
         srt = SRT("동탄", "동대구", "20240115", "08", num_trains_to_check=1)
         mock_driver = Mock()
-        mock_element = Mock()
-        mock_element.text = "예약하기"
-        mock_driver.find_element.return_value = mock_element
+        # 결과 표 스냅샷 (execute_script 1회) -- 1행 일반실 예약하기
+        mock_driver.execute_script.return_value = [{
+            "index": 1, "train_no": "301", "dpt_time": "08:00", "arr_time": "10:35",
+            "special": {"text": "매진", "has_link": False, "link": None},
+            "standard": {"text": "예약하기", "has_link": True, "link": Mock()},
+            "waitlist": {"text": "매진", "has_link": False, "link": None},
+        }]
         mock_driver.find_elements.return_value = [Mock()]  # 예약 성공
         srt.driver = mock_driver
 
@@ -2,11 +2,15 @@
 
 import logging
 import logging.handlers
+import json
 import os
+import sys
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from srt_reservation.logger import setup_logger
+from srt_reservation.logger import JsonFormatter, setup_logger
+from srt_reservation.main import SRT
 
 
 @pytest.fixture(autouse=True)
@@ -134,3 +138,96 @@ class TestLevelFiltering:
         logger.warning('WARNING 메시지')
         content = (logs_dir / 'logs' / 'srt.log').read_text(encoding='utf-8')
         assert 'WARNING 메시지' in content
+
+
+
+# ── JSON 로그 형식 검증 ────────────────────────────────────────────────────────
+
+def _json_lines(logs_dir):
+    lines = (logs_dir / 'logs' / 'srt.log').read_text(encoding='utf-8').splitlines()
+    return [json.loads(line) for line in lines if line]
+
+
+class TestJsonLogFormat:
+    def test_plain_message_record(self, logs_dir):
+        logger = setup_logger('INFO', log_format='json')
+        logger.info('일반 메시지 %s', '인자')
+        (entry,) = _json_lines(logs_dir)
+        assert entry['level'] == 'INFO'
+        assert entry['msg'] == '일반 메시지 인자'
+        assert 'ts' in entry
+
+    def test_structured_fields_flattened(self, logs_dir):
+        logger = setup_logger('INFO', log_format='json')
+        logger.info('요약', extra={'fields': {'event': 'rotation', 'queries': 2}})
+        (entry,) = _json_lines(logs_dir)
+        assert entry['event'] == 'rotation'
+        assert entry['queries'] == 2
+
+    def test_exception_included(self):
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            record = logging.LogRecord('srt', logging.ERROR, __file__, 1, '실패', None, sys.exc_info())
+        entry = json.loads(JsonFormatter().format(record))
+        assert 'ValueError: boom' in entry['exc']
+
+    def test_console_stays_text(self, logs_dir):
+        logger = setup_logger('INFO', log_format='json')
+        console = next(h for h in logger.handlers if type(h) is logging.StreamHandler)
+        assert not isinstance(console.formatter, JsonFormatter)
+
+
+class TestCycleRecords:
+    """check_result 가 조건별 1건 + 순회 요약 1건의 구조화 레코드를 남기는지 검증"""
+
+    def _run_one_rotation(self, srt, rows):
+        srt.driver = MagicMock()
+        srt.driver.execute_script.return_value = rows
+        with patch.object(srt, "go_search"), \
+             patch.object(srt, "_detect_blocked_page"), \
+             patch("srt_reservation.main.time.sleep", side_effect=KeyboardInterrupt), \
+             patch("srt_reservation.main.randint", return_value=7):
+            with pytest.raises(KeyboardInterrupt):
+                srt.check_result()
+
+    def test_condition_and_rotation_records(self, logs_dir):
+        setup_logger('INFO', log_format='json')
+        srt = SRT("수서", "부산", "20260315", "08,10,12", num_trains_to_check=2)
+        rows = [
+            {"index": i, "train_no": str(299 + 2 * i), "dpt_time": t, "arr_time": "11:00",
+             "standard": {"text": "매진", "has_link": False}}
+            for i, t in enumerate(["08:10", "09:30", "10:10", "10:50", "12:10", "12:50"], start=1)
+        ]
+
+        self._run_one_rotation(srt, rows)
+
+        entries = [e for e in _json_lines(logs_dir) if 'event' in e]
+        conditions = [e for e in entries if e['event'] == 'condition']
+        assert [(e['dpt_tm'], e['source'], e['outcome']) for e in conditions] == [
+            ('08', 'query', 'none'), ('10', 'coalesced', 'none'), ('12', 'coalesced', 'none'),
+        ]
+        assert conditions[0]['rows'][0] == {
+            "train_no": "301", "dpt_time": "08:10", "arr_time": "11:00",
+            "special": "", "standard": "매진", "waitlist": "",
+        }
+        assert [r['train_no'] for r in conditions[1]['rows']] == ["305", "307"]
+        assert conditions[0]['search_ms'] >= 0 and conditions[0]['check_ms'] >= 0
+
+        (rotation,) = [e for e in entries if e['event'] == 'rotation']
+        assert rotation['conditions'] == 3
+        assert rotation['queries'] == 1
+        assert rotation['coalesced'] == 2
+        assert rotation['delay_s'] == 7
+
+    def test_one_info_line_per_condition(self, logs_dir):
+        setup_logger('INFO')
+        srt = SRT("수서", "부산", "20260315", "08,10", num_trains_to_check=1, coalesce_conditions=False)
+        rows = [{"index": 1, "train_no": "301", "dpt_time": "10:10", "arr_time": ""}]
+
+        self._run_one_rotation(srt, rows)
+
+        lines = (logs_dir / 'logs' / 'srt.log').read_text(encoding='utf-8').splitlines()
+        cycle_lines = [line for line in lines if '검색 조건:' in line or '모든 조건 확인 완료' in line]
+        assert len(cycle_lines) == 3
+        assert '예약 가능 없음' in cycle_lines[0]
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""단계별 소요시간 계측 (srt_reservation.metrics) 테스트"""
+import socket
+import urllib.error
+import urllib.request
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from srt_reservation import metrics
+from srt_reservation.main import SRT
+from srt_reservation.metrics import METRICS, Metrics, timed
+from srt_reservation.recovery import NetworkErrorRecovery, RecoveryContext
+
+
+@pytest.fixture
+def enabled():
+    METRICS.reset()
+    METRICS.enabled = True
+    yield METRICS
+    metrics.shutdown()
+    METRICS.reset()
+
+
+class TestDisabled:
+    def test_span_is_shared_noop(self):
+        registry = Metrics()
+        assert registry.span("a") is registry.span("b")
+        with registry.span("a"):
+            pass
+        registry.inc("srt_cycles_total")
+        assert registry.histogram("a") is None
+        assert registry.counter("srt_cycles_total") == 0
+
+    def test_timed_passes_through(self):
+        @timed("phase_disabled")
+        def work(x):
+            return x * 2
+
+        assert work(3) == 6
+        assert METRICS.histogram("phase_disabled") is None
+
+    def test_configure_without_outputs_stays_disabled(self):
+        assert metrics.configure() is False
+        assert METRICS.enabled is False
+
+
+class TestRegistry:
+    def test_span_and_histogram_buckets(self, enabled):
+        enabled.observe("go_search", 0.03)
+        enabled.observe("go_search", 2.0)
+        with enabled.span("login"):
+            pass
+
+        assert enabled.histogram("go_search") == (2, pytest.approx(2.03))
+        text = enabled.render()
+        assert '# TYPE srt_phase_seconds histogram' in text
+        assert 'srt_phase_seconds_bucket{phase="go_search",le="0.025"} 0' in text
+        assert 'srt_phase_seconds_bucket{phase="go_search",le="0.05"} 1' in text
+        assert 'srt_phase_seconds_bucket{phase="go_search",le="+Inf"} 2' in text
+        assert 'srt_phase_seconds_count{phase="login"} 1' in text
+
+    def test_counters_with_labels(self, enabled):
+        enabled.inc("srt_cycles_total")
+        enabled.inc("srt_cycles_total")
+        enabled.inc("srt_recoveries_total", error_type="network")
+
+        text = enabled.render()
+        assert "srt_cycles_total 2" in text
+        assert 'srt_recoveries_total{error_type="network"} 1' in text
+        assert text.count("# TYPE srt_cycles_total counter") == 1
+
+    def test_timed_records_even_on_exception(self, enabled):
+        @timed("failing")
+        def work():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            work()
+        assert enabled.histogram("failing")[0] == 1
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestExport:
+    def test_textfile(self, tmp_path):
+        path = tmp_path / "srt.prom"
+        try:
+            assert metrics.configure(textfile=str(path)) is True
+            METRICS.inc("srt_cycles_total")
+            metrics.export()
+            assert "srt_cycles_total 1" in path.read_text(encoding="utf-8")
+            assert [p.name for p in tmp_path.iterdir()] == ["srt.prom"]
+        finally:
+            metrics.shutdown()
+            METRICS.reset()
+
+    def test_http_endpoint(self):
+        try:
+            assert metrics.configure(port=0) is False  # 포트 0 은 "끔"
+            port = _free_port()
+            assert metrics.configure(port=port) is True
+            METRICS.inc("srt_refreshes_total")
+
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as resp:
+                body = resp.read().decode("utf-8")
+                assert resp.headers["Content-Type"].startswith("text/plain")
+            assert "srt_refreshes_total 1" in body
+
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/other", timeout=5)
+        finally:
+            metrics.shutdown()
+            METRICS.reset()
+        assert METRICS.enabled is False
+
+
+class TestInstrumentation:
+    def test_check_result_rotation(self, enabled):
+        srt = SRT("수서", "부산", "20260315", "08,10", num_trains_to_check=1, coalesce_conditions=False)
+        srt.driver = MagicMock()
+        srt.driver.execute_script.return_value = [
+            {"index": 1, "train_no": "301", "dpt_time": "10:10", "arr_time": ""}
+        ]
+        with patch.object(srt, "go_search"), \
+             patch("srt_reservation.main.WebDriverWait"), \
+             patch("srt_reservation.main.time.sleep", side_effect=KeyboardInterrupt), \
+             patch("srt_reservation.main.randint", return_value=1):
+            with pytest.raises(KeyboardInterrupt):
+                srt.check_result()
+
+        assert enabled.counter("srt_cycles_total") == 1
+        assert enabled.counter("srt_conditions_total", outcome="none") == 2
+        assert enabled.histogram("check_result_once")[0] == 2
+        assert enabled.histogram("detect_blocked_page")[0] == 2
+
+    def test_network_recovery_counted(self, enabled):
+        operation = MagicMock(side_effect=[TimeoutException(), "ok"])
+        with patch("srt_reservation.recovery.time.sleep"):
+            assert NetworkErrorRecovery.recover(operation, RecoveryContext()) == "ok"
+
+        assert enabled.counter("srt_recoveries_total", error_type="network") == 1
+        assert enabled.histogram("recovery_network")[0] == 1
+
+    def test_network_recovery_times_retried_operation(self, enabled):
+        """recovery_network 는 백오프 대기만이 아니라 재시도한 operation 까지 포함"""
+        clock = [100.0]
+        calls = []
+
+        def operation():
+            calls.append(1)
+            if len(calls) == 1:
+                raise TimeoutException()
+            clock[0] += 2.5  # 재시도한 조회 소요시간
+            return "ok"
+
+        with patch("srt_reservation.recovery.time.sleep", side_effect=lambda s: clock.__setitem__(0, clock[0] + s)), \
+             patch("srt_reservation.recovery.time.perf_counter", side_effect=lambda: clock[0]), \
+             patch("srt_reservation.recovery.NetworkErrorRecovery.get_wait_time", return_value=5.0):
+            assert NetworkErrorRecovery.recover(operation, RecoveryContext()) == "ok"
+            NetworkErrorRecovery.recover(lambda: "ok", RecoveryContext())  # 오류 없음 → 기록 안 함
+
+        assert enabled.histogram("recovery_network") == (1, 7.5)
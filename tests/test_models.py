@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""검색 결과 모델 (TrainRow, ResultPage) 단위 테스트"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from srt_reservation.models import EMPTY_SEAT, ResultPage, SeatCell, TrainRow
+
+
+def _raw(index=1, standard="매진", waitlist="매진", link=None):
+    return {
+        "index": index,
+        "train_no": "305",
+        "dpt_time": "08:10",
+        "arr_time": "10:45",
+        "special": {"text": "매진", "has_link": False, "link": None},
+        "standard": {"text": standard, "has_link": link is not None, "link": link},
+        "waitlist": {"text": waitlist, "has_link": False, "link": None},
+    }
+
+
+class TestSeatCell:
+    def test_from_snapshot(self):
+        link = MagicMock()
+        cell = SeatCell.from_snapshot({"text": "예약하기", "has_link": True, "link": link})
+        assert cell == SeatCell("예약하기", True, link)
+
+    def test_from_snapshot_non_dict_is_empty(self):
+        assert SeatCell.from_snapshot(None) is EMPTY_SEAT
+
+
+class TestTrainRow:
+    def test_from_snapshot_fields(self):
+        row = TrainRow.from_snapshot(_raw(index=3))
+        assert row.index == 3
+        assert row.train_no == "305"
+        assert (row.dpt_time, row.arr_time) == ("08:10", "10:45")
+
+    def test_can_book_and_waitlist(self):
+        assert TrainRow.from_snapshot(_raw(standard="예약하기")).can_book is True
+        assert TrainRow.from_snapshot(_raw(standard="매진")).can_book is False
+        assert TrainRow.from_snapshot(_raw(waitlist="신청하기")).can_waitlist is True
+
+    def test_without_links_drops_elements(self):
+        row = TrainRow.from_snapshot(_raw(standard="예약하기", link=MagicMock()))
+        stripped = row.without_links()
+        assert stripped.standard.link is None
+        assert stripped.standard.has_link is True
+        assert stripped.train_no == row.train_no
+
+    def test_describe(self):
+        row = TrainRow.from_snapshot(_raw(standard="예약하기", waitlist=""))
+        assert row.describe() == "305 08:10→10:45 일반:예약하기 대기:-"
+
+    def test_missing_fields_default_to_empty(self):
+        row = TrainRow.from_snapshot({})
+        assert row.index == 0 and row.train_no == "" and row.standard is EMPTY_SEAT
+
+
+class TestResultPage:
+    def test_from_snapshot_and_candidates(self):
+        page = ResultPage.from_snapshot([_raw(1), _raw(2), _raw(3)], "20260315", "08")
+        assert len(page) == 3
+        assert [row.index for row in page.candidates(2)] == [1, 2]
+
+    def test_from_snapshot_ignores_garbage(self):
+        assert len(ResultPage.from_snapshot(MagicMock(), "20260315", "08")) == 0
+        assert len(ResultPage.from_snapshot([None, "x", _raw(1)], "20260315", "08")) == 1
+
+    def test_slots_no_instance_dict(self):
+        page = ResultPage("20260315", "08", ())
+        with pytest.raises(AttributeError):
+            page.extra = 1
+
+    def test_without_links_keeps_metadata(self):
+        page = ResultPage.from_snapshot([_raw(1, link=MagicMock())], "20260315", "08")
+        copy = page.without_links()
+        assert copy.fetched_at == page.fetched_at
+        assert copy.rows[0].standard.link is None
@@ -2,14 +2,18 @@
 """TelegramNotifier 유닛 테스트"""
 import os
 import json
-import urllib.error
+import http.client
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import BytesIO
 from unittest import mock
 from unittest.mock import MagicMock, patch, call
 
 import pytest
 
-from srt_reservation.notifier import TelegramNotifier
+import threading
+
+from srt_reservation.notifier import EnvFileLoader, KeepAliveTransport, NotificationDispatcher, TelegramNotifier
 
 
 # ---------------------------------------------------------------------------
@@ -112,84 +116,126 @@ class TestIsConfigured:
         assert n.is_configured() is False
 
 
+# ---------------------------------------------------------------------------
+# .env 변경 감지 재로딩 (EnvFileLoader) 테스트
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def env_file(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text("SRT_TEST_ENV_A=1\n", encoding="utf-8")
+    yield path
+    for key in ("SRT_TEST_ENV_A", "SRT_TEST_ENV_B"):
+        os.environ.pop(key, None)
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestEnvFileLoader:
+    def test_parses_only_when_changed(self, env_file):
+        loader = EnvFileLoader(env_file)
+        with patch("dotenv.load_dotenv") as mock_load:
+            assert loader.refresh() is True
+            assert loader.refresh() is False
+            assert loader.refresh() is False
+        mock_load.assert_called_once_with(env_file, override=False)
+        assert loader.loads == 1
+
+    def test_hot_reloads_added_key(self, env_file):
+        loader = EnvFileLoader(env_file)
+        loader.refresh()
+        assert os.environ.get("SRT_TEST_ENV_A") == "1"
+
+        env_file.write_text("SRT_TEST_ENV_A=1\nSRT_TEST_ENV_B=2\n", encoding="utf-8")
+        _bump_mtime(env_file)
+        assert loader.refresh() is True
+        assert os.environ.get("SRT_TEST_ENV_B") == "2"
+
+    def test_replaced_file_reloaded(self, env_file):
+        loader = EnvFileLoader(env_file)
+        loader.refresh()
+        replacement = env_file.with_name(".env.new")
+        replacement.write_text("SRT_TEST_ENV_A=1\n", encoding="utf-8")
+        os.utime(replacement, ns=(os.stat(env_file).st_atime_ns, os.stat(env_file).st_mtime_ns))
+        os.replace(replacement, env_file)  # 같은 내용·mtime, 다른 inode
+        assert loader.refresh() is True
+
+    def test_missing_file(self, tmp_path):
+        loader = EnvFileLoader(tmp_path / ".env")
+        assert loader.refresh() is False
+        assert loader.loads == 0
+
+
 # ---------------------------------------------------------------------------
 # send_message 테스트
 # ---------------------------------------------------------------------------
 
 class TestSendMessage:
-    def _make_response(self, status=200, body=b'{"ok":true}'):
-        resp = MagicMock()
-        resp.status = status
-        resp.__enter__ = lambda s: s
-        resp.__exit__ = MagicMock(return_value=False)
-        return resp
+    @staticmethod
+    def _patch_post(notifier, **kwargs):
+        kwargs.setdefault("return_value", 200)
+        return patch.object(notifier._transport, "post_form", **kwargs)
 
     def test_returns_false_when_not_configured(self, notifier_unconfigured):
         result = notifier_unconfigured.send_message("hello")
         assert result is False
 
     def test_does_not_call_api_when_not_configured(self, notifier_unconfigured):
-        with patch("urllib.request.urlopen") as mock_urlopen:
+        with self._patch_post(notifier_unconfigured) as mock_post:
             notifier_unconfigured.send_message("hello")
-            mock_urlopen.assert_not_called()
+            mock_post.assert_not_called()
 
     def test_returns_true_on_success(self, notifier_configured):
-        resp = self._make_response(status=200)
-        with patch("urllib.request.urlopen", return_value=resp):
+        with self._patch_post(notifier_configured):
             result = notifier_configured.send_message("hello")
         assert result is True
 
     def test_calls_correct_api_url(self, notifier_configured):
-        resp = self._make_response(status=200)
-        with patch("urllib.request.urlopen", return_value=resp) as mock_urlopen:
+        transport = notifier_configured._transport
+        assert transport.scheme == "https"
+        assert transport.host == "api.telegram.org"
+        with self._patch_post(notifier_configured) as mock_post:
             notifier_configured.send_message("test")
-            args = mock_urlopen.call_args
-            req = args[0][0]
-            assert "api.telegram.org" in req.full_url
-            assert "test_token_123" in req.full_url
+            path = mock_post.call_args[0][0]
+            assert path == "/bottest_token_123/sendMessage"
 
     def test_sends_correct_chat_id(self, notifier_configured):
-        resp = self._make_response(status=200)
-        with patch("urllib.request.urlopen", return_value=resp) as mock_urlopen:
+        with self._patch_post(notifier_configured) as mock_post:
             notifier_configured.send_message("test")
-            req = mock_urlopen.call_args[0][0]
-            body = req.data.decode("utf-8")
-            assert "12345678" in body
+            fields = mock_post.call_args[0][1]
+            assert fields["chat_id"] == "12345678"
 
     def test_sends_message_text_in_body(self, notifier_configured):
-        resp = self._make_response(status=200)
-        with patch("urllib.request.urlopen", return_value=resp) as mock_urlopen:
+        with self._patch_post(notifier_configured) as mock_post:
             notifier_configured.send_message("안녕하세요")
-            req = mock_urlopen.call_args[0][0]
-            body = req.data.decode("utf-8")
-            assert "chat_id" in body
-            assert "text" in body
+            fields = mock_post.call_args[0][1]
+            assert fields["text"] == "안녕하세요"
 
     def test_returns_false_on_non_200_status(self, notifier_configured):
-        resp = self._make_response(status=400)
-        with patch("urllib.request.urlopen", return_value=resp):
+        with self._patch_post(notifier_configured, return_value=400):
             result = notifier_configured.send_message("hello")
         assert result is False
 
     def test_returns_false_on_http_error(self, notifier_configured):
-        with patch("urllib.request.urlopen",
-                   side_effect=urllib.error.HTTPError(None, 500, "Server Error", {}, None)):
+        with self._patch_post(notifier_configured, side_effect=http.client.BadStatusLine("garbage")):
             result = notifier_configured.send_message("hello")
         assert result is False
 
-    def test_returns_false_on_url_error(self, notifier_configured):
-        with patch("urllib.request.urlopen",
-                   side_effect=urllib.error.URLError("connection refused")):
+    def test_returns_false_on_connection_error(self, notifier_configured):
+        with self._patch_post(notifier_configured, side_effect=ConnectionRefusedError("connection refused")):
             result = notifier_configured.send_message("hello")
         assert result is False
 
     def test_returns_false_on_generic_exception(self, notifier_configured):
-        with patch("urllib.request.urlopen", side_effect=Exception("unexpected")):
+        with self._patch_post(notifier_configured, side_effect=Exception("unexpected")):
             result = notifier_configured.send_message("hello")
         assert result is False
 
     def test_does_not_raise_on_failure(self, notifier_configured):
-        with patch("urllib.request.urlopen", side_effect=Exception("boom")):
+        with self._patch_post(notifier_configured, side_effect=Exception("boom")):
             # 예외가 전파되지 않아야 함
             try:
                 notifier_configured.send_message("hello")
@@ -197,12 +243,7 @@ class TestSendMessage:
                 pytest.fail("send_message raised an exception")
 
     def test_timeout_5_seconds(self, notifier_configured):
-        resp = self._make_response(status=200)
-        with patch("urllib.request.urlopen", return_value=resp) as mock_urlopen:
-            notifier_configured.send_message("hello")
-            args, kwargs = mock_urlopen.call_args
-            assert kwargs.get("timeout") == 5 or args[1] == 5
-
+        assert notifier_configured._transport.timeout == 5
 
 # ---------------------------------------------------------------------------
 # notify_success 테스트
@@ -306,3 +347,196 @@ class TestNotifyFailure:
                 notifier_configured.notify_failure("오류")
             except Exception:
                 pytest.fail("notify_failure raised an exception")
+
+
+# ---------------------------------------------------------------------------
+# 백그라운드 발송 (NotificationDispatcher) 테스트
+# ---------------------------------------------------------------------------
+
+class TestNotificationDispatcher:
+    def test_submit_returns_before_send_completes(self):
+        release = threading.Event()
+        sent = []
+
+        def slow_send(message):
+            release.wait(5)
+            sent.append(message)
+            return True
+
+        dispatcher = NotificationDispatcher(slow_send)
+        assert dispatcher.submit("hello") is True
+        assert sent == []
+
+        release.set()
+        assert dispatcher.flush(5) is True
+        assert sent == ["hello"]
+        assert dispatcher.sent == 1
+
+    def test_retries_with_backoff(self):
+        send = MagicMock(side_effect=[False, False, True])
+        dispatcher = NotificationDispatcher(send, max_attempts=3, backoff_base=0.5)
+        with patch("srt_reservation.notifier.time.sleep") as mock_sleep:
+            dispatcher.submit("msg")
+            assert dispatcher.flush(5) is True
+        assert send.call_count == 3
+        assert mock_sleep.call_args_list == [call(0.5), call(1.0)]
+        assert dispatcher.failed == 0
+
+    def test_gives_up_after_max_attempts(self):
+        send = MagicMock(return_value=False)
+        dispatcher = NotificationDispatcher(send, max_attempts=2, backoff_base=0)
+        dispatcher.submit("msg")
+        assert dispatcher.flush(5) is True
+        assert send.call_count == 2
+        assert dispatcher.failed == 1
+
+    def test_worker_survives_send_exception(self):
+        send = MagicMock(side_effect=[RuntimeError("boom"), True])
+        dispatcher = NotificationDispatcher(send, max_attempts=1)
+        dispatcher.submit("first")
+        dispatcher.submit("second")
+        assert dispatcher.flush(5) is True
+        assert dispatcher.sent == 1
+
+    def test_full_queue_drops_oldest(self):
+        release = threading.Event()
+        started = threading.Event()
+        sent = []
+
+        def send(message):
+            started.set()
+            release.wait(5)
+            sent.append(message)
+            return True
+
+        dispatcher = NotificationDispatcher(send, maxsize=2)
+        dispatcher.submit("in-flight")
+        assert started.wait(5)
+        for message in ("a", "b", "c"):
+            dispatcher.submit(message)
+        release.set()
+        dispatcher.flush(5)
+
+        assert sent == ["in-flight", "b", "c"]
+        assert dispatcher.dropped == 1
+
+    def test_flush_times_out(self):
+        release = threading.Event()
+        dispatcher = NotificationDispatcher(lambda m: release.wait(5))
+        dispatcher.submit("stuck")
+        assert dispatcher.flush(0.05) is False
+        release.set()
+        assert dispatcher.flush(5) is True
+
+
+class TestBackgroundNotifier:
+    def test_send_message_queues_and_flush_delivers(self, configured_env):
+        n = TelegramNotifier(background=True)
+        with patch.object(n, "_send_now", return_value=True) as mock_send:
+            assert n.send_message("hello") is True
+            assert n.flush(5) is True
+        mock_send.assert_called_once_with("hello")
+
+    def test_unconfigured_not_queued(self, unconfigured_env):
+        n = TelegramNotifier(background=True)
+        assert n.send_message("hello") is False
+        assert n._dispatcher.pending() == 0
+
+    def test_sync_flush_is_noop(self, notifier_configured):
+        assert notifier_configured.flush() is True
+
+
+# ---------------------------------------------------------------------------
+# keep-alive 전송 (KeepAliveTransport) 테스트 — 로컬 HTTP 스탠드인
+# ---------------------------------------------------------------------------
+
+class _BotApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append((self.path, urllib.parse.parse_qs(body.decode("utf-8"))))
+        payload = b'{"ok":true}'
+        self.send_response(self.server.status)
+        self.send_header("Content-Length", str(len(payload)))
+        if self.server.close_after_each:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def bot_api():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _BotApiHandler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.requests = []
+    server.status = 200
+    server.close_after_each = False
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestKeepAliveTransport:
+    def test_reuses_connection(self, bot_api):
+        transport = KeepAliveTransport(bot_api.url)
+        for i in range(3):
+            assert transport.post_form("/botT/sendMessage", {"text": str(i)}) == 200
+        transport.close()
+
+        assert bot_api.connections == 1
+        assert transport.connections_opened == 1
+        assert [fields["text"] for _, fields in bot_api.requests] == [["0"], ["1"], ["2"]]
+
+    def test_reconnects_when_server_dropped_connection(self, bot_api):
+        transport = KeepAliveTransport(bot_api.url)
+        transport.post_form("/botT/sendMessage", {"text": "a"})
+        # 서버가 유휴 연결을 끊은 상황
+        for conn in transport._idle:
+            conn.sock.shutdown(2)
+
+        assert transport.post_form("/botT/sendMessage", {"text": "b"}) == 200
+        assert transport.connections_opened == 2
+        assert len(bot_api.requests) == 2
+
+    def test_connection_close_response_not_pooled(self, bot_api):
+        bot_api.close_after_each = True
+        transport = KeepAliveTransport(bot_api.url)
+        transport.post_form("/x", {})
+        assert transport._idle == []
+
+    def test_path_prefix_and_status(self, bot_api):
+        bot_api.status = 429
+        transport = KeepAliveTransport(bot_api.url + "/proxy/")
+        assert transport.post_form("/botT/sendMessage", {}) == 429
+        assert bot_api.requests[0][0] == "/proxy/botT/sendMessage"
+
+    def test_connection_refused_raises(self):
+        transport = KeepAliveTransport("http://127.0.0.1:9", timeout=1)
+        with pytest.raises(OSError):
+            transport.post_form("/x", {})
+
+    def test_rejects_unsupported_url(self):
+        with pytest.raises(ValueError):
+            KeepAliveTransport("ftp://example.com")
+
+    def test_notifier_burst_over_one_connection(self, configured_env, bot_api):
+        n = TelegramNotifier(api_base=bot_api.url)
+        assert n.send_message("차단 감지") is True
+        assert n.notify_failure("차단") is True
+
+        assert bot_api.connections == 1
+        path, fields = bot_api.requests[0]
+        assert path == "/bottest_token_123/sendMessage"
+        assert fields == {"chat_id": ["12345678"], "text": ["차단 감지"]}
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""고정 sleep / implicit wait 대신 DOM 조건으로 페이지 준비를 기다리는지 테스트"""
+from unittest.mock import MagicMock, patch
+
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    UnexpectedAlertPresentException,
+)
+
+from benchmarks.bench_cycle import LEGACY_FIXED_WAIT_PER_CYCLE, seconds_saved_per_cycle
+from srt_reservation.main import SRT
+
+
+def _make_srt():
+    srt = SRT("수서", "부산", "20260315", "08")
+    srt.driver = MagicMock()
+    return srt
+
+
+class TestWaitForPage:
+    def test_returns_true_when_condition_met(self):
+        srt = _make_srt()
+        assert srt._wait_for_page(lambda d: True, "테스트") is True
+
+    def test_timeout_returns_false(self, caplog):
+        srt = _make_srt()
+        assert srt._wait_for_page(lambda d: False, "테스트", timeout=0.2) is False
+        assert "테스트 대기 시간 초과" in caplog.text
+
+    def test_alert_counts_as_ready(self):
+        srt = _make_srt()
+
+        def _alert(driver):
+            raise UnexpectedAlertPresentException("잔여석 없음")
+
+        assert srt._wait_for_page(_alert, "테스트", timeout=0.2) is True
+
+    def test_navigated_from_detects_stale_document(self):
+        old_page = MagicMock()
+        assert SRT._navigated_from(old_page, None) is False
+        old_page.is_enabled.side_effect = StaleElementReferenceException()
+        assert SRT._navigated_from(old_page, None) is True
+
+    def test_wait_for_results_checks_ready_script_after_navigation(self):
+        srt = _make_srt()
+        old_page = MagicMock()
+        old_page.is_enabled.side_effect = StaleElementReferenceException()
+        srt.driver.execute_script.return_value = True
+
+        assert srt._wait_for_results(old_page) is True
+        srt.driver.execute_script.assert_called_with(SRT._RESULTS_READY_SCRIPT)
+
+
+class TestNoFixedSleeps:
+    @patch("srt_reservation.main.time.sleep")
+    @patch("srt_reservation.main.WebDriverWait")
+    def test_refresh_result_does_not_sleep(self, mock_wait, mock_sleep):
+        srt = _make_srt()
+        srt.refresh_result()
+
+        mock_sleep.assert_not_called()
+        srt.driver.implicitly_wait.assert_not_called()
+        assert srt.cnt_refresh == 1
+
+    @patch("srt_reservation.main.time.sleep")
+    @patch("srt_reservation.main.WebDriverWait")
+    def test_go_search_does_not_sleep(self, mock_wait, mock_sleep):
+        srt = _make_srt()
+        with patch("srt_reservation.main.Select"):
+            srt.go_search()
+
+        mock_sleep.assert_not_called()
+        srt.driver.implicitly_wait.assert_not_called()
+
+    @patch("srt_reservation.main.WebDriverWait")
+    def test_book_ticket_does_not_set_implicit_wait(self, mock_wait):
+        srt = _make_srt()
+        srt.driver.find_elements.return_value = []
+        row = MagicMock(can_book=True, index=1)
+        row.standard.link = MagicMock()
+
+        assert srt.book_ticket(row) is None
+        srt.driver.implicitly_wait.assert_not_called()
+        srt.driver.back.assert_called_once()
+
+    @patch("srt_reservation.main.time.sleep")
+    def test_confirm_login_retries_without_sleep(self, mock_sleep):
+        srt = _make_srt()
+        srt.check_login = MagicMock(side_effect=[False, False, True])
+
+        assert srt.confirm_login() is True
+        assert srt.check_login.call_count == 3
+        mock_sleep.assert_not_called()
+
+    def test_confirm_login_gives_up(self):
+        srt = _make_srt()
+        srt.check_login = MagicMock(return_value=False)
+        assert srt.confirm_login(attempts=2) is False
+        assert srt.check_login.call_count == 2
+
+
+class TestBenchmarkSavings:
+    def test_seconds_saved_per_cycle(self):
+        samples = {"page_wait": [0.5, 1.5]}
+        assert seconds_saved_per_cycle(samples) == LEGACY_FIXED_WAIT_PER_CYCLE - 1.0
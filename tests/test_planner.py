@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""검색 조건 병합 (SearchPlanner) 과 작업 간 조회 결과 공유 (SharedResultCache) 테스트"""
+from argparse import Namespace
+from unittest.mock import MagicMock, patch
+
+from srt_reservation.config import Config
+from srt_reservation.main import SRT
+from srt_reservation.models import EMPTY_SEAT, ResultPage, SeatCell, TrainRow
+from srt_reservation.planner import SearchPlanner, SharedResultCache
+
+
+def _page(dpt_dt, dpt_tm, times):
+    rows = tuple(
+        TrainRow(i, str(299 + 2 * i), t, "", EMPTY_SEAT, EMPTY_SEAT, EMPTY_SEAT)
+        for i, t in enumerate(times, start=1)
+    )
+    return ResultPage(dpt_dt, dpt_tm, rows)
+
+
+def _cond(dpt_dt, dpt_tm):
+    return {"dpt_dt": dpt_dt, "dpt_tm": dpt_tm}
+
+
+class TestConfig:
+    def test_env_disables_coalescing(self, monkeypatch):
+        monkeypatch.setenv("COALESCE_CONDITIONS", "false")
+        config = Config.merge(Config.load_from_cli(Namespace()), Config.load_from_env())
+        assert config["coalesce_conditions"] is False
+        assert Config.DEFAULTS["coalesce_conditions"] is True
+
+
+class TestCoveredPage:
+    def test_later_slot_covered_by_earlier_query(self):
+        planner = SearchPlanner(num_trains_to_check=2)
+        planner.start_rotation()
+        planner.record(_page("20260315", "08", ["08:10", "09:30", "10:10", "10:50", "11:30"]))
+
+        covered = planner.covered_page(_cond("20260315", "10"))
+        assert [row.dpt_time for row in covered.candidates(2)] == ["10:10", "10:50"]
+        assert covered.dpt_tm == "10"
+        assert (planner.queries, planner.saved) == (1, 1)
+
+    def test_incomplete_coverage_needs_query(self):
+        planner = SearchPlanner(num_trains_to_check=2)
+        planner.record(_page("20260315", "08", ["08:10", "09:30", "11:50"]))
+        assert planner.covered_page(_cond("20260315", "10")) is None
+        assert planner.saved == 0
+
+    def test_other_date_or_earlier_slot_not_covered(self):
+        planner = SearchPlanner(num_trains_to_check=1)
+        planner.record(_page("20260315", "10", ["10:10", "12:30"]))
+        assert planner.covered_page(_cond("20260316", "10")) is None
+        assert planner.covered_page(_cond("20260315", "08")) is None
+
+    def test_invalidate_and_new_rotation_drop_pages(self):
+        planner = SearchPlanner(num_trains_to_check=1)
+        planner.record(_page("20260315", "08", ["10:10"]))
+        planner.invalidate()
+        assert planner.covered_page(_cond("20260315", "10")) is None
+
+        planner.record(_page("20260315", "08", ["10:10"]))
+        planner.start_rotation()
+        assert planner.covered_page(_cond("20260315", "10")) is None
+
+    def test_disabled(self):
+        planner = SearchPlanner(num_trains_to_check=1, enabled=False)
+        planner.record(_page("20260315", "08", ["10:10"]))
+        assert planner.covered_page(_cond("20260315", "10")) is None
+
+    def test_unpadded_times(self):
+        page = _page("20260315", "08", ["8:10", "9:30", "10:10"])
+        assert [row.dpt_time for row in page.departing_from("10")] == ["10:10"]
+        assert len(page.departing_from("08")) == 3
+
+
+class TestCheckResultCoalescing:
+    def _run_one_rotation(self, srt, rows):
+        srt.driver = MagicMock()
+        srt.driver.execute_script.return_value = rows
+        with patch.object(srt, "go_search") as mock_go_search, \
+             patch.object(srt, "_detect_blocked_page"), \
+             patch("srt_reservation.main.time.sleep", side_effect=KeyboardInterrupt), \
+             patch("srt_reservation.main.randint", return_value=1):
+            try:
+                srt.check_result()
+            except KeyboardInterrupt:
+                pass
+        return mock_go_search
+
+    def test_skips_covered_queries(self):
+        srt = SRT("수서", "부산", "20260315", "08,10,12", num_trains_to_check=2)
+        rows = [
+            {"index": i, "train_no": str(299 + 2 * i), "dpt_time": t, "arr_time": ""}
+            for i, t in enumerate(["08:10", "09:30", "10:10", "10:50", "12:10", "12:50"], start=1)
+        ]
+
+        mock_go_search = self._run_one_rotation(srt, rows)
+
+        mock_go_search.assert_called_once_with(dpt_dt="20260315", dpt_tm="08")
+        assert srt.search_counts["coalesced"] == 2
+        assert [page.dpt_tm for page in srt.result_history] == ["08"]
+
+    def test_queries_when_not_covered(self):
+        srt = SRT("수서", "부산", "20260315", "08,10", num_trains_to_check=2)
+        rows = [{"index": 1, "train_no": "301", "dpt_time": "08:10", "arr_time": ""}]
+
+        mock_go_search = self._run_one_rotation(srt, rows)
+
+        assert mock_go_search.call_count == 2
+        assert srt.search_counts["coalesced"] == 0
+
+    def test_keeps_user_time_priority(self):
+        srt = SRT("수서", "부산", "20260315", "10,08", num_trains_to_check=1)
+        rows = [
+            {"index": i, "train_no": str(299 + 2 * i), "dpt_time": t, "arr_time": ""}
+            for i, t in enumerate(["08:10", "10:10"], start=1)
+        ]
+
+        mock_go_search = self._run_one_rotation(srt, rows)
+
+        assert [c.kwargs["dpt_tm"] for c in mock_go_search.call_args_list] == ["10", "08"]
+        assert srt.search_counts["coalesced"] == 0
+
+    def test_disabled_queries_every_condition(self):
+        srt = SRT("수서", "부산", "20260315", "08,10", num_trains_to_check=1, coalesce_conditions=False)
+        rows = [{"index": 1, "train_no": "301", "dpt_time": "10:10", "arr_time": ""}]
+
+        mock_go_search = self._run_one_rotation(srt, rows)
+
+        assert mock_go_search.call_count == 2
+
+
+class TestSharedResultCache:
+    def _cache(self, ttl=30):
+        now = [100.0]
+        return SharedResultCache(ttl, clock=lambda: now[0]), now
+
+    def test_live_page_keeps_links_until_navigation(self):
+        cache, _ = self._cache()
+        link = MagicMock()
+        row = TrainRow(1, "301", "08:10", "", EMPTY_SEAT, SeatCell("예약하기", True, link), EMPTY_SEAT)
+        cache.put("수서", "부산", ResultPage("20260315", "08", (row,)))
+
+        page, live = cache.get("수서", "부산", "20260315", "8")
+        assert live and page.rows[0].standard.link is link
+
+        cache.navigated()
+        page, live = cache.get("수서", "부산", "20260315", "08")
+        assert not live and page.rows[0].standard.link is None
+        assert page.rows[0].can_book
+
+    def test_slot_key_and_ttl(self):
+        cache, now = self._cache(ttl=30)
+        cache.put("수서", "부산", _page("20260315", "08", ["08:10"]))
+        assert cache.get("수서", "동대구", "20260315", "08") == (None, False)
+        assert cache.get("수서", "부산", "20260315", "10") == (None, False)
+
+        now[0] += 30
+        assert cache.get("수서", "부산", "20260315", "08") == (None, False)
+        cache.put("수서", "부산", _page("20260315", "10", ["10:10"]))
+        assert len(cache) == 1
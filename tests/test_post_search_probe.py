@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+검색 직후 통합 페이지 확인 (_probe_after_search) 테스트.
+
+차단/로그인/결과 표 판별과 결과 행을 execute_script 1회로 받아 check_result 가
+그 결과로 분기하는지 확인한다. 판별할 수 없으면 기존 개별 확인 경로로 돌아간다.
+"""
+import json
+import shutil
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import (
+    TimeoutException, UnexpectedAlertPresentException, WebDriverException,
+)
+
+from srt_reservation.exceptions import BlockedByServerError
+from srt_reservation.main import SRT
+
+ROW = {
+    "index": 1, "train_no": "301", "dpt_time": "10:10", "arr_time": "12:40",
+    "special": {"text": "매진", "has_link": False, "link": None},
+    "standard": {"text": "매진", "has_link": False, "link": None},
+    "waitlist": {"text": "", "has_link": False, "link": None},
+}
+
+
+def _make_srt(probe):
+    srt = SRT("수서", "부산", "20260315", "10", num_trains_to_check=1)
+    srt.driver = MagicMock()
+    if isinstance(probe, Exception):
+        srt.driver.execute_script.side_effect = probe
+    else:
+        srt.driver.execute_script.return_value = probe
+    srt.notifier = MagicMock()
+    srt.notifier.is_configured.return_value = False
+    return srt
+
+
+class TestProbeAfterSearch:
+    def test_single_round_trip(self):
+        srt = _make_srt({"kind": "results", "url": "https://etk.srail.kr/x", "rows": [ROW]})
+        probe = srt._probe_after_search()
+        assert probe["kind"] == "results"
+        srt.driver.execute_script.assert_called_once_with(
+            SRT._POST_SEARCH_PROBE_SCRIPT, SRT._RESULT_ROW_SELECTOR
+        )
+
+    def test_alert_reported_as_kind(self):
+        srt = _make_srt(UnexpectedAlertPresentException("세션이 만료되었습니다"))
+        assert srt._probe_after_search()["kind"] == "alert"
+
+    @pytest.mark.parametrize("probe", [
+        WebDriverException("disconnected"),
+        MagicMock(),
+        [ROW],
+        {"kind": "unknown"},
+    ])
+    def test_unusable_result_is_none(self, probe):
+        assert _make_srt(probe)._probe_after_search() is None
+
+
+class TestCheckResultDispatch:
+    """check_result 가 probe 결과로 분기"""
+
+    @staticmethod
+    def _run(srt, sleep=KeyboardInterrupt):
+        with patch.object(srt, "go_search"), \
+             patch("srt_reservation.main.time.sleep", side_effect=sleep), \
+             patch("srt_reservation.main.randint", return_value=1):
+            return srt.check_result()
+
+    def test_results_parsed_without_extra_commands(self):
+        srt = _make_srt({"kind": "results", "url": "u", "rows": [ROW]})
+        with patch.object(srt, "_detect_blocked_page") as detect, pytest.raises(KeyboardInterrupt):
+            self._run(srt)
+
+        detect.assert_not_called()
+        assert srt.driver.execute_script.call_count == 1
+        assert srt.last_result_page.rows[0].train_no == "301"
+        srt.driver.switch_to.alert.accept.assert_not_called()
+
+    def test_block_raises_before_parsing(self):
+        probe = {"kind": "block", "url": "u",
+                 "matched": list(SRT._BLOCK_SIGNATURES[:2]), "request_id": "abc123"}
+        srt = _make_srt(probe)
+        with patch.object(srt, "_check_result_once") as once, \
+             pytest.raises(BlockedByServerError) as exc_info:
+            self._run(srt)
+
+        assert exc_info.value.request_id == "abc123"
+        once.assert_not_called()
+
+    @pytest.mark.parametrize("kind, probe", [
+        ("login", {"kind": "login", "url": "https://etk.srail.kr/cmc/01/selectLoginForm.do"}),
+        ("alert", UnexpectedAlertPresentException("세션이 만료되었습니다")),
+    ])
+    def test_session_expiry_recovers_and_moves_on(self, kind, probe):
+        srt = _make_srt(probe)
+        with patch("srt_reservation.main.SessionRecovery.recover") as recover, \
+             patch("srt_reservation.main.SessionRecovery.is_session_expired") as expired, \
+             patch.object(srt, "_check_result_once") as once, \
+             pytest.raises(KeyboardInterrupt):
+            self._run(srt)
+
+        recover.assert_called_once()
+        expired.assert_not_called()
+        once.assert_not_called()
+        assert srt.driver.switch_to.alert.accept.called == (kind == "alert")
+
+    def test_error_page_uses_regular_check(self):
+        srt = _make_srt({"kind": "error", "url": "u"})
+        with patch.object(srt, "_check_result_once", return_value=None) as once, \
+             patch.object(srt, "_detect_blocked_page") as detect, \
+             pytest.raises(KeyboardInterrupt):
+            self._run(srt)
+
+        once.assert_called_once_with()
+        detect.assert_not_called()
+
+    def test_retry_after_network_error_resnapshots(self):
+        srt = _make_srt({"kind": "results", "url": "u", "rows": [ROW]})
+        pages = []
+
+        def once(page=None):
+            pages.append(page)
+            if len(pages) == 1:
+                raise TimeoutException("read timed out")
+            return None
+
+        def sleep(seconds):
+            # 복구 대기(5초 이상)는 건너뛰고 순회 대기(randint=1)에서 멈춘다
+            if seconds == 1:
+                raise KeyboardInterrupt
+
+        with patch.object(srt, "_check_result_once", side_effect=once), \
+             pytest.raises(KeyboardInterrupt):
+            self._run(srt, sleep=sleep)
+
+        assert pages[0] is not None and pages[0].rows[0].train_no == "301"
+        assert pages[1] is None
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node 필요")
+class TestPostSearchProbeScript:
+    """_POST_SEARCH_PROBE_SCRIPT 를 최소한의 가짜 DOM 위에서 node 로 실행"""
+
+    @staticmethod
+    def _run(body_text="", pathname="/hpg/hra/01/selectScheduleList.do", ids=(), result_form=True):
+        program = f"""
+        const location = {{href: "https://etk.srail.kr" + {json.dumps(pathname)}, pathname: {json.dumps(pathname)}}};
+        const ids = {json.dumps(list(ids))};
+        const cell = (text) => ({{innerText: text, querySelector: () => null}});
+        const document = {{
+            body: {{innerText: {json.dumps(body_text)}}},
+            getElementById: (id) => ids.includes(id) ? {{}} : null,
+            querySelector: (sel) => {json.dumps(result_form)} && sel === '#result-form' ? {{}} : null,
+            querySelectorAll: () => [{{children: ["", "", "301", "10:10", "12:40", "매진", "매진", ""].map(cell)}}],
+        }};
+        console.log(JSON.stringify((function () {{ {SRT._POST_SEARCH_PROBE_SCRIPT} }})("tr")));
+        """
+        out = subprocess.run(["node", "-e", program], capture_output=True, text=True, timeout=30, check=True)
+        return json.loads(out.stdout)
+
+    def test_results(self):
+        probe = self._run("잔여석조회결과")
+        assert probe["kind"] == "results"
+        assert probe["rows"][0]["train_no"] == "301"
+        assert probe["rows"][0]["dpt_time"] == "10:10"
+
+    def test_block_takes_precedence(self):
+        probe = self._run("접속 제한 안내. 비정상적인 접근이 감지되었습니다. 요청 ID: ab12")
+        assert probe["kind"] == "block"
+        assert probe["request_id"] == "ab12"
+
+    def test_login(self):
+        assert self._run(pathname="/cmc/01/selectLoginForm.do")["kind"] == "login"
+        assert self._run(ids=["srchDvNm01"])["kind"] == "login"
+
+    def test_error_without_result_form(self):
+        assert self._run(result_form=False)["kind"] == "error"
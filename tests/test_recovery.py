@@ -6,7 +6,9 @@ RecoveryContext, NetworkErrorRecovery, SessionRecovery, BrowserRecovery 테스
 """
 import pytest
 from unittest.mock import MagicMock, patch, call
-from selenium.common.exceptions import TimeoutException, NoAlertPresentException
+from selenium.common.exceptions import (
+    TimeoutException, NoAlertPresentException, UnexpectedAlertPresentException,
+)
 
 from srt_reservation.recovery import (
     RecoveryContext,
@@ -14,6 +16,7 @@ from srt_reservation.recovery import (
     ErrorType,
     NetworkErrorRecovery,
     SessionRecovery,
+    SessionExpiryTracker,
     BrowserRecovery,
     is_network_error,
     is_session_error,
@@ -174,12 +177,30 @@ class TestSessionRecovery:
 
     def test_session_expired_alert_present(self):
         driver = MagicMock()
-        driver.current_url = "https://etk.srail.co.kr/some/page"
+        driver.execute_script.side_effect = UnexpectedAlertPresentException("세션이 만료되었습니다")
         alert = MagicMock()
         driver.switch_to.alert = alert
 
         assert SessionRecovery.is_session_expired(driver) is True
-        alert.accept.assert_called_once()
+        alert.accept.assert_not_called()
+
+    def test_session_state_read_in_one_script(self):
+        driver = MagicMock()
+        driver.execute_script.return_value = {
+            "url": "https://etk.srail.co.kr/hpg/hra/01/selectScheduleList.do", "login_form": False,
+        }
+        assert SessionRecovery.is_session_expired(driver) is False
+        driver.execute_script.assert_called_once_with(SessionRecovery._SESSION_STATE_SCRIPT)
+
+    @pytest.mark.parametrize("state", [
+        {"url": "https://etk.srail.co.kr/cmc/01/selectLoginForm.do", "login_form": True},
+        {"url": "https://etk.srail.co.kr/main/main.do", "login_form": True},
+        {"url": "https://etk.srail.co.kr/member/auth", "login_form": False},
+    ])
+    def test_session_expired_from_script_state(self, state):
+        driver = MagicMock()
+        driver.execute_script.return_value = state
+        assert SessionRecovery.is_session_expired(driver) is True
 
     def test_session_expired_when_driver_raises(self):
         from unittest.mock import PropertyMock
@@ -210,6 +231,16 @@ class TestSessionRecovery:
         assert result is True
         assert srt.login.call_count == 2
 
+    @patch("srt_reservation.recovery.time.sleep")
+    def test_recover_retries_when_login_not_confirmed(self, mock_sleep):
+        driver = MagicMock()
+        srt = MagicMock()
+        srt.confirm_login.side_effect = [False, True]
+        ctx = RecoveryContext(max_retries=2)
+
+        assert SessionRecovery.recover(driver, srt, ctx) is True
+        assert srt.login.call_count == 2
+
     @patch("srt_reservation.recovery.time.sleep")
     def test_recover_raises_after_max_retries(self, mock_sleep):
         driver = MagicMock()
@@ -230,6 +261,45 @@ class TestSessionRecovery:
         assert ctx.retry_count[ErrorType.SESSION] == 0
 
 
+# ─────────────────────────────────────────────────────────────
+# SessionExpiryTracker 테스트
+# ─────────────────────────────────────────────────────────────
+
+class TestSessionExpiryTracker:
+    def _tracker(self, now=1000.0, margin=60):
+        clock = MagicMock(return_value=now)
+        return SessionExpiryTracker(margin=margin, clock=clock), clock
+
+    def test_earliest_http_only_expiry(self):
+        tracker, _ = self._tracker()
+        deadline = tracker.update([
+            {"name": "JSESSIONID", "value": "a", "httpOnly": True},
+            {"name": "auth", "value": "b", "httpOnly": True, "expiry": 2800},
+            {"name": "remember", "value": "c", "httpOnly": True, "expiry": 9000},
+            {"name": "_gat", "value": "1", "expiry": 1010},  # 스크립트 쿠키는 무시
+        ])
+        assert deadline == 2800
+        assert tracker.seconds_left() == 1800
+
+    def test_session_cookies_only_not_tracked(self):
+        tracker, _ = self._tracker()
+        assert tracker.update([{"name": "JSESSIONID", "value": "a", "httpOnly": True}]) is None
+        assert tracker.expires_soon() is False
+
+    def test_expires_soon_within_margin(self):
+        tracker, clock = self._tracker()
+        tracker.update([{"name": "auth", "value": "b", "httpOnly": True, "expiry": 1100}])
+        assert tracker.expires_soon() is False
+        clock.return_value = 1040
+        assert tracker.expires_soon() is True
+
+    def test_clear(self):
+        tracker, _ = self._tracker()
+        tracker.update([{"name": "auth", "value": "b", "httpOnly": True, "expiry": 1001}])
+        tracker.clear()
+        assert tracker.expires_soon() is False
+
+
 # ─────────────────────────────────────────────────────────────
 # BrowserRecovery 테스트
 # ─────────────────────────────────────────────────────────────
@@ -250,6 +320,7 @@ class TestBrowserRecovery:
     def test_recover_success(self):
         driver = MagicMock()
         srt = MagicMock()
+        srt.restore_session.return_value = False
         ctx = RecoveryContext()
 
         result = BrowserRecovery.recover(driver, srt, ctx)
@@ -259,6 +330,16 @@ class TestBrowserRecovery:
         srt.login.assert_called_once()
         srt.go_search.assert_called_once()
 
+    def test_recover_skips_login_when_session_restored(self):
+        driver = MagicMock()
+        srt = MagicMock()
+        srt.restore_session.return_value = True
+        ctx = RecoveryContext()
+
+        assert BrowserRecovery.recover(driver, srt, ctx) is True
+        srt.login.assert_not_called()
+        srt.go_search.assert_called_once()
+
     def test_recover_quits_old_driver_even_on_quit_error(self):
         driver = MagicMock()
         driver.quit.side_effect = Exception("already closed")
@@ -282,6 +363,7 @@ class TestBrowserRecovery:
     def test_recover_raises_on_login_failure(self):
         driver = MagicMock()
         srt = MagicMock()
+        srt.restore_session.return_value = False
         srt.login.side_effect = Exception("login error")
         ctx = RecoveryContext()
 
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+페이지 녹화(srt_reservation.recorder)와 replay 드라이버(benchmarks.replay) 테스트.
+
+tests/fixtures/pages 의 기본 코퍼스(python -m benchmarks.replay --seed)를 ReplayDriver 로
+SRT 에 흘려 Chrome 없이 판정·예약 흐름을 확인한다.
+"""
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import (
+    JavascriptException, NoSuchElementException, StaleElementReferenceException,
+)
+from selenium.webdriver.common.by import By
+
+from benchmarks import standin_server as standin
+from benchmarks.replay import (
+    ReplayDriver, classify, load_corpus, open_fixture, parse_html, replay_srt, seed_corpus, select,
+)
+from srt_reservation.exceptions import BlockedByServerError
+from srt_reservation.main import SRT
+from srt_reservation.recorder import PageRecorder, read_fixture, sanitize_html
+
+CORPUS_DIR = Path(__file__).parent / "fixtures" / "pages"
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return load_corpus(CORPUS_DIR)
+
+
+def _results(corpus, dpt_tm, bookable=None):
+    for fixture in corpus["results"]:
+        if fixture.get("dpt_tm") != dpt_tm:
+            continue
+        if bookable is None or ("예약하기" in fixture["html"]) == bookable:
+            return fixture
+    raise AssertionError(f"코퍼스에 {dpt_tm}시 결과 페이지가 없습니다")
+
+
+def _follow(corpus, kind):
+    fixture = corpus[kind][0]
+    return {7: (fixture["html"], "https://etk.srail.kr" + fixture["path"])}
+
+
+class TestSanitize:
+    def test_removes_personal_data_and_tokens(self):
+        html = (
+            '<script>var token="s3cr3t";</script><style>.a{}</style><!-- memo -->'
+            '<input name="hmpgPwdCphd01" value="pw1234"><input type="submit" value="조회하기">'
+            '<p onclick="go(\'abc\')">환영합니다 홍길동님 | user.name@gmail.com 010-1234-5678 1234567890</p>'
+            '<p>요청 ID: a19afddb5aab</p>'
+        )
+        clean = sanitize_html(html)
+        for secret in ("s3cr3t", "memo", "pw1234", "홍길동", "user.name", "1234-5678", "1234567890",
+                       "a19afddb5aab", "onclick"):
+            assert secret not in clean
+        assert 'value="조회하기"' in clean
+        assert "요청 ID: xxxxxxxxxxxx" in clean
+
+    def test_block_page_still_detected(self):
+        driver = ReplayDriver(sanitize_html(standin.render_block_page(standin.StandinState())))
+        probe = driver.execute_script(SRT._BLOCK_PROBE_SCRIPT)
+        assert len(probe["matched"]) >= SRT._BLOCK_MIN_MATCHES
+
+
+class TestPageRecorder:
+    def test_record_and_read_back(self, tmp_path):
+        recorder = PageRecorder(tmp_path)
+        path = recorder.record("results", "<html><body>표</body></html>",
+                               "https://etk.srail.kr/hpg/hra/01/selectScheduleList.do?dptDt=20260315",
+                               {"dpt_dt": "20260315", "dpt_tm": "08"})
+        assert path.parent == tmp_path / "results"
+        fixture = read_fixture(path)
+        assert fixture["kind"] == "results"
+        assert fixture["path"] == "/hpg/hra/01/selectScheduleList.do"
+        assert fixture["dpt_tm"] == "08"
+        assert fixture["html"] == "<html><body>표</body></html>"
+
+    def test_same_page_saved_once(self, tmp_path):
+        recorder = PageRecorder(tmp_path)
+        assert recorder.record("block", "<p>a</p>") is not None
+        assert recorder.record("block", "<p>a</p>") is None
+        assert recorder.saved == 1
+
+    def test_limit_per_kind(self, tmp_path):
+        recorder = PageRecorder(tmp_path, max_per_kind=2)
+        saved = [recorder.record("login", f"<p>{i}</p>") for i in range(4)]
+        assert [path is not None for path in saved] == [True, True, False, False]
+        assert PageRecorder(tmp_path, max_per_kind=2).record("login", "<p>9</p>") is None
+
+    def test_unknown_kind_and_write_error_ignored(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        assert PageRecorder(tmp_path).record("unknown", "<p></p>") is None
+        assert PageRecorder(blocker).record("error", "<p></p>") is None
+
+
+class TestReplayDriver:
+    HTML = (
+        '<html><body><div id="a" class="x y"><ul><li>1</li><li class="y">2<a href="#">링크</a></li></ul></div>'
+        '<input type="submit" value="조회하기"><br></body></html>'
+    )
+
+    def test_selectors(self):
+        root = parse_html(self.HTML)
+        assert [n.text() for n in select(root, "#a > ul > li:nth-child(2)")] == ["2링크"]
+        assert [n.tag for n in select(root, "div.x.y a")] == ["a"]
+        assert select(root, "#a > li") == []
+
+    def test_find_and_stale(self):
+        driver = ReplayDriver(self.HTML)
+        html = driver.find_element(By.TAG_NAME, "html")
+        assert driver.find_element(By.XPATH, "//input[@value='조회하기']").get_attribute("type") == "submit"
+        assert driver.find_elements(By.ID, "missing") == []
+        with pytest.raises(NoSuchElementException):
+            driver.find_element(By.CSS_SELECTOR, "#missing")
+
+        driver.load("<html><body></body></html>", "about:blank")
+        with pytest.raises(StaleElementReferenceException):
+            html.is_enabled()
+
+    def test_unknown_script_rejected(self):
+        with pytest.raises(JavascriptException):
+            ReplayDriver().execute_script("return 1")
+
+
+class TestCorpusReplay:
+    def test_recorded_kind_matches_replay(self, corpus):
+        outcome = classify(corpus)
+        assert outcome and all(recorded == replayed for recorded, replayed in outcome)
+        assert set(kind for kind, _ in outcome) == set(SRT._PROBE_KINDS)
+
+    def test_seed_is_reproducible(self, tmp_path):
+        seeded = {path.relative_to(tmp_path) for path in seed_corpus(tmp_path)}
+        committed = {path.relative_to(CORPUS_DIR) for path in CORPUS_DIR.glob("*/*.html")}
+        assert seeded == committed
+
+    def test_book_success(self, corpus):
+        srt = replay_srt(ReplayDriver())
+        open_fixture(srt, _results(corpus, "08", bookable=True), follow=_follow(corpus, "booking"))
+
+        assert srt._check_result_once() is srt.driver
+        assert srt._booked_row.train_no == "311"
+        assert srt.driver.find_elements(By.ID, "isFalseGotoMain")
+
+    def test_sold_out_goes_back(self, corpus):
+        srt = replay_srt(ReplayDriver())
+        fixture = _results(corpus, "10")
+        open_fixture(srt, fixture, follow=_follow(corpus, "sold_out"))
+
+        assert srt._check_result_once() is None
+        assert not srt.is_booked
+        assert srt.driver.commands["back"] == 1
+        assert srt.driver.page_source == fixture["html"]
+
+    def test_sold_out_then_next_row_books(self, corpus):
+        """잔여석 없음 → 뒤로가기 후 스냅샷 링크가 stale 이어도 다음 후보를 예약한다"""
+        state = standin.StandinState(today=date(2026, 3, 8))
+        state.phantom, state.available = {"315"}, {"317"}
+        params = {"dptRsStnCdNm": "수서", "arvRsStnCdNm": "부산", "dptDt": "20260315", "dptTm": "100000"}
+        fixture = {"html": standin.render_results(state, params), "path": standin.SCHEDULE_PATH,
+                   "dpt_dt": "20260315", "dpt_tm": "10"}
+        pages = [_follow(corpus, "sold_out")[7], _follow(corpus, "booking")[7]]
+
+        srt = replay_srt(ReplayDriver(), num_trains_to_check=3)
+        open_fixture(srt, fixture, follow={7: pages})
+
+        assert srt._check_result_once() is srt.driver
+        assert srt._booked_row.train_no == "317"
+        assert srt.driver.commands["back"] == 1
+        assert srt.driver.find_elements(By.ID, "isFalseGotoMain")
+
+    def test_waitlist(self, corpus):
+        srt = replay_srt(ReplayDriver(), want_reserve=True)
+        open_fixture(srt, _results(corpus, "12"))
+
+        assert srt._check_result_once() is srt.driver
+        assert srt._booked_seat_type == "예약대기"
+        assert srt._booked_row.train_no == "321"
+
+    def test_block_page_raises(self, corpus):
+        srt = replay_srt(ReplayDriver())
+        open_fixture(srt, corpus["block"][0])
+        with pytest.raises(BlockedByServerError) as exc_info:
+            srt._detect_blocked_page()
+        assert exc_info.value.request_id == "xxxxxxxxxxxx"
+
+    def test_probe_results_single_round_trip(self, corpus):
+        srt = replay_srt(ReplayDriver())
+        open_fixture(srt, _results(corpus, "20"))
+        probe = srt._probe_after_search()
+
+        assert [row["train_no"] for row in probe["rows"]] == ["345", "347", "349"]
+        assert srt.driver.commands["execute_script"] == 1
+
+
+    def test_bench_replay_runs(self, corpus):
+        from benchmarks.bench_replay import run_replay
+        samples = run_replay(corpus, repeat=1)
+        assert len(samples["detect_blocked_page"]) == sum(len(f) for f in corpus.values())
+        assert len(samples["probe_and_decide"]) == len(corpus["results"])
+        assert all(count >= 1 for count in samples["_commands"])
+
+
+class TestSrtRecordsPages:
+    def test_check_result_records_probe_kind(self, tmp_path, corpus):
+        srt = SRT("수서", "부산", "20260315", "08", num_trains_to_check=1, record_pages=tmp_path)
+        srt.driver = ReplayDriver()
+        srt.notifier = MagicMock()
+        srt.notifier.is_configured.return_value = False
+        open_fixture(srt, _results(corpus, "08", bookable=False))
+
+        with patch.object(srt, "go_search"), \
+             patch("srt_reservation.main.randint", return_value=1), \
+             patch("srt_reservation.main.time.sleep", side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                srt.check_result()
+
+        [path] = (tmp_path / "results").glob("*.html")
+        assert read_fixture(path)["dpt_tm"] == "08"
+
+    @pytest.mark.parametrize("follow, kind", [("booking", "booking"), ("sold_out", "sold_out")])
+    def test_book_ticket_records_outcome(self, tmp_path, corpus, follow, kind):
+        srt = replay_srt(ReplayDriver())
+        srt.recorder = PageRecorder(tmp_path)
+        fixture = _results(corpus, "08", bookable=True) if follow == "booking" else _results(corpus, "10")
+        open_fixture(srt, fixture, follow=_follow(corpus, follow))
+
+        srt._check_result_once()
+
+        assert [p.parent.name for p in tmp_path.glob("*/*.html")] == [kind]
+
+    def test_disabled_by_default(self):
+        srt = SRT("수서", "부산", "20260315", "08")
+        srt.driver = MagicMock()
+        srt._record_page("results")
+        assert srt.recorder is None
+        assert "page_source" not in str(srt.driver.mock_calls)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""검색 결과 표 스냅샷 (execute_script 1회) 테스트"""
+from unittest.mock import ANY, MagicMock, call, patch
+
+from selenium.webdriver.common.by import By
+
+from srt_reservation.main import SRT
+from srt_reservation.models import ResultPage
+
+
+def _seat(text, link=None):
+    return {"text": text, "has_link": link is not None, "link": link}
+
+
+def _row(index, standard="매진", waitlist="매진", standard_link=None, waitlist_link=None):
+    return {
+        "index": index,
+        "train_no": str(299 + 2 * index),
+        "dpt_time": f"{7 + index:02d}:00",
+        "arr_time": f"{9 + index:02d}:35",
+        "special": _seat("매진"),
+        "standard": _seat(standard, standard_link),
+        "waitlist": _seat(waitlist, waitlist_link),
+    }
+
+
+def _make_srt(rows, num=2, want_reserve=False):
+    srt = SRT("수서", "부산", "20260315", "08", num, want_reserve)
+    srt.driver = MagicMock()
+    srt.driver.execute_script.return_value = rows
+    return srt
+
+
+class TestSnapshotResults:
+    def test_snapshot_uses_single_execute_script(self):
+        rows = [_row(1), _row(2)]
+        srt = _make_srt(rows)
+
+        page = srt.snapshot_results()
+        assert isinstance(page, ResultPage)
+        assert [row.train_no for row in page] == ["301", "303"]
+        assert page.dpt_dt == "20260315" and page.dpt_tm == "08"
+        srt.driver.execute_script.assert_called_once_with(
+            SRT._RESULT_TABLE_SCRIPT, SRT._RESULT_ROW_SELECTOR
+        )
+
+    def test_snapshot_returns_empty_on_error(self):
+        srt = _make_srt([])
+        srt.driver.execute_script.side_effect = Exception("script error")
+        assert len(srt.snapshot_results()) == 0
+
+    def test_snapshot_returns_empty_on_non_list(self):
+        srt = _make_srt(MagicMock())
+        assert len(srt.snapshot_results()) == 0
+
+    def test_snapshot_uses_searched_condition(self):
+        srt = _make_srt([_row(1)])
+        srt._searched_condition = {"dpt_dt": "20260316", "dpt_tm": "10"}
+        page = srt.snapshot_results()
+        assert (page.dpt_dt, page.dpt_tm) == ("20260316", "10")
+
+    def test_history_keeps_link_free_copies(self):
+        anchor = MagicMock()
+        srt = _make_srt([_row(1, standard="예약하기", standard_link=anchor)])
+        page = srt.snapshot_results()
+
+        assert srt.last_result_page is page
+        assert page.rows[0].standard.link is anchor
+        assert srt.result_history[-1].rows[0].standard.link is None
+        assert srt.result_history[-1].rows[0].standard.text == "예약하기"
+
+
+class TestCheckResultOnceWithSnapshot:
+    def test_all_sold_out_makes_no_per_row_lookups(self):
+        srt = _make_srt([_row(1), _row(2), _row(3)])
+
+        assert srt._check_result_once() is None
+        srt.driver.execute_script.assert_called_once()
+        srt.driver.find_element.assert_not_called()
+
+    @patch("srt_reservation.main.WebDriverWait")
+    def test_books_with_snapshot_anchor(self, mock_wait):
+        anchor = MagicMock()
+        srt = _make_srt([_row(1), _row(2, standard="예약하기", standard_link=anchor)])
+        srt.driver.find_elements.return_value = [MagicMock()]  # 예약 확인 페이지
+
+        assert srt._check_result_once() is srt.driver
+        anchor.click.assert_called_once()
+        assert call(By.CSS_SELECTOR, ANY) not in srt.driver.find_element.call_args_list
+        assert srt.is_booked is True
+        assert srt._booked_row.train_no == "303"
+        assert srt._booked_seat_type == "일반석"
+
+    def test_waitlist_with_snapshot_anchor(self):
+        anchor = MagicMock()
+        srt = _make_srt([_row(1, waitlist="신청하기", waitlist_link=anchor)], want_reserve=True)
+
+        assert srt._check_result_once() is srt.driver
+        anchor.click.assert_called_once()
+        srt.driver.find_element.assert_not_called()
+        assert srt._booked_seat_type == "예약대기"
+
+    def test_waitlist_ignored_when_not_wanted(self):
+        anchor = MagicMock()
+        srt = _make_srt([_row(1, waitlist="신청하기", waitlist_link=anchor)], want_reserve=False)
+
+        assert srt._check_result_once() is None
+        anchor.click.assert_not_called()
+
+    def test_only_first_num_rows_checked(self):
+        anchor = MagicMock()
+        srt = _make_srt([_row(1), _row(2), _row(3, standard="예약하기", standard_link=anchor)], num=2)
+
+        assert srt._check_result_once() is None
+        anchor.click.assert_not_called()
+
+    def test_fewer_rows_than_num(self):
+        srt = _make_srt([_row(1)], num=3)
+        assert srt._check_result_once() is None
+
+
+class TestNotifySuccessUsesBookedRow:
+    def test_run_sends_parsed_train_times(self):
+        srt = SRT("수서", "부산", "20260315", "08")
+        srt.driver = MagicMock()
+        srt.run_driver = MagicMock()
+        srt.login = MagicMock()
+        srt.check_login = MagicMock(return_value=True)
+        srt.notifier = MagicMock()
+
+        def _book():
+            srt.driver.execute_script.return_value = [_row(1, standard="예약하기", standard_link=MagicMock())]
+            srt.driver.find_elements.return_value = [MagicMock()]
+            return srt._check_result_once()
+
+        srt.check_result = _book
+        with patch("srt_reservation.main.time.sleep"):
+            srt.run("user", "pass")
+
+        info = srt.notifier.notify_success.call_args[0][0]
+        assert info == {"dept_time": "08:00", "arri_time": "10:35", "seat_type": "일반석"}
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""순회 간격 스케줄러 (srt_reservation.scheduler) 테스트"""
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from srt_reservation.budget import REQUEST_BUDGET
+from srt_reservation.main import SRT
+from srt_reservation.scheduler import AdaptiveScheduler, FocusWindow, PollScheduler
+
+
+class FakeClock:
+    def __init__(self, now=100000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _scheduler(clock=None, moment=datetime(2026, 3, 15, 12, 0), **kwargs):
+    kwargs.setdefault("hourly_budget", 1000)
+    return AdaptiveScheduler(
+        60, 120, clock=clock or FakeClock(), now=lambda: moment,
+        rand=lambda low, high: low, **kwargs
+    )
+
+
+class TestFocusWindow:
+    def test_contains(self):
+        window = FocusWindow("06:55-07:10")
+        assert window.contains(datetime(2026, 3, 15, 7, 0))
+        assert not window.contains(datetime(2026, 3, 15, 7, 10))
+
+    def test_wraps_midnight(self):
+        window = FocusWindow("23:55-00:10")
+        assert window.contains(datetime(2026, 3, 15, 23, 58))
+        assert window.contains(datetime(2026, 3, 16, 0, 5))
+        assert not window.contains(datetime(2026, 3, 16, 0, 10))
+
+    def test_parse_all(self):
+        windows = FocusWindow.parse_all("06:55-07:10, 23:55-00:10,")
+        assert [w.spec for w in windows] == ["06:55-07:10", "23:55-00:10"]
+        assert FocusWindow.parse_all(None) == []
+
+    @pytest.mark.parametrize("spec", ["0700", "25:00-26:00", "07:00-07:61", "a-b"])
+    def test_invalid(self, spec):
+        with pytest.raises(ValueError):
+            FocusWindow(spec)
+
+
+class TestAdaptiveScheduler:
+    def test_steady_state_uses_base_range(self):
+        scheduler = _scheduler()
+        scheduler.record_rotation(queries=2, search_seconds=2.0, errors=0)
+        assert scheduler.next_delay(2) == 60
+
+    def test_errors_back_off_and_relax(self):
+        scheduler = _scheduler()
+        scheduler.record_rotation(2, 2.0, errors=1)
+        assert scheduler.next_delay(2) == 120
+        scheduler.record_rotation(2, 2.0, errors=1)
+        assert scheduler.next_delay(2) == 240
+        for _ in range(10):
+            scheduler.record_rotation(2, 2.0, errors=0)
+        assert scheduler.next_delay(2) == 60
+
+    def test_backoff_capped(self):
+        scheduler = _scheduler(max_backoff=4)
+        for _ in range(5):
+            scheduler.record_rotation(1, 1.0, errors=1)
+        assert scheduler.backoff == 4
+
+    def test_latency_rise_lengthens_interval(self):
+        scheduler = _scheduler()
+        scheduler.record_rotation(2, 2.0, errors=0)  # 1초/조회 기준
+        scheduler.record_rotation(2, 20.0, errors=0)  # 10초/조회
+        assert scheduler.backoff == 1.5
+        assert scheduler.next_delay(2) == 90
+
+    def test_block_signal_stays_conservative(self):
+        clock = FakeClock()
+        scheduler = _scheduler(clock=clock, block_cooldown=1800,
+                               focus_windows="11:00-13:00")
+        scheduler.note_block_signal(["접속 제한"])
+        for _ in range(10):
+            scheduler.record_rotation(1, 1.0, errors=0)
+        assert scheduler.next_delay(1) == 240  # 집중 구간이어도 최소 4배
+
+        clock.now += 1801
+        assert scheduler.conservative is False
+        assert scheduler.next_delay(1) == 15  # 집중 구간 (60 × 0.25)
+
+    def test_focus_window_outside(self):
+        scheduler = _scheduler(focus_windows="06:55-07:10")
+        assert scheduler.next_delay(1) == 60
+
+    def test_hourly_budget_enforced(self):
+        clock = FakeClock()
+        scheduler = _scheduler(clock=clock, hourly_budget=10)
+        sent = []
+        # 순회당 최대 3회 조회, 10시간 동안 스케줄러가 정한 간격대로 순회
+        end = clock.now + 36000
+        while clock.now < end:
+            sent.append(clock.now)
+            scheduler.record_rotation(3, 3.0, errors=0)
+            clock.now += scheduler.next_delay(3)
+
+        for i, start in enumerate(sent):
+            in_window = sum(3 for t in sent[i:] if t < start + 3600)
+            assert in_window <= 10
+
+    def test_budget_wait(self):
+        clock = FakeClock()
+        scheduler = _scheduler(clock=clock, hourly_budget=4)
+        scheduler.record_rotation(2, 1.0, errors=0)
+        clock.now += 100
+        scheduler.record_rotation(2, 1.0, errors=0)
+        assert scheduler.sent_last_hour() == 4
+        assert scheduler.budget_wait(2) == 3500
+        clock.now += 3500
+        assert scheduler.budget_wait(2) == 0
+
+    def test_budget_counts_all_requests(self):
+        clock = FakeClock()
+        scheduler = _scheduler(clock=clock, hourly_budget=4)
+        scheduler.record_rotation(0, 0.0, errors=1, requests=3)  # 조회 없이 로그인·재로그인만
+        assert scheduler.sent_last_hour() == 3
+        assert scheduler.latency is None
+        assert scheduler.budget_wait(2) == 3600
+
+    def test_invalid_budget(self):
+        with pytest.raises(ValueError):
+            AdaptiveScheduler(hourly_budget=0)
+
+    def test_base_class_requires_next_delay(self):
+        class Incomplete(PollScheduler):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+
+class TestCheckResultUsesScheduler:
+    def _srt(self, scheduler):
+        srt = SRT("수서", "부산", "20260315", "08,10", num_trains_to_check=1,
+                  coalesce_conditions=False, scheduler=scheduler)
+        srt.driver = MagicMock()
+        return srt
+
+    def test_delay_from_scheduler(self):
+        scheduler = MagicMock(spec=PollScheduler)
+        scheduler.next_delay.return_value = 42
+        srt = self._srt(scheduler)
+        srt.driver.execute_script.return_value = {"kind": "results", "url": "u", "rows": [], "matched": []}
+
+        with patch.object(srt, "go_search"), \
+             patch("srt_reservation.main.randint") as randint, \
+             patch("srt_reservation.main.time.sleep", side_effect=KeyboardInterrupt) as sleep:
+            with pytest.raises(KeyboardInterrupt):
+                srt.check_result()
+
+        randint.assert_not_called()
+        sleep.assert_called_once_with(42)
+        queries, search_seconds, errors = scheduler.record_rotation.call_args.args
+        assert queries == 2 and errors == 0 and search_seconds >= 0
+        scheduler.next_delay.assert_called_once_with(2)
+        scheduler.note_block_signal.assert_not_called()
+
+    def test_partial_block_signature_reported(self):
+        scheduler = MagicMock(spec=PollScheduler)
+        scheduler.next_delay.return_value = 1
+        srt = self._srt(scheduler)
+        srt.driver.execute_script.return_value = {
+            "kind": "results", "url": "u", "rows": [], "matched": ["접속 제한"],
+        }
+
+        with patch.object(srt, "go_search"), \
+             patch("srt_reservation.main.time.sleep", side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                srt.check_result()
+
+        scheduler.note_block_signal.assert_called_with(["접속 제한"])
+
+    def test_session_expiry_counts_as_error(self):
+        scheduler = MagicMock(spec=PollScheduler)
+        scheduler.next_delay.return_value = 1
+        srt = self._srt(scheduler)
+        srt.driver.execute_script.return_value = {"kind": "login", "url": "u", "matched": []}
+
+        with patch.object(srt, "go_search"), \
+             patch("srt_reservation.main.SessionRecovery.recover"), \
+             patch("srt_reservation.main.time.sleep", side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                srt.check_result()
+
+        assert scheduler.record_rotation.call_args.args[2] == 2
+
+    def test_reports_requests_beyond_queries(self):
+        scheduler = MagicMock(spec=PollScheduler)
+        scheduler.next_delay.return_value = 1
+        srt = self._srt(scheduler)
+        srt.driver.execute_script.return_value = {"kind": "login", "url": "u", "matched": []}
+
+        def go_search(**kwargs):
+            REQUEST_BUDGET.acquire("search")
+
+        def relogin(**kwargs):
+            REQUEST_BUDGET.acquire("login")
+
+        with patch.object(srt, "go_search", side_effect=go_search), \
+             patch("srt_reservation.main.SessionRecovery.recover", side_effect=relogin), \
+             patch("srt_reservation.main.time.sleep", side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                srt.check_result()
+
+        assert scheduler.record_rotation.call_args.args[0] == 0  # 결과 페이지를 하나도 못 봄
+        assert scheduler.record_rotation.call_args.kwargs["requests"] == 4
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""로그인 쿠키 캐시 (SessionCookieCache) 및 SRT 세션 복원 테스트"""
+import json
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from srt_reservation.cache import SessionCookieCache, cache_dir
+from srt_reservation.main import SRT
+from srt_reservation.recovery import BrowserRecovery, RecoveryContext, SessionRecovery
+
+COOKIES = [
+    {"name": "JSESSIONID", "value": "abc", "domain": "etk.srail.co.kr", "path": "/", "httpOnly": True},
+    {"name": "WMONID", "value": "x1", "domain": ".srail.co.kr", "path": "/", "expiry": int(time.time()) + 3600},
+]
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SRT_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestSessionCookieCache:
+    def test_cache_dir_from_env(self, tmp_path):
+        assert cache_dir() == tmp_path
+
+    def test_save_and_load_roundtrip(self):
+        cache = SessionCookieCache("user", "https://etk.srail.co.kr")
+        assert cache.save(COOKIES) is True
+        assert cache.load() == COOKIES
+        assert oct(os.stat(cache.path).st_mode & 0o777) == "0o600"
+
+    def test_key_depends_on_account_and_site(self):
+        a = SessionCookieCache("user", "https://etk.srail.co.kr")
+        assert a.path != SessionCookieCache("other", "https://etk.srail.co.kr").path
+        assert a.path != SessionCookieCache("user", "http://127.0.0.1:8000").path
+        assert "user" not in a.path.name
+
+    def test_load_missing_returns_none(self):
+        assert SessionCookieCache("user", "https://etk.srail.co.kr").load() is None
+
+    def test_expired_cookies_dropped(self):
+        cache = SessionCookieCache("user", "https://etk.srail.co.kr")
+        cache.save([COOKIES[0], dict(COOKIES[1], expiry=int(time.time()) - 10)])
+        assert cache.load() == [COOKIES[0]]
+
+    def test_too_old_cache_ignored(self):
+        cache = SessionCookieCache("user", "https://etk.srail.co.kr", max_age=60)
+        cache.save(COOKIES)
+        data = json.loads(cache.path.read_text(encoding="utf-8"))
+        data["saved_at"] -= 120
+        cache.path.write_text(json.dumps(data), encoding="utf-8")
+        assert cache.load() is None
+
+    def test_corrupt_file_ignored(self):
+        cache = SessionCookieCache("user", "https://etk.srail.co.kr")
+        cache.path.parent.mkdir(parents=True, exist_ok=True)
+        cache.path.write_text("{not json", encoding="utf-8")
+        assert cache.load() is None
+
+    def test_save_rejects_non_list(self):
+        cache = SessionCookieCache("user", "https://etk.srail.co.kr")
+        assert cache.save(MagicMock()) is False
+        assert cache.save([]) is False
+        assert not cache.path.exists()
+
+    def test_clear(self):
+        cache = SessionCookieCache("user", "https://etk.srail.co.kr")
+        cache.save(COOKIES)
+        cache.clear()
+        cache.clear()  # 없어도 오류 없음
+        assert not cache.path.exists()
+
+
+def _make_srt(**kwargs):
+    srt = SRT("수서", "부산", "20260315", "08", **kwargs)
+    srt.set_log_info("user", "pass")
+    srt.driver = MagicMock()
+    return srt
+
+
+class TestRestoreSession:
+    def test_no_cache_returns_false_without_navigation(self):
+        srt = _make_srt()
+        assert srt.restore_session() is False
+        srt.driver.get.assert_not_called()
+
+    def test_valid_session_restored_via_cdp(self):
+        srt = _make_srt()
+        srt.session_cache.save(COOKIES)
+        srt.driver.execute_script.return_value = True
+
+        assert srt.restore_session() is True
+
+        srt.driver.execute_cdp_cmd.assert_called_once()
+        command, params = srt.driver.execute_cdp_cmd.call_args.args
+        assert command == "Network.setCookies"
+        assert params["cookies"][1]["expires"] == COOKIES[1]["expiry"]
+        srt.driver.get.assert_called_once_with(f"{srt.base_url}/main/main.do")
+        srt.driver.add_cookie.assert_not_called()
+
+    def test_add_cookie_fallback_without_cdp(self):
+        srt = _make_srt()
+        srt.session_cache.save(COOKIES)
+        srt.driver.execute_cdp_cmd.side_effect = WebDriverException("not chrome")
+        srt.driver.execute_script.return_value = True
+
+        assert srt.restore_session() is True
+        assert srt.driver.add_cookie.call_count == 2
+        assert srt.driver.get.call_count == 2
+
+    def test_rejected_session_clears_cache(self):
+        srt = _make_srt()
+        srt.session_cache.save(COOKIES)
+        srt.driver.execute_script.return_value = False
+
+        assert srt.restore_session() is False
+        assert not srt.session_cache.path.exists()
+        srt.driver.delete_all_cookies.assert_called_once()
+
+    def test_disabled(self):
+        srt = _make_srt(session_cache=False)
+        assert srt.session_cache is None
+        assert srt.restore_session() is False
+        assert srt.save_session() is False
+
+    def test_confirm_login_saves_cookies(self):
+        srt = _make_srt()
+        srt.check_login = MagicMock(return_value=True)
+        srt.driver.get_cookies.return_value = COOKIES
+
+        assert srt.confirm_login() is True
+        assert srt.session_cache.load() == COOKIES
+
+
+class TestRunUsesSessionCache:
+    def _run(self, srt):
+        srt.run_driver = MagicMock()
+        srt.login = MagicMock()
+        srt.check_login = MagicMock(return_value=True)
+        srt.check_result = MagicMock()
+        srt.notifier = MagicMock()
+        with patch("srt_reservation.main.time.sleep"):
+            srt.run("user", "pass")
+
+    def test_restored_session_skips_login(self):
+        srt = SRT("수서", "부산", "20260315", "08")
+        srt.driver = MagicMock()
+        srt.restore_session = MagicMock(return_value=True)
+
+        self._run(srt)
+
+        srt.login.assert_not_called()
+        srt.check_login.assert_not_called()
+        srt.check_result.assert_called_once()
+
+    def test_falls_back_to_login(self):
+        srt = SRT("수서", "부산", "20260315", "08")
+        srt.driver = MagicMock()
+        srt.restore_session = MagicMock(return_value=False)
+
+        self._run(srt)
+
+        srt.login.assert_called_once()
+        srt.check_result.assert_called_once()
+
+
+class TestRecoverySavesSession:
+    """복구 경로의 재로그인도 새 쿠키를 세션 캐시에 저장"""
+
+    NEW_COOKIES = [dict(COOKIES[0], value="fresh"), COOKIES[1]]
+
+    def _srt(self):
+        srt = _make_srt()
+        srt.session_cache.save(COOKIES)
+        srt.login = MagicMock()
+        srt.check_login = MagicMock(return_value=True)
+        srt.driver.get_cookies.return_value = self.NEW_COOKIES
+        return srt
+
+    def test_session_recovery(self):
+        srt = self._srt()
+        SessionRecovery.recover(srt.driver, srt, RecoveryContext())
+
+        srt.login.assert_called_once()
+        assert srt.session_cache.load() == self.NEW_COOKIES
+
+    def test_browser_recovery(self):
+        srt = self._srt()
+        srt.run_driver = MagicMock()
+        srt.go_search = MagicMock()
+        srt.driver.execute_script.return_value = False  # 캐시 쿠키는 서버가 거부
+
+        BrowserRecovery.recover(srt.driver, srt, RecoveryContext())
+
+        srt.login.assert_called_once()
+        assert srt.session_cache.load() == self.NEW_COOKIES
+
+
+class TestSessionExpiryTracking:
+    """로그인/쿠키 복원 시 쿠키 만료 시각 기록 및 만료 임박 시 선제 재로그인"""
+
+    AUTH = {"name": "SRAUTH", "value": "t", "domain": "etk.srail.co.kr", "path": "/", "httpOnly": True}
+
+    def test_confirm_login_records_expiry(self):
+        srt = _make_srt(session_cache=False)
+        srt.check_login = MagicMock(return_value=True)
+        srt.driver.get_cookies.return_value = COOKIES + [dict(self.AUTH, expiry=int(time.time()) + 1800)]
+
+        assert srt.confirm_login() is True
+        assert 1700 < srt.session_expiry.seconds_left() <= 1800
+
+    def test_restore_records_expiry(self):
+        srt = _make_srt()
+        expiry = int(time.time()) + 900
+        srt.session_cache.save(COOKIES + [dict(self.AUTH, expiry=expiry)])
+        srt.driver.execute_script.return_value = True
+
+        assert srt.restore_session() is True
+        assert srt.session_expiry.deadline == expiry
+
+    def test_relogin_before_search_when_expiring(self):
+        srt = _make_srt()
+        srt.session_expiry.deadline = time.time() + 10
+        fresh = COOKIES + [dict(self.AUTH, expiry=int(time.time()) + 3600)]
+        srt.driver.get_cookies.return_value = fresh
+        srt.check_login = MagicMock(return_value=True)
+        order = []
+
+        with patch.object(srt, "login", side_effect=lambda: order.append("login")), \
+             patch.object(srt, "go_search", side_effect=lambda **kw: order.append("search")), \
+             patch.object(srt, "_check_result_once", return_value=srt.driver):
+            srt.check_result()
+
+        assert order == ["login", "search"]
+        assert srt.session_expiry.deadline == fresh[-1]["expiry"]
+        assert srt.session_cache.load() == fresh
+
+    def test_stops_tracking_when_relogin_does_not_extend(self):
+        srt = _make_srt()
+        srt.session_expiry.deadline = time.time() + 10
+
+        with patch("srt_reservation.main.SessionRecovery.recover") as recover, \
+             patch.object(srt, "go_search"), \
+             patch.object(srt, "_check_result_once", return_value=srt.driver):
+            srt.check_result()
+
+        recover.assert_called_once()
+        assert srt.session_expiry.deadline is None
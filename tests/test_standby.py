@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""웜 스탠바이 예비 브라우저 (StandbyBrowser) 및 프로세스 메모리 측정 테스트"""
+import logging
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from srt_reservation.main import SRT
+from srt_reservation.procmem import (
+    available_memory_mb,
+    driver_root_pids,
+    process_tree_pids,
+    process_tree_rss_mb,
+)
+from srt_reservation.standby import StandbyBrowser
+
+COOKIES = [{"name": "JSESSIONID", "value": "abc", "domain": "etk.srail.kr", "path": "/", "httpOnly": True}]
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc 필요")
+
+
+@pytest.fixture(autouse=True)
+def _plenty_of_memory():
+    with patch("srt_reservation.standby.available_memory_mb", return_value=16000), \
+         patch("srt_reservation.standby.process_tree_rss_mb", return_value=300):
+        yield
+
+
+def _ready(standby):
+    standby._thread.join(5)
+    return standby
+
+
+class TestStandbyBrowser:
+    def test_disabled_with_zero_budget(self):
+        launcher = MagicMock()
+        standby = StandbyBrowser(launcher, memory_budget_mb=0)
+        assert standby.prepare() is False
+        assert standby.take() is None
+        launcher.assert_not_called()
+
+    def test_prepare_then_take(self):
+        driver = MagicMock()
+        standby = _ready_prepare(driver)
+
+        assert standby.take() is driver
+        assert standby.take() is None
+
+    def test_prepare_is_idempotent(self):
+        launcher = MagicMock(return_value=MagicMock())
+        standby = StandbyBrowser(launcher, memory_budget_mb=800)
+        standby.prepare()
+        _ready(standby)
+        assert standby.prepare() is True
+        launcher.assert_called_once()
+
+    def test_skipped_when_host_memory_low(self):
+        launcher = MagicMock()
+        standby = StandbyBrowser(launcher, memory_budget_mb=800)
+        with patch("srt_reservation.standby.available_memory_mb", return_value=500):
+            assert standby.prepare() is False
+        launcher.assert_not_called()
+
+    def test_discarded_when_over_budget(self):
+        driver = MagicMock()
+        standby = StandbyBrowser(lambda: driver, memory_budget_mb=200)
+        standby.prepare()
+        _ready(standby)
+
+        driver.quit.assert_called_once()
+        assert standby.take() is None
+
+    def test_dead_standby_not_returned(self):
+        driver = MagicMock()
+        type(driver).current_window_handle = property(lambda self: (_ for _ in ()).throw(Exception("dead")))
+        standby = _ready_prepare(driver)
+
+        assert standby.take() is None
+        driver.quit.assert_called_once()
+
+    def test_launch_failure(self, caplog):
+        standby = StandbyBrowser(MagicMock(side_effect=RuntimeError("no chrome")), memory_budget_mb=800)
+        with caplog.at_level(logging.WARNING, logger="srt"):
+            standby.prepare()
+            _ready(standby)
+        assert standby.ready is False
+        assert standby.take() is None
+        # setup_logger 의 콘솔·파일 핸들러가 붙는 'srt' 로거로 남아야 logs/srt.log 에 기록된다
+        assert [r.name for r in caplog.records if "no chrome" in r.getMessage()] == ["srt"]
+
+    def test_close_quits_ready_and_late_drivers(self):
+        driver = MagicMock()
+        standby = _ready_prepare(driver)
+        standby.close()
+        driver.quit.assert_called_once()
+        assert standby.prepare() is False
+
+        late = MagicMock()
+        standby = StandbyBrowser(lambda: late, memory_budget_mb=800)
+        standby._closed = True  # 준비 도중 종료된 상황
+        standby._launch()
+        late.quit.assert_called_once()
+
+
+def _ready_prepare(driver):
+    standby = StandbyBrowser(lambda: driver, memory_budget_mb=800)
+    assert standby.prepare() is True
+    return _ready(standby)
+
+
+class TestSRTStandby:
+    def test_run_driver_swaps_in_standby(self):
+        srt = SRT("수서", "부산", "20260315", "08", standby_memory_mb=800)
+        standby_driver = MagicMock()
+        srt.standby = MagicMock()
+        srt.standby.take.return_value = standby_driver
+
+        with patch.object(srt, "_run_driver_enhanced") as mock_enhanced, \
+             patch.object(srt, "_run_driver_undetected") as mock_undetected:
+            srt.run_driver()
+
+        assert srt.driver is standby_driver
+        srt.standby.prepare.assert_called_once()
+        mock_enhanced.assert_not_called()
+        mock_undetected.assert_not_called()
+
+    def test_run_driver_launches_when_no_standby(self):
+        srt = SRT("수서", "부산", "20260315", "08", anti_bot_method="enhanced")
+        with patch.object(srt, "_run_driver_enhanced") as mock_enhanced:
+            srt.driver = MagicMock()
+            srt.run_driver()
+        mock_enhanced.assert_called_once()
+
+    def test_launch_standby_driver_leaves_current_driver(self):
+        srt = SRT("수서", "부산", "20260315", "08", use_profile=True)
+        current = MagicMock()
+        srt.driver = current
+        new_driver = MagicMock()
+        seen = {}
+
+        def fake_run_driver(self):
+            seen["use_profile"] = self.use_profile
+            seen["standby"] = self.standby
+            self.driver = new_driver
+
+        srt.session_cache = MagicMock()
+        srt.session_cache.load.return_value = COOKIES
+        with patch.object(SRT, "run_driver", fake_run_driver), \
+             patch.object(SRT, "_resume_session", return_value=True) as mock_resume:
+            assert srt._launch_standby_driver() is new_driver
+
+        assert srt.driver is current
+        assert srt.use_profile is True
+        assert seen == {"use_profile": False, "standby": None}
+        mock_resume.assert_called_once_with(COOKIES)
+
+    def test_launch_standby_driver_keeps_main_session_state(self):
+        srt = SRT("수서", "부산", "20260315", "08")
+        srt.driver = MagicMock()
+        srt.session_cache = MagicMock()
+        srt.session_cache.load.return_value = COOKIES
+        srt.session_expiry.deadline = 1234.0
+        new_driver = MagicMock()
+        new_driver.execute_script.return_value = False  # 서버가 쿠키 거부
+
+        def fake_run_driver(self):
+            self.driver = new_driver
+
+        with patch.object(SRT, "run_driver", fake_run_driver):
+            assert srt._launch_standby_driver() is new_driver
+
+        srt.session_cache.clear.assert_not_called()
+        srt.session_cache.save.assert_not_called()
+        assert srt.session_expiry.deadline == 1234.0
+
+    def test_run_prepares_and_closes_standby(self):
+        srt = SRT("수서", "부산", "20260315", "08")
+        srt.driver = MagicMock()
+        srt.run_driver = MagicMock()
+        srt.restore_session = MagicMock(return_value=True)
+        srt.check_result = MagicMock()
+        srt.standby = MagicMock()
+
+        srt.run("user", "pass")
+
+        srt.standby.prepare.assert_called_once()
+        srt.standby.close.assert_called_once()
+
+
+@linux_only
+class TestProcMem:
+    def test_available_memory(self):
+        assert available_memory_mb() > 0
+
+    def test_own_process_tree(self):
+        assert os.getpid() in process_tree_pids([os.getpid()])
+        assert process_tree_rss_mb([os.getpid()]) > 1
+
+    def test_no_roots(self):
+        assert process_tree_rss_mb([]) is None
+
+    def test_driver_root_pids(self):
+        driver = MagicMock(browser_pid=4321)
+        driver.service.process.pid = 1234
+        assert driver_root_pids(driver) == [1234, 4321]
+        assert driver_root_pids(object()) == []
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""SRT 스탠드인 서버 및 벤치마크 집계 헬퍼 테스트"""
+import http.cookiejar
+import urllib.parse
+import urllib.request
+
+import pytest
+
+from benchmarks.standin_server import (
+    BOOKING_PATH,
+    LOGIN_FORM_PATH,
+    LOGIN_SUBMIT_PATH,
+    SCHEDULE_PATH,
+    StandinServer,
+    build_timetable,
+)
+from benchmarks.stats import percentile, summarize
+
+
+@pytest.fixture
+def server():
+    with StandinServer() as srv:
+        yield srv
+
+
+def _opener():
+    return urllib.request.build_opener(
+        urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+    )
+
+
+def _get(opener, url):
+    with opener.open(url, timeout=5) as response:
+        return response.geturl(), response.read().decode("utf-8")
+
+
+def _login(opener, server):
+    data = urllib.parse.urlencode({"srchDvNm01": "1234567890", "hmpgPwdCphd01": "pw"}).encode()
+    with opener.open(server.url + LOGIN_SUBMIT_PATH, data=data, timeout=5) as response:
+        return response.read().decode("utf-8")
+
+
+def _search_url(server, hour="08"):
+    dpt_dt = server.state.available_dates()[3]
+    query = urllib.parse.urlencode({
+        "dptRsStnCdNm": "수서", "arvRsStnCdNm": "부산", "dptDt": dpt_dt, "dptTm": f"{hour}0000",
+    })
+    return f"{server.url}{SCHEDULE_PATH}?{query}"
+
+
+class TestStandinLogin:
+    def test_login_form_has_selectors_used_by_srt(self, server):
+        _, body = _get(_opener(), server.url + LOGIN_FORM_PATH)
+        assert 'id="srchDvNm01"' in body
+        assert 'id="hmpgPwdCphd01"' in body
+        assert 'id="login-form"' in body
+        assert 'class="loginSubmit"' in body
+
+    def test_login_sets_session_and_shows_welcome(self, server):
+        opener = _opener()
+        body = _login(opener, server)
+        assert "환영합니다" in body
+        assert len(server.state.sessions) == 1
+
+    def test_search_without_login_redirects_to_login_form(self, server):
+        url, _ = _get(_opener(), _search_url(server))
+        assert LOGIN_FORM_PATH in url
+
+
+class TestStandinSchedule:
+    def test_search_form_has_hidden_selects(self, server):
+        opener = _opener()
+        _login(opener, server)
+        _, body = _get(opener, server.url + SCHEDULE_PATH)
+        assert 'id="dptDt"' in body and 'id="dptTm"' in body
+        assert 'value="조회하기"' in body
+        assert 'id="result-form"' not in body
+
+    def test_results_table_rows_start_at_requested_hour(self, server):
+        opener = _opener()
+        _login(opener, server)
+        _, body = _get(opener, _search_url(server, "10"))
+        assert 'id="result-form"' in body
+        assert 'div class="tbl_wrap th_thead"' in body
+        assert body.count("<tr>") == server.state.page_size + 1  # thead 1 + tbody 행
+        first_time = body.split('<em class="time">')[1][:5]
+        assert first_time >= "10:00"
+
+    def test_available_train_has_booking_link(self, server):
+        server.state.available = {"305"}
+        server.state.waitlist = {"307"}
+        opener = _opener()
+        _login(opener, server)
+        _, body = _get(opener, _search_url(server, "00"))
+        assert f'{BOOKING_PATH}?trnNo=305' in body
+        assert "신청하기" in body
+
+    def test_blocked_state_returns_block_page(self, server):
+        server.state.blocked = True
+        _, body = _get(_opener(), _search_url(server))
+        assert "접속 제한" in body
+        assert "요청 ID: a19afddb5aab" in body
+
+    def test_hits_are_counted_per_path(self, server):
+        opener = _opener()
+        _get(opener, server.url + LOGIN_FORM_PATH)
+        _get(opener, server.url + LOGIN_FORM_PATH)
+        assert server.state.hits[LOGIN_FORM_PATH] == 2
+
+
+class TestStandinBooking:
+    def test_booking_available_train_shows_confirmation(self, server):
+        server.state.available = {"305"}
+        opener = _opener()
+        _login(opener, server)
+        _, body = _get(opener, f"{server.url}{BOOKING_PATH}?trnNo=305&dptDt=20260101")
+        assert 'id="isFalseGotoMain"' in body
+        assert server.state.bookings == [("305", "standard")]
+
+    def test_booking_phantom_train_bounces(self, server):
+        server.state.phantom = {"305"}
+        opener = _opener()
+        _login(opener, server)
+        _, body = _get(opener, f"{server.url}{BOOKING_PATH}?trnNo=305&dptDt=20260101")
+        assert "잔여석 없음" in body
+        assert "isFalseGotoMain" not in body
+
+
+class TestTimetable:
+    def test_timetable_is_sorted_and_deterministic(self):
+        trains = build_timetable("수서", "부산")
+        assert trains == build_timetable("수서", "부산")
+        times = [t[1] for t in trains]
+        assert times == sorted(times)
+        assert trains[0] == ("301", "05:30", "08:05")
+
+
+class TestStats:
+    def test_percentile_interpolates(self):
+        assert percentile([1, 2, 3, 4, 5], 50) == 3
+        assert percentile([0, 10], 95) == pytest.approx(9.5)
+
+    def test_percentile_empty(self):
+        assert percentile([], 50) == 0.0
+
+    def test_summarize(self):
+        s = summarize([0.1, 0.2, 0.3])
+        assert s["n"] == 3
+        assert s["p50"] == pytest.approx(0.2)
+        assert s["max"] == pytest.approx(0.3)
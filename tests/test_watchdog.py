@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""브라우저 메모리 감시 (MemoryWatchdog) 와 계획된 브라우저 교체 (SRT.recycle_browser) 테스트"""
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from srt_reservation.daemon import Job, JobDaemon
+from srt_reservation.main import SRT
+from srt_reservation.metrics import Metrics
+from srt_reservation.watchdog import MemoryWatchdog
+
+COOKIES = [{"name": "JSESSIONID", "value": "abc", "domain": "etk.srail.kr", "path": "/"}]
+
+
+def _driver_with_pid(pid):
+    driver = MagicMock()
+    driver.service.process.pid = pid
+    driver.browser_pid = None
+    return driver
+
+
+class TestMemoryWatchdog:
+    @pytest.mark.skipif(not os.path.isdir("/proc"), reason="/proc 필요")
+    def test_samples_process_tree_from_proc(self):
+        watchdog = MemoryWatchdog(limit_mb=1)
+        rss = watchdog.sample(_driver_with_pid(os.getpid()))
+        assert rss is not None and rss > 1
+        assert watchdog.over_limit(_driver_with_pid(os.getpid())) is True
+
+    def test_threshold(self):
+        watchdog = MemoryWatchdog(limit_mb=1500)
+        with patch("srt_reservation.watchdog.process_tree_rss_mb", side_effect=[1499.0, 1500.0, None]):
+            assert watchdog.over_limit(MagicMock()) is False
+            assert watchdog.over_limit(MagicMock()) is True
+            assert watchdog.over_limit(MagicMock()) is False
+        assert watchdog.last_rss_mb is None
+
+    def test_disabled_skips_proc_scan(self):
+        watchdog = MemoryWatchdog(limit_mb=0)
+        with patch("srt_reservation.watchdog.process_tree_rss_mb") as rss:
+            assert watchdog.over_limit(MagicMock()) is False
+        rss.assert_not_called()
+
+    def test_metrics(self):
+        registry = Metrics()
+        registry.enabled = True
+        watchdog = MemoryWatchdog(limit_mb=0)
+        with patch("srt_reservation.watchdog.METRICS", registry), \
+             patch("srt_reservation.watchdog.process_tree_rss_mb", return_value=812.34):
+            assert watchdog.over_limit(MagicMock()) is False  # 한도 없이 RSS 만 기록
+            watchdog.record_recycle()
+        text = registry.render()
+        assert "srt_browser_rss_mb 812.3" in text
+        assert "srt_browser_recycles_total 1" in text
+
+
+class TestRecycleBrowser:
+    def _srt(self):
+        srt = SRT("수서", "부산", "20260315", "08", browser_memory_limit_mb=1500)
+        srt.driver = MagicMock()
+        srt.driver.get_cookies.return_value = COOKIES
+        srt.session_cache = MagicMock()
+        srt.new_driver = MagicMock()
+
+        def run_driver():
+            srt.driver = srt.new_driver
+        srt.run_driver = MagicMock(side_effect=run_driver)
+        srt.sign_in = MagicMock()
+        return srt
+
+    def test_moves_cookies_without_login(self):
+        srt = self._srt()
+        old = srt.driver
+        srt.planner.invalidate = MagicMock()
+        with patch.object(srt, "_resume_session", return_value=True) as resume:
+            srt.recycle_browser()
+
+        old.quit.assert_called_once()
+        resume.assert_called_once_with(COOKIES)
+        srt.session_cache.save.assert_called_once_with(COOKIES)
+        srt.sign_in.assert_not_called()
+        srt.planner.invalidate.assert_called_once()
+        assert srt.driver is srt.new_driver
+        assert srt.memory_watchdog.recycles == 1
+
+    def test_rejected_cookies_fall_back_to_login(self):
+        srt = self._srt()
+        srt.driver.get_cookies.side_effect = WebDriverException("gone")
+        with patch.object(srt, "_resume_session") as resume:
+            srt.recycle_browser()
+        resume.assert_not_called()
+        srt.sign_in.assert_called_once_with()
+
+    def test_launch_failure_uses_crash_recovery(self):
+        srt = self._srt()
+        srt.run_driver.side_effect = WebDriverException("chrome not reachable")
+        with patch("srt_reservation.main.BrowserRecovery.recover") as recover:
+            srt.recycle_browser()
+        assert recover.call_args.kwargs["srt_instance"] is srt
+
+    def test_check_result_recycles_between_rotations(self):
+        srt = SRT("수서", "부산", "20260315", "08", browser_memory_limit_mb=1500)
+        srt.driver = MagicMock()
+        with patch.object(srt, "check_rotation", return_value=(None, 0.1, 0)), \
+             patch("srt_reservation.watchdog.process_tree_rss_mb", return_value=1600.0), \
+             patch.object(srt, "recycle_browser") as recycle, \
+             patch("srt_reservation.main.randint", return_value=1), \
+             patch("srt_reservation.main.time.sleep", side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                srt.check_result()
+        recycle.assert_called_once_with()
+
+    def test_daemon_reshares_recycled_browser(self):
+        a = SRT("수서", "부산", "20260315", "08", browser_memory_limit_mb=1500)
+        b = SRT("수서", "동대구", "20260315", "10")
+        daemon = JobDaemon([Job("a", a), Job("b", b)])
+        new_driver = MagicMock()
+        rotations = iter([(0, 0.1, 0)])
+
+        def recycle():
+            a.driver = new_driver
+            return True
+
+        def run_rotation():
+            try:
+                return next(rotations)
+            except StopIteration:
+                a.is_booked = b.is_booked = True
+                return 0, 0.0, 0
+
+        with patch.object(daemon, "start"), \
+             patch.object(daemon, "run_rotation", side_effect=run_rotation), \
+             patch.object(a, "maybe_recycle_browser", side_effect=recycle), \
+             patch("srt_reservation.daemon.time.sleep"):
+            daemon.run("id", "pw")
+
+        assert b.driver is new_driver